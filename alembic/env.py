@@ -13,6 +13,9 @@ import app.models.director
 import app.models.genre
 import app.models.movie
 import app.models.rating
+import app.models.rating_daily
+import app.models.reference_version
+import app.models.rating_summary
 import app.models.movie_genres
 
 config = context.config
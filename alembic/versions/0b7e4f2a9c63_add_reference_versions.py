@@ -0,0 +1,62 @@
+"""add reference versions
+
+Revision ID: 0b7e4f2a9c63
+Revises: f3a8d5c1e920
+Create Date: 2026-10-18 21:47:05.612843
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7e4f2a9c63'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d5c1e920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFERENCE_TABLES = ("genres", "directors")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reference_versions',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(
+        "INSERT INTO reference_versions (name) VALUES "
+        + ", ".join(f"('{table}')" for table in REFERENCE_TABLES)
+    )
+
+    # any write to a reference table, from the app or a loader script, invalidates
+    # the in-process caches of every worker (see app/cache/reference.py)
+    op.execute(
+        """
+        CREATE FUNCTION bump_reference_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE reference_versions SET version = version + 1 WHERE name = TG_TABLE_NAME;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in REFERENCE_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_reference_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_version()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in REFERENCE_TABLES:
+        op.execute(f"DROP TRIGGER {table}_reference_version ON {table}")
+    op.execute("DROP FUNCTION bump_reference_version()")
+    op.drop_table('reference_versions')
@@ -0,0 +1,52 @@
+"""add movie rating summaries
+
+Revision ID: 3c9a1f2e7b44
+Revises: 816285f0d2f5
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f2e7b44'
+down_revision: Union[str, Sequence[str], None] = '816285f0d2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORES = range(1, 11)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('movie_rating_summaries',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('ratings_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('ratings_sum', sa.BigInteger(), server_default='0', nullable=False),
+    *[sa.Column(f'score_{score}', sa.Integer(), server_default='0', nullable=False) for score in SCORES],
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('movie_id')
+    )
+
+    # backfill from the existing ratings
+    histogram_columns = ", ".join(f"score_{score}" for score in SCORES)
+    histogram_values = ", ".join(
+        f"count(r.id) FILTER (WHERE r.score = {score})" for score in SCORES
+    )
+    op.execute(
+        f"""
+        INSERT INTO movie_rating_summaries (movie_id, ratings_count, ratings_sum, {histogram_columns})
+        SELECT m.id, count(r.id), coalesce(sum(r.score), 0), {histogram_values}
+        FROM movies m
+        LEFT JOIN movie_ratings r ON r.movie_id = m.id
+        GROUP BY m.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('movie_rating_summaries')
@@ -0,0 +1,29 @@
+"""add movie version
+
+Revision ID: 5d1c7a3e8b06
+Revises: 0b7e4f2a9c63
+Create Date: 2026-10-18 22:31:17.402958
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1c7a3e8b06'
+down_revision: Union[str, Sequence[str], None] = '0b7e4f2a9c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # a constant default: no table rewrite, existing rows read as version 1
+    op.add_column('movies', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('movies', 'version')
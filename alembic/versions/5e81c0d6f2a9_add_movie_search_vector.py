@@ -0,0 +1,96 @@
+"""add movie search vector
+
+Revision ID: 5e81c0d6f2a9
+Revises: a7d4e2b9c031
+Create Date: 2026-10-18 11:47:05.112630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e81c0d6f2a9'
+down_revision: Union[str, Sequence[str], None] = 'a7d4e2b9c031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movies', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # title weighs most, then people, then the free-text description
+    op.execute(
+        """
+        CREATE FUNCTION movie_search_vector(
+            title TEXT, movie_cast TEXT, description TEXT, director_id INTEGER
+        ) RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(
+                       (SELECT d.name FROM directors d WHERE d.id = director_id), '')), 'B')
+                || setweight(to_tsvector('english', coalesce(movie_cast, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        $$ LANGUAGE sql STABLE
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION movies_search_vector_trigger() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := movie_search_vector(
+                NEW.title, NEW."cast", NEW.description, NEW.director_id
+            );
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER movies_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, "cast", description, director_id ON movies
+        FOR EACH ROW EXECUTE FUNCTION movies_search_vector_trigger()
+        """
+    )
+    # renaming a director has to refresh the vectors of their movies
+    op.execute(
+        """
+        CREATE FUNCTION directors_search_vector_trigger() RETURNS trigger AS $$
+        BEGIN
+            UPDATE movies
+            SET search_vector = movie_search_vector(title, "cast", description, director_id)
+            WHERE director_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER directors_search_vector_update
+        AFTER UPDATE OF name ON directors
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION directors_search_vector_trigger()
+        """
+    )
+
+    op.execute(
+        'UPDATE movies SET search_vector = movie_search_vector(title, "cast", description, director_id)'
+    )
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_search_vector', table_name='movies')
+    op.execute("DROP TRIGGER directors_search_vector_update ON directors")
+    op.execute("DROP FUNCTION directors_search_vector_trigger()")
+    op.execute("DROP TRIGGER movies_search_vector_update ON movies")
+    op.execute("DROP FUNCTION movies_search_vector_trigger()")
+    op.execute("DROP FUNCTION movie_search_vector(TEXT, TEXT, TEXT, INTEGER)")
+    op.drop_column('movies', 'search_vector')
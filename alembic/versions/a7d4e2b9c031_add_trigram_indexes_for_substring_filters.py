@@ -0,0 +1,37 @@
+"""add trigram indexes for substring filters
+
+Revision ID: a7d4e2b9c031
+Revises: 3c9a1f2e7b44
+Create Date: 2026-10-18 11:02:17.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2b9c031'
+down_revision: Union[str, Sequence[str], None] = '3c9a1f2e7b44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gin_trgm_ops lets Postgres answer ILIKE '%x%' from the index
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_movies_title_trgm', 'movies', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_directors_name_trgm', 'directors', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_genres_name_trgm', 'genres', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_genres_name_trgm', table_name='genres')
+    op.drop_index('ix_directors_name_trgm', table_name='directors')
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
@@ -0,0 +1,35 @@
+"""add foreign key and filter indexes
+
+Revision ID: b2f6d8a41e57
+Revises: 5e81c0d6f2a9
+Create Date: 2026-10-18 12:25:39.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f6d8a41e57'
+down_revision: Union[str, Sequence[str], None] = '5e81c0d6f2a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (movie_id, score) also serves plain movie_id lookups, so no separate movie_id index
+    op.create_index('ix_movie_ratings_movie_id_score', 'movie_ratings', ['movie_id', 'score'], unique=False)
+    op.create_index(op.f('ix_movies_director_id'), 'movies', ['director_id'], unique=False)
+    op.create_index(op.f('ix_movies_release_year'), 'movies', ['release_year'], unique=False)
+    op.create_index('ix_movie_genres_genre_id', 'movie_genres', ['genre_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_genres_genre_id', table_name='movie_genres')
+    op.drop_index(op.f('ix_movies_release_year'), table_name='movies')
+    op.drop_index(op.f('ix_movies_director_id'), table_name='movies')
+    op.drop_index('ix_movie_ratings_movie_id_score', table_name='movie_ratings')
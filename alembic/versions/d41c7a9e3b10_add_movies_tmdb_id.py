@@ -0,0 +1,31 @@
+"""add movies tmdb_id
+
+Revision ID: d41c7a9e3b10
+Revises: b2f6d8a41e57
+Create Date: 2026-10-18 15:02:11.271904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c7a9e3b10'
+down_revision: Union[str, Sequence[str], None] = 'b2f6d8a41e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # natural key for the TMDB loader's upserts; NULL for movies created through the API
+    op.add_column('movies', sa.Column('tmdb_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_movies_tmdb_id'), 'movies', ['tmdb_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_movies_tmdb_id'), table_name='movies')
+    op.drop_column('movies', 'tmdb_id')
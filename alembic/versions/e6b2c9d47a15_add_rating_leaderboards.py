@@ -0,0 +1,62 @@
+"""add rating leaderboards
+
+Revision ID: e6b2c9d47a15
+Revises: d41c7a9e3b10
+Create Date: 2026-10-18 20:14:37.519026
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2c9d47a15'
+down_revision: Union[str, Sequence[str], None] = 'd41c7a9e3b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PRIOR_MEAN = 6.5 and PRIOR_WEIGHT = 20, see app/models/rating_summary.py
+BAYESIAN_SCORE_SQL = "(ratings_sum + 130.0) / (ratings_count + 20.0)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movie_rating_summaries', sa.Column(
+        'bayesian_score', sa.Float(), sa.Computed(BAYESIAN_SCORE_SQL, persisted=True), nullable=True
+    ))
+    op.create_index('ix_movie_rating_summaries_bayesian_score', 'movie_rating_summaries',
+                    ['bayesian_score', 'movie_id'], unique=False)
+    op.create_index('ix_movie_rating_summaries_ratings_count', 'movie_rating_summaries',
+                    ['ratings_count', 'movie_id'], unique=False)
+
+    op.create_table('movie_rating_daily',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('ratings_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('ratings_sum', sa.BigInteger(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('movie_id', 'day')
+    )
+    op.create_index('ix_movie_rating_daily_day', 'movie_rating_daily', ['day'], unique=False)
+
+    # backfill from the existing ratings; rows without rated_at belong to no window
+    op.execute(
+        """
+        INSERT INTO movie_rating_daily (movie_id, day, ratings_count, ratings_sum)
+        SELECT movie_id, rated_at::date, count(*), sum(score)
+        FROM movie_ratings
+        WHERE rated_at IS NOT NULL
+        GROUP BY movie_id, rated_at::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_rating_daily_day', table_name='movie_rating_daily')
+    op.drop_table('movie_rating_daily')
+    op.drop_index('ix_movie_rating_summaries_ratings_count', table_name='movie_rating_summaries')
+    op.drop_index('ix_movie_rating_summaries_bayesian_score', table_name='movie_rating_summaries')
+    op.drop_column('movie_rating_summaries', 'bayesian_score')
@@ -0,0 +1,41 @@
+"""add list sort indexes
+
+Revision ID: f3a8d5c1e920
+Revises: e6b2c9d47a15
+Create Date: 2026-10-18 21:03:52.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d5c1e920'
+down_revision: Union[str, Sequence[str], None] = 'e6b2c9d47a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AVERAGE_RATING_SQL = "CASE WHEN ratings_count > 0 THEN CAST(ratings_sum AS FLOAT) / ratings_count ELSE 0 END"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # stored so that sorting by rating is an index scan instead of a computed sort
+    op.add_column('movie_rating_summaries', sa.Column(
+        'average_rating', sa.Float(), sa.Computed(AVERAGE_RATING_SQL, persisted=True), nullable=True
+    ))
+    op.create_index('ix_movie_rating_summaries_average_rating', 'movie_rating_summaries',
+                    ['average_rating', 'movie_id'], unique=False)
+    op.create_index('ix_movies_title_id', 'movies', ['title', 'id'], unique=False)
+    op.create_index('ix_movies_release_year_sort', 'movies',
+                    [sa.text('coalesce(release_year, 0)'), 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_release_year_sort', table_name='movies')
+    op.drop_index('ix_movies_title_id', table_name='movies')
+    op.drop_index('ix_movie_rating_summaries_average_rating', table_name='movie_rating_summaries')
+    op.drop_column('movie_rating_summaries', 'average_rating')
@@ -0,0 +1,36 @@
+from fastapi import APIRouter
+
+from app.api.middleware import InstrumentedRoute
+from app.api.controller.movie_controller import movie_service
+from app.api.schemas.movie import Response
+from app.cache import cache_stats
+from app.cache.reference import reference_data
+from app.db.pool import pool_status
+from app.db.session import async_engine, engine
+
+router = APIRouter(prefix="/api/v1/debug", tags=["Debug"], route_class=InstrumentedRoute)
+
+
+@router.get("/pool", response_model=Response[dict])
+async def get_pool_status():
+    # "api" serves requests; "sync" is only used by scripts running in this process
+    return Response(
+        status="success",
+        data={
+            "api": pool_status(async_engine),
+            "sync": pool_status(engine),
+        }
+    )
+
+
+@router.get("/cache", response_model=Response[dict])
+async def get_cache_stats():
+    service = movie_service.service
+    return Response(
+        status="success",
+        data={
+            "movie_detail": cache_stats(service.detail_cache),
+            "movie_counts": cache_stats(service.count_cache),
+            "reference": reference_data.stats(),
+        }
+    )
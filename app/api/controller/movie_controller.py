@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import Response as HTTPResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal
 
 from datetime import datetime
-from app.db.session import get_db
-from app.services.movie_service import MovieService
+from app.api.http_cache import cache_headers, etag_matches, not_modified
+from app.api.middleware import InstrumentedRoute
+from app.api.serialization import FAST_SERIALIZATION, pick, success
+from app.db.session import get_async_db
+from app.services.async_movie_service import AsyncMovieService
+from app.services.export import MEDIA_TYPES
 from app.api.schemas.movie import (
     Moviein,
     Movieupdate,
     MovieListItem,
     MovieDetail,
+    MovieSearchItem,
+    Leaderboard,
+    LeaderboardItem,
+    MovieBatchCreateIn,
+    MovieBatchUpdateIn,
+    MovieBatchOut,
     Response,
     DirectorOut,
     MovieOut
@@ -22,16 +33,18 @@ from app.exceptions.movie_exceptions import MovieNotFoundError
 from app.logging_config import setup_logging
 logger = setup_logging()
 
-router = APIRouter(prefix="/api/v1/movies", tags=["Movies"])
-movie_service = MovieService()
+router = APIRouter(prefix="/api/v1/movies", tags=["Movies"], route_class=InstrumentedRoute)
+movie_service = AsyncMovieService()
+
+DETAIL_FIELDS = tuple(MovieDetail.model_fields)
 
 
 @router.post("/", response_model=Response[MovieOut[DirectorOut]], status_code=status.HTTP_201_CREATED)
-def create_movie(
+async def create_movie(
     payload: Moviein,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    movie = movie_service.create_movie(
+    movie = await movie_service.create_movie(
         db=db,
         title=payload.title,
         release_year=payload.release_year,
@@ -58,13 +71,45 @@ def create_movie(
         )
     )
 
+@router.post(":batch", response_model=Response[MovieBatchOut], status_code=status.HTTP_200_OK)
+async def create_movies_batch(
+    payload: MovieBatchCreateIn,
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.info("Movie batch create received (items=%d)", len(payload.items))
+
+    result = await movie_service.create_movies_batch(
+        db=db,
+        items=[item.model_dump() for item in payload.items]
+    )
+
+    logger.info("Movie batch created (created=%d, failed=%d)",
+                result["succeeded"], result["received"] - result["succeeded"])
+    return Response(status="success", data=MovieBatchOut(**result))
+
+@router.patch(":batch", response_model=Response[MovieBatchOut], status_code=status.HTTP_200_OK)
+async def update_movies_batch(
+    payload: MovieBatchUpdateIn,
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.info("Movie batch update received (items=%d)", len(payload.items))
+
+    result = await movie_service.update_movies_batch(
+        db=db,
+        items=[item.model_dump() for item in payload.items]
+    )
+
+    logger.info("Movie batch updated (updated=%d, failed=%d)",
+                result["succeeded"], result["received"] - result["succeeded"])
+    return Response(status="success", data=MovieBatchOut(**result))
+
 @router.put("/{movie_id}", response_model=Response[MovieOut[DirectorOut]], status_code=status.HTTP_200_OK)
-def update_movie(
+async def update_movie(
     movie_id: int,
     payload: Movieupdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    movie = movie_service.update_movie(
+    movie = await movie_service.update_movie(
         db=db,
         movie_id=movie_id,
         title=payload.title,
@@ -73,7 +118,8 @@ def update_movie(
         cast=payload.cast,
         genre_ids=payload.genres
     )
-    movie_result = movie_service.get_movie_detail(db=db,movie_id=movie.id)
+    # update_movie wrote the fresh detail to the cache, so this does not query
+    movie_result = await movie_service.get_movie_detail(db=db,movie_id=movie.id)
     
     return Response(
         status = "success",
@@ -95,38 +141,69 @@ def update_movie(
 
 
 @router.delete("/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_movie(
+async def delete_movie(
     movie_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    movie_service.delete_movie(db, movie_id)
+    await movie_service.delete_movie(db, movie_id)
     return None
 
 @router.get("/", response_model=Response[MovieListItem[list[MovieDetail]]], status_code=status.HTTP_200_OK)
-def list_movies(
+async def list_movies(
+    response: HTTPResponse,
     title: str | None = Query(None, description="Filter by movie title"),
     director: str | None = Query(None, description="Filter by director name"),
     genre: str | None = Query(None, description="Filter by genre"),
     release_year: int | None = Query(None, description="Filter by movie release year"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: str | None = Query(None, description="next_cursor from a previous page; overrides page"),
+    estimate_total: bool = Query(False, description="Allow a fast planner estimate for total_items"),
+    sort: Literal["id", "average_rating", "ratings_count", "release_year", "title"] = Query(
+        "id", description="Sort key; ties are broken by movie id"
+    ),
+    order: Literal["asc", "desc"] = Query("asc"),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     route = "/api/v1/movies"
-    logger.info(f"Listing movies: route={route}, title={title}, director={director}, genre={genre}, year={release_year}, page={page}, page_size={page_size}")
-
+    logger.info("Listing movies: route=%s, title=%s, director=%s, genre=%s, year=%s, page=%s, page_size=%s, "
+                "cursor=%s, sort=%s %s", route, title, director, genre, release_year, page, page_size, cursor, sort, order)
 
-    result = movie_service.get_movies(
-        db=db,
+    params = dict(
         title=title,
         director=director,
         genre=genre,
         release_year=release_year,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor,
+        estimate_total=estimate_total,
+        sort=sort,
+        order=order
     )
+    if if_none_match:
+        # revalidation reads ids and versions only; the full page is built when it changed
+        etag = await movie_service.get_movies_etag(db=db, **params)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    result = await movie_service.get_movies(db=db, **params)
     
-    logger.info(f"Movies listed successfully (count={len(result['data'])})")
+    logger.info("Movies listed successfully (count=%d)", len(result['data']))
+
+    if FAST_SERIALIZATION:
+        # the service's dicts already have exactly MovieDetail's fields
+        return success({
+            "page": result["page"],
+            "page_size": result["page_size"],
+            "total_items": result["total_items"],
+            "total_is_estimate": result["total_is_estimate"],
+            "items": result["data"],
+            "next_cursor": result["next_cursor"]
+        }, headers=cache_headers(result["etag"]))
+
+    response.headers.update(cache_headers(result["etag"]))
 
     result_items = [
         MovieDetail(
@@ -148,19 +225,136 @@ def list_movies(
             page= result["page"],
             page_size= result["page_size"],
             total_items= result["total_items"],
-            items= result_items
+            total_is_estimate= result["total_is_estimate"],
+            items= result_items,
+            next_cursor= result["next_cursor"]
+        )
+    )
+
+@router.get("/search", response_model=Response[MovieListItem[list[MovieSearchItem]]], status_code=status.HTTP_200_OK)
+async def search_movies(
+    q: str = Query(..., min_length=1, description="Words to find in title, cast, description or director"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from a previous page; overrides page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.info("Searching movies: q=%s, page=%s, page_size=%s, cursor=%s", q, page, page_size, cursor)
+
+    result = await movie_service.search_movies(
+        db=db,
+        q=q,
+        page=page,
+        page_size=page_size,
+        cursor=cursor
+    )
+
+    if FAST_SERIALIZATION:
+        return success({
+            "page": result["page"],
+            "page_size": result["page_size"],
+            "total_items": result["total_items"],
+            "total_is_estimate": result["total_is_estimate"],
+            "items": result["data"],
+            "next_cursor": result["next_cursor"]
+        })
+
+    return Response(
+        status="success",
+        data=MovieListItem(
+            page= result["page"],
+            page_size= result["page_size"],
+            total_items= result["total_items"],
+            items= [MovieSearchItem(**m) for m in result["data"]],
+            next_cursor= result["next_cursor"]
+        )
+    )
+
+@router.get("/top", response_model=Response[Leaderboard], status_code=status.HTTP_200_OK)
+async def top_movies(
+    genre: str | None = Query(None, description="Filter by genre"),
+    year: int | None = Query(None, description="Filter by movie release year"),
+    window: Literal["all", "day", "week", "month", "year"] = Query(
+        "all", description="Only count ratings made in the last day / week / month / year"
+    ),
+    by: Literal["rating", "ratings_count"] = Query(
+        "rating", description="Rank by Bayesian average rating or by number of ratings"
+    ),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    items = await movie_service.get_top_movies(
+        db=db,
+        genre=genre,
+        release_year=year,
+        window=window,
+        by=by,
+        limit=limit
+    )
+
+    if FAST_SERIALIZATION:
+        return success({"window": window, "by": by, "items": items})
+
+    return Response(
+        status="success",
+        data=Leaderboard(
+            window=window,
+            by=by,
+            items=[LeaderboardItem(**m) for m in items]
         )
     )
 
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_movies(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    title: str | None = Query(None, description="Filter by movie title"),
+    director: str | None = Query(None, description="Filter by director name"),
+    genre: str | None = Query(None, description="Filter by genre"),
+    release_year: int | None = Query(None, description="Filter by movie release year"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.info("Exporting movies: format=%s, title=%s, director=%s, genre=%s, year=%s",
+                format, title, director, genre, release_year)
+
+    chunks = movie_service.export_movies(
+        db=db,
+        format=format,
+        title=title,
+        director=director,
+        genre=genre,
+        release_year=release_year
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="movies.{format}"'}
+    )
+
 @router.get("/{movie_id}", response_model=Response[MovieDetail], status_code=status.HTTP_200_OK)
-def get_movie_detail(
+async def get_movie_detail(
     movie_id: int,
-    db: Session = Depends(get_db)
+    response: HTTPResponse,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    data = movie_service.get_movie_detail(db, movie_id)
+    if if_none_match:
+        # a version lookup by primary key instead of the aggregate query
+        etag = await movie_service.get_movie_etag(db, movie_id)
+        if etag is None:
+            raise MovieNotFoundError(movie_id)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    data = await movie_service.get_movie_detail(db, movie_id)
     if not data:
         raise MovieNotFoundError(movie_id)
 
+    if FAST_SERIALIZATION:
+        # the detail also carries its version and etag
+        return success(pick(data, DETAIL_FIELDS), headers=cache_headers(data["etag"]))
+
+    response.headers.update(cache_headers(data["etag"]))
+
     return Response(
         status = "success",
         data = MovieDetail(
@@ -176,21 +370,21 @@ def get_movie_detail(
     )
        
 @router.post("/{movie_id}/ratings", response_model=Response[RatingOut], status_code=status.HTTP_201_CREATED)
-def add_rating(
+async def add_rating(
     movie_id: int,
     payload: RatingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     route = f"/api/v1/movies/{movie_id}/ratings"
-    logger.info(f"Rating movie (movie_id={movie_id}, rating={payload.score}, route={route})")
+    logger.info("Rating movie (movie_id=%s, rating=%s, route=%s)", movie_id, payload.score, route)
 
-    rating = movie_service.add_rating(
+    rating = await movie_service.add_rating(
         db=db,
         movie_id=movie_id,
         score=payload.score
     )
 
-    logger.info(f"Rating saved successfully (movie_id={movie_id}, rating={payload.score})")
+    logger.info("Rating saved successfully (movie_id=%s, rating=%s)", movie_id, payload.score)
 
     return Response(
         status = "success",
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.middleware import InstrumentedRoute
+from app.api.controller.movie_controller import movie_service
+from app.api.schemas.movie import Response
+from app.api.schemas.rating import RatingBatchIn, RatingBatchOut
+from app.db.session import get_async_db
+
+from app.logging_config import setup_logging
+logger = setup_logging()
+
+router = APIRouter(prefix="/api/v1", tags=["Ratings"], route_class=InstrumentedRoute)
+
+
+@router.post("/ratings:batch", response_model=Response[RatingBatchOut], status_code=status.HTTP_200_OK)
+async def add_ratings_batch(
+    payload: RatingBatchIn,
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.info("Rating batch received (items=%d)", len(payload.items))
+
+    result = await movie_service.add_ratings_batch(
+        db=db,
+        items=[item.model_dump() for item in payload.items]
+    )
+
+    logger.info("Rating batch stored (inserted=%d, errors=%d)", result['inserted'], len(result['errors']))
+
+    return Response(
+        status="success",
+        data=RatingBatchOut(**result)
+    )
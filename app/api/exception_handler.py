@@ -13,7 +13,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     loc = first_error.get("loc", [])
     msg = first_error.get("msg", "Invalid input")
 
-    logger.warning(f"Validation error at {loc}: {msg}")
+    logger.warning("Validation error at %s: %s", loc, msg)
     
     return JSONResponse(
         status_code=422,
@@ -29,7 +29,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 #for service errors
 async def app_exception_handler(request: Request, exc: AppException):
-    logger.error(f"Service error: {str(exc)}", exc_info=True)
+    logger.error("Service error: %s", exc, exc_info=True)
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -0,0 +1,30 @@
+"""Conditional GET: ETag / If-None-Match revalidation and Cache-Control.
+
+    HTTP_CACHE_MAX_AGE=0    seconds a client may reuse a movie response before
+                            revalidating it (default 0: revalidate every time,
+                            which costs a 304 when nothing changed)
+"""
+import os
+
+from fastapi.responses import Response as HTTPResponse
+
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+CACHE_CONTROL = f"public, max-age={HTTP_CACHE_MAX_AGE}, must-revalidate"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 prescribes for it) against our strong etag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> HTTPResponse:
+    return HTTPResponse(status_code=304, headers=cache_headers(etag))
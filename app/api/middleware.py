@@ -0,0 +1,127 @@
+"""Per-request timing: Server-Timing headers and Prometheus metrics per route.
+
+TimingMiddleware wraps every HTTP request in app.db.instrumentation.track_queries
+and records total latency, DB time and statement count. InstrumentedRoute
+marks when the endpoint returns, so the time until the response headers go
+out is reported as serialization (response model validation and JSON rendering).
+"""
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi.routing import APIRoute
+
+from app import metrics
+from app.db.instrumentation import QueryStats, track_queries
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestTiming:
+    started: float
+    stats: QueryStats
+    route: str = UNMATCHED_ROUTE
+    endpoint_done: float | None = None
+    headers_sent: float | None = None
+
+
+_current_request: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def _mark_endpoint_done() -> None:
+    timing = _current_request.get()
+    if timing is not None:
+        timing.endpoint_done = time.perf_counter()
+
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute that records its path template and when its endpoint returned."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if getattr(endpoint, "_timed", False):
+            # include_router copies routes, passing the already wrapped endpoint
+            timed_endpoint = endpoint
+        elif inspect.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def timed_endpoint(*args, **kw):
+                try:
+                    return await endpoint(*args, **kw)
+                finally:
+                    _mark_endpoint_done()
+        else:
+            @functools.wraps(endpoint)
+            def timed_endpoint(*args, **kw):
+                try:
+                    return endpoint(*args, **kw)
+                finally:
+                    _mark_endpoint_done()
+
+        timed_endpoint._timed = True
+        super().__init__(path, timed_endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        route = self.path_format
+
+        async def route_handler(request):
+            timing = _current_request.get()
+            if timing is not None:
+                timing.route = route
+            return await handler(request)
+
+        return route_handler
+
+
+def server_timing(timing: RequestTiming, now: float) -> str:
+    parts = [
+        f'db;dur={timing.stats.db_time * 1000:.2f};desc="{timing.stats.statements} statements"',
+    ]
+    if timing.endpoint_done is not None:
+        parts.append(f"serialize;dur={(now - timing.endpoint_done) * 1000:.2f}")
+    parts.append(f"total;dur={(now - timing.started) * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class TimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            timing = RequestTiming(started=time.perf_counter(), stats=stats)
+            token = _current_request.set(timing)
+            status_code = 500
+
+            async def timed_send(message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    timing.headers_sent = time.perf_counter()
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(timing, timing.headers_sent).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, timed_send)
+            finally:
+                _current_request.reset(token)
+                self.record(scope["method"], timing, status_code)
+
+    @staticmethod
+    def record(method: str, timing: RequestTiming, status_code: int) -> None:
+        finished = time.perf_counter()
+        labels = (method, timing.route)
+        metrics.requests_total.inc(*labels, str(status_code))
+        metrics.request_duration.observe(finished - timing.started, *labels)
+        metrics.request_db_duration.observe(timing.stats.db_time, *labels)
+        metrics.request_statements.observe(timing.stats.statements, *labels)
+        if timing.endpoint_done is not None and timing.headers_sent is not None:
+            metrics.request_serialization_duration.observe(timing.headers_sent - timing.endpoint_done, *labels)
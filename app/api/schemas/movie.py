@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import Generic, TypeVar, List, Optional, Literal
 from datetime import datetime
 
+from app.models.movie import MAX_RELEASE_YEAR, MIN_RELEASE_YEAR
+
 data_type = TypeVar("data_type")
 data_type2 = TypeVar("data_type2")
 data_type3 = TypeVar("data_type3")
@@ -13,7 +15,7 @@ class Response(BaseModel,  Generic[data_type]):
 class MovieOut(BaseModel, Generic[data_type2]):
     id: int
     title: str = Field(..., min_length=1)
-    release_year: int = Field(..., ge=1888, le=2026)
+    release_year: int = Field(..., ge=MIN_RELEASE_YEAR, le=MAX_RELEASE_YEAR)
     director: data_type2
     genres: List[int]
     cast: Optional[str] = None
@@ -24,14 +26,14 @@ class MovieOut(BaseModel, Generic[data_type2]):
 
 class Moviein(BaseModel):
     title: str = Field(..., min_length=1)
-    release_year: int = Field(..., ge=1888, le=2026)
+    release_year: int = Field(..., ge=MIN_RELEASE_YEAR, le=MAX_RELEASE_YEAR)
     director_id: int
     genres: List[int]
     cast: Optional[str] = None
 
 class Movieupdate(BaseModel):
     title: Optional[str] = None
-    release_year: Optional[int] = Field(None, ge=1888, le=2026)
+    release_year: Optional[int] = Field(None, ge=MIN_RELEASE_YEAR, le=MAX_RELEASE_YEAR)
     director_id: Optional[int] = None
     genres: Optional[List[int]] = None
     cast: Optional[str] = None
@@ -43,10 +45,12 @@ class DirectorOut(BaseModel):
 
 
 class MovieListItem(BaseModel, Generic[data_type3]):
-    page: int
+    page: int | None = None
     page_size: int
     total_items: int
+    total_is_estimate: bool = False
     items: data_type3
+    next_cursor: str | None = None
 
 
 class MovieDetail(BaseModel):
@@ -59,3 +63,61 @@ class MovieDetail(BaseModel):
     average_rating: float
     ratings_count: int
 
+
+class MovieSearchItem(MovieDetail):
+    rank: float
+
+
+class LeaderboardItem(MovieDetail):
+    rank: int
+    # Bayesian average over the window (also reported when ranking by ratings_count)
+    score: float
+
+
+class Leaderboard(BaseModel):
+    window: str
+    by: str
+    items: List[LeaderboardItem]
+
+
+# upper bound on items per POST / PATCH /api/v1/movies:batch request
+MAX_MOVIE_BATCH_SIZE = 1000
+
+
+class MovieBatchCreateItem(BaseModel):
+    # references and titles are checked per item so one bad movie does not reject the whole batch
+    title: str
+    release_year: int = Field(..., ge=MIN_RELEASE_YEAR, le=MAX_RELEASE_YEAR)
+    director_id: int
+    genres: List[int]
+    cast: Optional[str] = None
+
+
+class MovieBatchUpdateItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    release_year: Optional[int] = Field(None, ge=MIN_RELEASE_YEAR, le=MAX_RELEASE_YEAR)
+    director_id: Optional[int] = None
+    genres: Optional[List[int]] = None
+    cast: Optional[str] = None
+
+
+class MovieBatchCreateIn(BaseModel):
+    items: List[MovieBatchCreateItem] = Field(..., min_length=1, max_length=MAX_MOVIE_BATCH_SIZE)
+
+
+class MovieBatchUpdateIn(BaseModel):
+    items: List[MovieBatchUpdateItem] = Field(..., min_length=1, max_length=MAX_MOVIE_BATCH_SIZE)
+
+
+class MovieBatchResult(BaseModel):
+    index: int
+    id: int | None
+    status: Literal["created", "updated", "failed"]
+    message: str | None = None
+
+
+class MovieBatchOut(BaseModel):
+    received: int
+    succeeded: int
+    results: List[MovieBatchResult]
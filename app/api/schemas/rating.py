@@ -1,5 +1,10 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
+# upper bound on items per POST /api/v1/ratings:batch request
+MAX_BATCH_SIZE = 10000
+
 
 class RatingCreate(BaseModel):
     score: int = Field(..., ge=1, le=10)
@@ -9,4 +14,26 @@ class RatingOut(BaseModel):
     rating_id: int
     movie_id: int
     score: int
-    
+
+
+class RatingBatchItem(BaseModel):
+    movie_id: int
+    # range is checked per item so one bad score does not reject the whole batch
+    score: int
+    rated_at: datetime | None = None
+
+
+class RatingBatchIn(BaseModel):
+    items: list[RatingBatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class RatingBatchError(BaseModel):
+    index: int
+    movie_id: int
+    message: str
+
+
+class RatingBatchOut(BaseModel):
+    received: int
+    inserted: int
+    errors: list[RatingBatchError]
@@ -0,0 +1,45 @@
+"""Response bodies that are built once and encoded once.
+
+By default FastAPI takes what an endpoint returns, dumps it, validates it
+again against the route's response_model, runs jsonable_encoder over the
+result and only then encodes it with json.dumps. The service layer already
+builds plain dicts with exactly the schema's fields (straight from the row
+tuples), so the read endpoints can wrap those in the Response envelope and
+encode them in one step, with orjson when it is installed.
+
+    RESPONSE_SERIALIZATION=fast|model   fast (default) or the validated
+                                        Pydantic path, e.g. to check a schema change
+
+The response_model of each route still documents the body in OpenAPI.
+"""
+import json
+import os
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FAST_SERIALIZATION = os.getenv("RESPONSE_SERIALIZATION", "fast").lower() == "fast"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson, or compact stdlib json without it."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def success(data: Any, status_code: int = 200, headers: dict[str, str] | None = None) -> FastJSONResponse:
+    """The {"status": "success", "data": ...} envelope of schemas.movie.Response, unvalidated."""
+    return FastJSONResponse({"status": "success", "data": data}, status_code=status_code, headers=headers)
+
+
+def pick(item: dict, fields: tuple[str, ...]) -> dict:
+    """`item` restricted to a schema's fields, in the schema's order."""
+    return {field: item[field] for field in fields}
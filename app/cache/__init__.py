@@ -0,0 +1,32 @@
+import os
+
+from app.cache.memory import MemoryCache
+from app.cache.redis_cache import RedisCache
+
+__all__ = ["MemoryCache", "RedisCache", "build_cache", "cache_stats"]
+
+
+def build_cache(name: str, maxsize: int, ttl: float):
+    """Backend chosen by CACHE_BACKEND ("memory" or "redis", default memory).
+
+    The redis backend connects to REDIS_URL and namespaces keys with `name`.
+    """
+    backend = os.getenv("CACHE_BACKEND", "memory").lower()
+    if backend == "redis":
+        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return RedisCache(url, ttl=ttl, prefix=f"movierating:{name}:")
+    if backend != "memory":
+        raise ValueError(f"unknown CACHE_BACKEND {backend!r}")
+    return MemoryCache(maxsize=maxsize, ttl=ttl)
+
+
+def cache_stats(cache) -> dict:
+    lookups = cache.hits + cache.misses
+    return {
+        "backend": type(cache).__name__,
+        # the redis backend has no cheap key count
+        "size": len(cache) if isinstance(cache, MemoryCache) else None,
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "hit_ratio": round(cache.hits / lookups, 4) if lookups else 0.0,
+    }
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from threading import Lock
+from typing import Any
+
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+
+class RedisCache:
+    """Cache backend on a Redis-compatible server, shared by every worker process.
+
+    Values are stored as JSON, so only plain dicts/lists/numbers/strings round-trip.
+    `client` may be any object with the redis-py get/set/delete/scan_iter API
+    (e.g. fakeredis); otherwise one is created from `url`. Hit and miss counters
+    are per process.
+
+    The API calls the cache from service code running under AsyncSession.run_sync,
+    i.e. on the event loop thread. There each client call is handed to a worker
+    thread and awaited, so a Redis round trip does not stall other requests.
+    There is no size: counting the keys would take a full SCAN.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        ttl: float = 60.0,
+        prefix: str = "movierating:",
+        client: Any = None,
+        socket_timeout: float = 0.25
+    ):
+        if client is None:
+            try:
+                import redis
+            except ImportError as error:
+                raise RuntimeError("the redis cache backend needs the 'redis' package installed") from error
+            client = redis.Redis.from_url(url, socket_timeout=socket_timeout)
+
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raw = self._call(self.client.get, self.prefix + str(key))
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._call(self.client.set, self.prefix + str(key), json.dumps(value), px=max(int(ttl * 1000), 1))
+
+    def delete(self, key: str) -> None:
+        self._call(self.client.delete, self.prefix + str(key))
+
+    def clear(self) -> None:
+        self._call(self._clear)
+
+    def _clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    @staticmethod
+    def _call(method, *args, **kwargs):
+        if in_greenlet():
+            # under run_sync: run the blocking call in a thread and yield to the loop meanwhile
+            return await_only(asyncio.to_thread(method, *args, **kwargs))
+        return method(*args, **kwargs)
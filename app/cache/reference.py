@@ -0,0 +1,185 @@
+"""In-process cache of reference data: every genre, and recently used directors.
+
+Genres are a small table that rarely changes, so all of them are loaded at
+startup (warm) and looked up by id or lowercased name. Directors go through an
+LRU keyed by id. Both are invalidated by the reference_versions table, whose
+counters a Postgres trigger bumps on any write to genres / directors; it is
+read at most once every REFERENCE_VERSION_CHECK_SECONDS, so lookups in between
+never touch the database.
+
+Cached genres are handed to a session with Session.merge(load=False), which
+attaches them without a SELECT.
+
+No lock is ever held across a query. Under AsyncSession.run_sync each query
+yields to the event loop, and another request on the same thread blocking on
+that lock would hang the loop. Refreshes read first and swap the new state in
+under the lock; while one is in flight, other callers keep the state they have.
+"""
+import os
+import time
+from threading import Lock
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.cache.memory import MemoryCache
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.reference_version import ReferenceVersion
+
+REFERENCE_VERSION_CHECK_SECONDS = float(os.getenv("REFERENCE_VERSION_CHECK_SECONDS", "5"))
+DIRECTOR_CACHE_SIZE = int(os.getenv("DIRECTOR_CACHE_SIZE", "10000"))
+
+
+class ReferenceCache:
+
+    def __init__(self, check_interval: float = REFERENCE_VERSION_CHECK_SECONDS,
+                 director_cache_size: int = DIRECTOR_CACHE_SIZE):
+        self.check_interval = check_interval
+        # id -> (id, name, description); the lowercased-name index points into it
+        self.genres_by_id: dict[int, tuple[int, str, str | None]] = {}
+        self.genre_ids_by_name: dict[str, int] = {}
+        # director id -> name; versioned, so entries do not need to expire
+        self.directors = MemoryCache(maxsize=director_cache_size, ttl=float("inf"))
+        self.versions: dict[str, int] = {}
+        self.loaded = False
+        self._checked_at = float("-inf")
+        # guards the swap of new state only, never a query
+        self._lock = Lock()
+        # held (non-blocking) by the caller that is re-reading the versions
+        self._refreshing = Lock()
+
+    def warm(self, db: Session) -> None:
+        """Load every genre and record the current versions."""
+        versions = self._read_versions(db)
+        genres = self._read_genres(db)
+        with self._lock:
+            self._set_genres(genres)
+            self.directors.clear()
+            self.versions = versions
+            self._checked_at = time.monotonic()
+
+    # genres
+
+    def genres_by_ids(self, db: Session, genre_ids: list[int]) -> list[Genre] | None:
+        """Session-attached Genre objects for `genre_ids`; None when any id does not exist."""
+        self._ensure_current(db)
+        rows = [self.genres_by_id.get(genre_id) for genre_id in dict.fromkeys(genre_ids)]
+        if None in rows:
+            return None
+        return [self._attach(db, row) for row in rows]
+
+    def known_genre_ids(self, db: Session, genre_ids) -> set[int]:
+        self._ensure_current(db)
+        return {genre_id for genre_id in genre_ids if genre_id in self.genres_by_id}
+
+    def genre_ids_matching(self, db: Session, text: str) -> list[int]:
+        """Ids of genres whose name contains `text`, case-insensitively (the list filter's rule)."""
+        self._ensure_current(db)
+        needle = text.lower()
+        return [genre_id for name, genre_id in self.genre_ids_by_name.items() if needle in name]
+
+    # directors
+
+    def director_by_id(self, db: Session, director_id: int) -> Director | None:
+        """Session-attached Director with id and name loaded; None when it does not exist.
+
+        Its other columns are left unloaded and cost a SELECT on first access.
+        """
+        name = self._director_names(db, {director_id}).get(director_id)
+        if name is None:
+            return None
+        director = Director(id=director_id, name=name)
+        make_transient_to_detached(director)
+        return db.merge(director, load=False)
+
+    def known_director_ids(self, db: Session, director_ids) -> set[int]:
+        return set(self._director_names(db, director_ids))
+
+    def current_versions(self, db: Session) -> dict[str, int]:
+        """The genres / directors table versions, re-read when the check interval has passed."""
+        self._ensure_current(db)
+        return dict(self.versions)
+
+    def stats(self) -> dict:
+        return {
+            "genres": len(self.genres_by_id),
+            "directors": len(self.directors),
+            "director_hits": self.directors.hits,
+            "director_misses": self.directors.misses,
+            "versions": dict(self.versions),
+        }
+
+    def _director_names(self, db: Session, director_ids) -> dict[int, str]:
+        """Names of the existing `director_ids`; only LRU misses are queried, in one SELECT."""
+        self._ensure_current(db)
+        names, missing = {}, []
+        for director_id in director_ids:
+            name = self.directors.get(director_id)
+            if name is not None:
+                names[director_id] = name
+            else:
+                missing.append(director_id)
+        if missing:
+            for director_id, name in db.execute(
+                select(Director.id, Director.name).where(Director.id.in_(missing))
+            ):
+                self.directors.set(director_id, name)
+                names[director_id] = name
+        return names
+
+    def _ensure_current(self, db: Session) -> None:
+        if time.monotonic() - self._checked_at < self.check_interval and self.loaded:
+            return
+        if not self._refreshing.acquire(blocking=False):
+            if self.loaded:
+                # another caller is refreshing; the current state is at most one interval old
+                return
+            # nothing to serve yet: load it as well rather than wait
+            self._refresh(db)
+            return
+        try:
+            self._refresh(db)
+        finally:
+            self._refreshing.release()
+
+    def _refresh(self, db: Session) -> None:
+        versions = self._read_versions(db)
+        genres = None
+        if not self.loaded or versions.get("genres") != self.versions.get("genres"):
+            genres = self._read_genres(db)
+        with self._lock:
+            # the counters only grow; a slower refresh must not undo a newer one
+            if self.loaded and any(versions.get(name, 0) < version for name, version in self.versions.items()):
+                return
+            if genres is not None:
+                self._set_genres(genres)
+            if versions.get("directors") != self.versions.get("directors"):
+                self.directors.clear()
+            self.versions = versions
+            self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _read_genres(db: Session) -> list:
+        return db.execute(select(Genre.id, Genre.name, Genre.description)).all()
+
+    def _set_genres(self, rows) -> None:
+        self.genres_by_id = {row.id: tuple(row) for row in rows}
+        self.genre_ids_by_name = {row.name.lower(): row.id for row in rows}
+        self.loaded = True
+
+    @staticmethod
+    def _read_versions(db: Session) -> dict[str, int]:
+        return dict(db.execute(select(ReferenceVersion.name, ReferenceVersion.version)).all())
+
+    @staticmethod
+    def _attach(db: Session, row: tuple[int, str, str | None]) -> Genre:
+        genre_id, name, description = row
+        genre = Genre(id=genre_id, name=name, description=description)
+        # a clean "loaded from the database" state, so merge can skip the SELECT
+        make_transient_to_detached(genre)
+        return db.merge(genre, load=False)
+
+
+# shared by every service and repository in the process
+reference_data = ReferenceCache()
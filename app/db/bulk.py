@@ -0,0 +1,83 @@
+"""Postgres bulk-load helpers shared by the loader scripts and benchmark data generator."""
+import csv
+import io
+
+from sqlalchemy import text
+
+
+def copy_csv(conn, table: str, columns: list[str], data: str) -> None:
+    """COPY CSV text into `table` through the raw DBAPI connection (psycopg2 or psycopg 3)."""
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    statement = f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(statement, io.StringIO(data))
+        else:
+            with cursor.copy(statement) as copy:
+                copy.write(data)
+    finally:
+        cursor.close()
+
+
+def copy_rows(conn, table: str, columns: list[str], rows) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    copy_csv(conn, table, columns, buffer.getvalue())
+
+
+def pg_array(values: list[str]) -> str:
+    """Text form of a text[] value for COPY."""
+    return "{" + ",".join('"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"' for value in values) + "}"
+
+
+def drop_secondary_indexes(conn, tables: list[str]) -> list[str]:
+    """Drop non-unique indexes on `tables` and return their definitions for restore_ddl.
+
+    Unique and primary-key indexes stay, since ON CONFLICT and foreign keys need them.
+    """
+    rows = conn.execute(text(
+        """
+        SELECT i.relname AS name, pg_get_indexdef(i.oid) AS definition
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_class t ON t.oid = x.indrelid
+        WHERE t.relname = ANY(:tables) AND NOT x.indisunique AND NOT x.indisprimary
+        """
+    ), {"tables": tables}).all()
+    for name, _ in rows:
+        conn.execute(text(f'DROP INDEX "{name}"'))
+    return [definition for _, definition in rows]
+
+
+def restore_ddl(conn, definitions: list[str]) -> None:
+    """Re-run what drop_secondary_indexes / drop_foreign_keys returned."""
+    for definition in definitions:
+        conn.execute(text(definition))
+
+
+def drop_foreign_keys(conn, tables: list[str]) -> list[str]:
+    """Drop foreign keys declared on `tables`; returns ALTER TABLE statements that re-add them.
+
+    Re-adding a constraint validates all rows in one pass, which is far cheaper
+    than the per-row trigger check during a large COPY.
+    """
+    rows = conn.execute(text(
+        """
+        SELECT t.relname AS table_name, c.conname AS name, pg_get_constraintdef(c.oid) AS definition
+        FROM pg_constraint c
+        JOIN pg_class t ON t.oid = c.conrelid
+        WHERE c.contype = 'f' AND t.relname = ANY(:tables)
+        """
+    ), {"tables": tables}).all()
+    for table_name, name, _ in rows:
+        conn.execute(text(f'ALTER TABLE "{table_name}" DROP CONSTRAINT "{name}"'))
+    return [f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{name}" {definition}' for table_name, name, definition in rows]
+
+
+def sync_sequence(conn, table: str, column: str = "id") -> None:
+    """Move the serial sequence past rows that were inserted with explicit ids."""
+    conn.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+        f"(SELECT coalesce(max({column}), 0) + 1 FROM {table}), false)"
+    ))
@@ -0,0 +1,20 @@
+"""EXPLAIN as a SQL construct, so the explained statement keeps its bound parameters."""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>; Postgres only.
+
+    The statement is compiled by the same compiler as any other query, so
+    user input stays in bound parameters instead of the SQL text.
+    """
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
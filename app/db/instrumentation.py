@@ -0,0 +1,125 @@
+"""Count the SQL statements, rows and ORM objects a block of code causes.
+
+    with track_queries() as stats:
+        service.get_movies(db)
+    stats.statements, stats.rows, stats.orm_objects, stats.db_time
+
+    with track_queries(record_sql=True) as stats:   # also keep stats.sql
+
+Listeners are installed once on every Engine and every mapped class and only
+record into the QueryStats of the current context (a ContextVar), so
+concurrent requests on the async stack are counted separately. Statements
+slower than SLOW_QUERY_MS are logged with their SQL and parameters whether
+or not anything is being tracked.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.db.base import Base
+from app.logging_config import LOGGER_NAME
+
+# statements at least this slow are logged; 0 disables the slow-query log
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# longest parameter repr written to the slow-query log
+SLOW_QUERY_PARAMS_LIMIT = 1000
+
+slow_query_logger = logging.getLogger(f"{LOGGER_NAME}.sql")
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    # rows reported by the DBAPI cursor for SELECT / RETURNING statements
+    rows: int = 0
+    orm_objects: int = 0
+    db_time: float = 0.0
+    # statement text, only kept when asked for (track_queries(record_sql=True))
+    sql: list[str] | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "statements": self.statements,
+            "rows": self.rows,
+            "orm_objects": self.orm_objects,
+            "db_time_ms": round(self.db_time * 1000, 3),
+        }
+
+
+# savepoint bookkeeping is transaction control, not a query the code asked for
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    elapsed = time.perf_counter() - started.pop() if started else 0.0
+
+    if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+        params = repr(parameters)
+        if len(params) > SLOW_QUERY_PARAMS_LIMIT:
+            params = params[:SLOW_QUERY_PARAMS_LIMIT] + "..."
+        slow_query_logger.warning(
+            "slow query (%.1f ms): %s | params=%s", elapsed * 1000, " ".join(statement.split()), params
+        )
+
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.db_time += elapsed
+    if statement.startswith(_IGNORED_PREFIXES):
+        return
+    stats.statements += 1
+    if stats.sql is not None:
+        stats.sql.append(statement)
+    if cursor.description is not None and cursor.rowcount and cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def _handle_error(context):
+    # after_cursor_execute never runs for a failed statement
+    if context.connection is not None:
+        started = context.connection.info.get("query_started")
+        if started:
+            started.pop()
+
+
+def _on_load(target, context):
+    stats = _current.get()
+    if stats is not None:
+        stats.orm_objects += 1
+
+
+def install() -> None:
+    """Register the listeners; idempotent and cheap when nothing is being tracked."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    event.listen(Base, "load", _on_load, propagate=True)
+    _installed = True
+
+
+@contextmanager
+def track_queries(record_sql: bool = False):
+    install()
+    stats = QueryStats(sql=[] if record_sql else None)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
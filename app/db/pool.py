@@ -0,0 +1,148 @@
+"""Connection pool settings from the environment, and pools that record wait times.
+
+    DB_POOL_SIZE        persistent connections per engine (default 5; 0 disables pooling)
+    DB_MAX_OVERFLOW     extra connections allowed under burst load (default 10)
+    DB_POOL_TIMEOUT     seconds a request waits for a connection before failing (default 30)
+    DB_POOL_RECYCLE     seconds after which a connection is replaced, -1 to never (default 1800)
+    DB_POOL_PRE_PING    test connections on checkout so stale ones are replaced (default true)
+    DB_PGBOUNCER        set when connecting through PgBouncer in transaction mode
+"""
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+load_dotenv()
+
+TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+PGBOUNCER = _env_bool("DB_PGBOUNCER", False)
+
+
+class PoolStats:
+    """Checkout counters for one pool: how often and how long callers waited."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(self.wait_total * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class _MeteredPool:
+    """Times every checkout; `stats` survives pool.recreate() on engine.dispose()."""
+
+    stats: PoolStats
+
+    def __init__(self, *args, stats: PoolStats | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats or PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    pass
+
+
+class MeteredAsyncQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """Keyword arguments for create_engine / create_async_engine."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        # SQLite uses its own file/memory pools; the sizing knobs do not apply
+        return {}
+
+    options: dict = {"pool_pre_ping": POOL_PRE_PING}
+    if POOL_SIZE <= 0:
+        # let an external pooler (PgBouncer) own the connections
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=MeteredAsyncQueuePool if is_async else MeteredQueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+        )
+
+    if PGBOUNCER and parsed.get_driver_name() == "psycopg":
+        # transaction pooling hands each transaction to any server connection,
+        # so server-side prepared statements cannot be reused
+        options["connect_args"] = {"prepare_threshold": None}
+
+    return options
+
+
+def pool_status(engine) -> dict:
+    """Point-in-time view of an engine's pool for the debug endpoint."""
+    pool = getattr(engine, "sync_engine", engine).pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # negative while the pool has not opened all of its persistent connections
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
@@ -45,3 +45,8 @@ class InvalidRatingError(ValueError):
         self.score = score
 
 
+class InvalidCursorError(MovieError):
+    def __init__(self, cursor: str):
+        super().__init__("cursor is invalid or expired")
+        self.cursor = cursor
+
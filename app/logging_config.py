@@ -1,34 +1,117 @@
+"""Application logging.
+
+Request code logs through a QueueHandler, which only appends the record to an
+in-memory queue. A QueueListener thread formats the records and writes them to
+the rotating log file and the console, so request threads never block on disk
+I/O or rotation. Arguments are %-style and formatted on the listener thread,
+so pass values, not objects that may change after the call.
+
+    LOG_FORMAT=text|json          plain lines (default) or one JSON object per line
+    LOG_INFO_SAMPLE_RATE=0.1      keep 10% of INFO-and-below records; warnings always pass
+    LOG_QUEUE=false               write synchronously from the calling thread
+"""
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
 import os
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOGGER_NAME = "movie_rating"
+LOG_FILE = "logs/movie_rating.log"
 
-def setup_logging():
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_INFO_SAMPLE_RATE = float(os.getenv("LOG_INFO_SAMPLE_RATE", "1.0"))
+LOG_QUEUE = os.getenv("LOG_QUEUE", "true").lower() in ("1", "true", "yes")
 
-    logger = logging.getLogger(LOGGER_NAME)
-    logger.setLevel(logging.INFO)
+# attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; fields passed with `extra=` are included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class InfoSampler(logging.Filter):
+    """Keep a random `rate` share of records at INFO or below."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.INFO or random.random() < self.rate
 
-    file_handler = RotatingFileHandler(
-        "logs/movie_rating.log",
-        maxBytes=1_000_000,
-        backupCount=5
-    )
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(formatter)
 
+class LazyQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock prepare() renders the message and traceback in the calling
+    thread; the queue stays in-process, so the record can be passed as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _build_handlers() -> list[logging.Handler]:
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+    if LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=1_000_000, backupCount=5)
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    for handler in (file_handler, console_handler):
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(formatter)
+    return [file_handler, console_handler]
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        # flushes whatever is still queued
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging():
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+    if logger.handlers:
+        return logger
+    logger.setLevel(logging.INFO)
 
-    if not logger.hasHandlers():
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+    handlers = _build_handlers()
+    if LOG_QUEUE:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+        handlers = [LazyQueueHandler(log_queue)]
 
+    for handler in handlers:
+        if LOG_INFO_SAMPLE_RATE < 1.0:
+            handler.addFilter(InfoSampler(LOG_INFO_SAMPLE_RATE))
+        logger.addHandler(handler)
     return logger
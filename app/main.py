@@ -1,8 +1,11 @@
 from fastapi import FastAPI
 from app.api.exception_handler import app_exception_handler, validation_exception_handler
 from app.exceptions.base import AppException
-from app.api.controller import movie_controller 
-from app.db.session import SessionLocal
+from app.api.controller import debug_controller, metrics_controller, movie_controller, rating_controller
+from app.api.middleware import TimingMiddleware
+from app.db import instrumentation
+from app.cache.reference import reference_data
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
 from fastapi.exceptions import RequestValidationError
 from app.logging_config import setup_logging
 
@@ -18,9 +21,21 @@ app = FastAPI(
 
 
 app.include_router(movie_controller.router)
+app.include_router(rating_controller.router)
+app.include_router(debug_controller.router)
+app.include_router(metrics_controller.router)
+app.add_middleware(TimingMiddleware)
+instrumentation.install()
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 @app.on_event("startup")
 async def startup_event():
+    # load the genre list before the first request needs it
+    async with AsyncSessionLocal() as db:
+        await db.run_sync(reference_data.warm)
     logger.info("Application startup complete")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await async_engine.dispose()
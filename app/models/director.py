@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 class Director(Base):
     __tablename__ = "directors"
+    __table_args__ = (
+        Index("ix_directors_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     birth_year = Column(Integer, nullable=True)
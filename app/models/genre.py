@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from app.models.movie_genres import movie_genres
 
 class Genre(Base):
     __tablename__ = "genres"
+    __table_args__ = (
+        Index("ix_genres_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
     description = Column(Text, nullable=True)
@@ -1,17 +1,47 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text, Index, event, func
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.db.base import Base
 from app.models.movie_genres import movie_genres
 
+# release years a movie may have; checked by the API schemas and by the service
+MIN_RELEASE_YEAR = 1888
+MAX_RELEASE_YEAR = 2026
+
 class Movie(Base):
     __tablename__ = "movies"
+    __table_args__ = (
+        Index("ix_movies_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text)
-    director_id = Column(Integer, ForeignKey("directors.id"))
-    release_year = Column(Integer)
+    director_id = Column(Integer, ForeignKey("directors.id"), index=True)
+    release_year = Column(Integer, index=True)
     cast = Column(Text)
+    # TMDB id of movies imported by scripts.load_tmdb
+    tmdb_id = Column(Integer, unique=True, index=True)
+    # maintained by the movies_search_vector_update trigger, never written by the app
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite")))
+    # bumped by every write to the row or its genres; part of the movie's HTTP ETag
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     director = relationship("Director", back_populates="movies")
     genres = relationship("Genre", secondary=movie_genres, back_populates="movies")
     ratings = relationship("Rating", back_populates="movie", cascade="all, delete-orphan")
+    rating_summary = relationship(
+        "MovieRatingSummary", back_populates="movie", uselist=False, cascade="all, delete-orphan"
+    )
+
+
+# list sorting: ORDER BY <key>, id walks these in either direction (see MovieRepository.SORT_KEYS)
+Index("ix_movies_title_id", Movie.title, Movie.id)
+Index("ix_movies_release_year_sort", func.coalesce(Movie.release_year, 0), Movie.id)
+
+
+@event.listens_for(Movie, "before_update")
+def _bump_version(mapper, connection, target):
+    # also fires when only the genres collection changed, so those updates count too;
+    # bulk UPDATE statements (MovieRepository.update / update_many) bump it themselves
+    target.version = Movie.version + 1
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Index
 from app.db.base import Base
 
 movie_genres = Table(
     'movie_genres',
     Base.metadata,
     Column('movie_id', Integer, ForeignKey('movies.id', ondelete="CASCADE"), primary_key=True),
-    Column('genre_id', Integer, ForeignKey('genres.id', ondelete="CASCADE"), primary_key=True)
+    Column('genre_id', Integer, ForeignKey('genres.id', ondelete="CASCADE"), primary_key=True),
+    Index('ix_movie_genres_genre_id', 'genre_id')
 )
 
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Text, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 class Rating(Base):
     __tablename__ = "movie_ratings"
+    __table_args__ = (
+        # covers the movie_id FK lookups and per-movie score aggregates
+        Index("ix_movie_ratings_movie_id_score", "movie_id", "score"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"))
     score = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, BigInteger, Date, ForeignKey, Index
+from app.db.base import Base
+
+
+class MovieRatingDaily(Base):
+    """Ratings per movie per day (by rated_at, UTC), for leaderboards over recent windows."""
+    __tablename__ = "movie_rating_daily"
+    __table_args__ = (
+        Index("ix_movie_rating_daily_day", "day"),
+    )
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    ratings_count = Column(Integer, nullable=False, default=0, server_default="0")
+    ratings_sum = Column(BigInteger, nullable=False, default=0, server_default="0")
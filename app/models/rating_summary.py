@@ -0,0 +1,52 @@
+from sqlalchemy import Column, Integer, BigInteger, Float, ForeignKey, Computed, Index
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+SCORES = range(1, 11)
+
+# Bayesian average: every movie starts with PRIOR_WEIGHT virtual ratings of
+# PRIOR_MEAN, so a handful of 10s cannot outrank a well-rated classic.
+# Both are baked into the bayesian_score column; changing them needs a migration.
+PRIOR_MEAN = 6.5
+PRIOR_WEIGHT = 20
+BAYESIAN_SCORE_SQL = f"(ratings_sum + {PRIOR_MEAN * PRIOR_WEIGHT}) / (ratings_count + {float(PRIOR_WEIGHT)})"
+AVERAGE_RATING_SQL = "CASE WHEN ratings_count > 0 THEN CAST(ratings_sum AS FLOAT) / ratings_count ELSE 0 END"
+
+
+class MovieRatingSummary(Base):
+    __tablename__ = "movie_rating_summaries"
+    __table_args__ = (
+        # leaderboards: read the top k straight off the index, highest first
+        Index("ix_movie_rating_summaries_bayesian_score", "bayesian_score", "movie_id"),
+        Index("ix_movie_rating_summaries_ratings_count", "ratings_count", "movie_id"),
+        Index("ix_movie_rating_summaries_average_rating", "average_rating", "movie_id"),
+    )
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    ratings_count = Column(Integer, nullable=False, default=0, server_default="0")
+    ratings_sum = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    # score histogram, one counter per possible score
+    score_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_6 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_7 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_8 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_9 = Column(Integer, nullable=False, default=0, server_default="0")
+    score_10 = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # kept current by the database on every write to count / sum
+    bayesian_score = Column(Float, Computed(BAYESIAN_SCORE_SQL, persisted=True))
+    average_rating = Column(Float, Computed(AVERAGE_RATING_SQL, persisted=True))
+
+    movie = relationship("Movie", back_populates="rating_summary")
+
+    @classmethod
+    def score_column(cls, score: int):
+        return getattr(cls, f"score_{score}")
+
+    @property
+    def histogram(self) -> dict[int, int]:
+        return {score: getattr(self, f"score_{score}") for score in SCORES}
@@ -0,0 +1,26 @@
+from sqlalchemy import DDL, BigInteger, Column, String, event
+from app.db.base import Base
+
+# tables whose writes are counted; their rows are cached in app/cache/reference.py
+REFERENCE_TABLES = ("genres", "directors")
+
+
+class ReferenceVersion(Base):
+    """Change counter per reference table, bumped by a trigger on every write."""
+    __tablename__ = "reference_versions"
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+# Postgres gets statement triggers from migration 0b7e4f2a9c63; SQLite databases
+# are built with create_all, so the rows and (row-level) triggers are added here
+for _table in REFERENCE_TABLES:
+    event.listen(Base.metadata, "after_create", DDL(
+        f"INSERT OR IGNORE INTO reference_versions (name) VALUES ('{_table}')"
+    ).execute_if(dialect="sqlite"))
+    for _operation in ("INSERT", "UPDATE", "DELETE"):
+        event.listen(Base.metadata, "after_create", DDL(
+            f"CREATE TRIGGER IF NOT EXISTS {_table}_{_operation.lower()}_reference_version "
+            f"AFTER {_operation} ON {_table} BEGIN "
+            f"UPDATE reference_versions SET version = version + 1 WHERE name = '{_table}'; END"
+        ).execute_if(dialect="sqlite"))
@@ -1,26 +1,193 @@
-from sqlalchemy.orm import Session, joinedload
+import json
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import (
+    Float, and_, bindparam, cast, delete, exists, false, func, insert, literal, or_, select, text, tuple_, update
+)
+from app.cache.reference import reference_data
+from app.db.explain import Explain
 from app.models.movie import Movie
 from app.models.genre import Genre
 from app.models.rating import Rating
 from app.models.director import Director
-from sqlalchemy import func
+from app.models.movie_genres import movie_genres
+from app.models.rating_daily import MovieRatingDaily
+from app.models.rating_summary import MovieRatingSummary, PRIOR_MEAN, PRIOR_WEIGHT
+from app.repositories.rating_summary_repository import (
+    RatingSummaryRepository,
+    average_rating_expr,
+    ratings_count_expr,
+)
+
+# sort name -> (key, tie-breaker); each pair matches a two-column index, so
+# ORDER BY key, tie-breaker LIMIT n reads n index entries in either direction
+SORT_KEYS = {
+    "id": (Movie.id, None),
+    "title": (Movie.title, Movie.id),
+    "release_year": (func.coalesce(Movie.release_year, 0), Movie.id),
+    "average_rating": (MovieRatingSummary.average_rating, MovieRatingSummary.movie_id),
+    "ratings_count": (MovieRatingSummary.ratings_count, MovieRatingSummary.movie_id),
+}
+SUMMARY_SORTS = {"average_rating", "ratings_count"}
+
 
 class MovieRepository:
 
+    def __init__(self):
+        self.summary_repo = RatingSummaryRepository()
+
     # CRUD Methods
 
     def create(self, db: Session, movie: Movie) -> Movie:
+        if movie.rating_summary is None:
+            movie.rating_summary = MovieRatingSummary()
+        # the id comes back from INSERT ... RETURNING and nothing expires on commit, so no
+        # refresh: callers that render director and genres set them on the movie themselves
         db.add(movie)
         db.commit()
-        db.refresh(movie)
         return movie
     
-    def add_rating(self, db: Session, movie_id: int, score: int) -> Rating:
-        rating = Rating(movie_id=movie_id, score=score)
+    def add_rating(self, db: Session, movie_id: int, score: int) -> tuple[Rating, tuple[int, int]] | None:
+        """Store a rating; also returns the movie's new (ratings_count, ratings_sum).
+
+        None when the movie does not exist. The summary UPDATE ... RETURNING doubles as
+        the existence check, so a rating costs the UPDATE, the daily upsert and the INSERT.
+        """
+        rating = Rating(movie_id=movie_id, score=score, rated_at=datetime.utcnow())
+        totals = self.summary_repo.apply_rating(db, movie_id, score, rating.rated_at)
+        if totals is None and not self.existing_movie_ids(db, [movie_id]):
+            return None
+
         db.add(rating)
+        if totals is None:
+            # movie was loaded outside the app (e.g. seeding) and has no summary yet
+            db.flush()
+            self.summary_repo.rebuild(db, movie_ids=[movie_id])
+            totals = db.execute(
+                select(MovieRatingSummary.ratings_count, MovieRatingSummary.ratings_sum)
+                .where(MovieRatingSummary.movie_id == movie_id)
+            ).one()
+        db.commit()
+        return rating, tuple(totals)
+
+    def add_ratings(self, db: Session, rows: list[dict]) -> int:
+        """Insert many {movie_id, score, rated_at} rows and update their summaries in one commit."""
+        if not rows:
+            return 0
+        # executemany: SQLAlchemy batches these into multi-row INSERT ... VALUES statements
+        db.execute(insert(Rating), rows)
+        self.summary_repo.apply_ratings(db, [(row["movie_id"], row["score"], row["rated_at"]) for row in rows])
+        db.commit()
+        return len(rows)
+
+    def create_many(self, db: Session, rows: list[dict], genre_ids: list[list[int]]) -> list[int]:
+        """Insert movies (column dicts) with their genres and empty summaries in one commit.
+
+        Returns the new ids in the order of `rows`.
+        """
+        if not rows:
+            return []
+        # executemany with RETURNING: batched multi-row INSERTs, ids matched back to their rows
+        movie_ids = list(db.execute(
+            insert(Movie).returning(Movie.id, sort_by_parameter_order=True), rows
+        ).scalars())
+        links = [
+            {"movie_id": movie_id, "genre_id": genre_id}
+            for movie_id, genres in zip(movie_ids, genre_ids)
+            for genre_id in dict.fromkeys(genres)
+        ]
+        if links:
+            db.execute(insert(movie_genres), links)
+        db.execute(insert(MovieRatingSummary), [{"movie_id": movie_id} for movie_id in movie_ids])
         db.commit()
-        db.refresh(rating)
-        return rating
+        return movie_ids
+
+    def update_many(self, db: Session, rows: list[dict], genre_ids: dict[int, list[int]]) -> None:
+        """Apply {id, column: value} changes and replace the genres of the movies in `genre_ids`, in one commit."""
+        # one executemany per distinct set of columns; each also bumps the version, so
+        # a movie whose only change is its genres gets a version-only UPDATE
+        groups: dict[tuple[str, ...], list[dict]] = defaultdict(list)
+        for row in rows:
+            if len(row) > 1 or row["id"] in genre_ids:
+                groups[tuple(sorted(column for column in row if column != "id"))].append(row)
+        movies = Movie.__table__
+        for columns, group in groups.items():
+            stmt = update(movies).where(movies.c.id == bindparam("b_id")).values({
+                **{column: bindparam(f"b_{column}") for column in columns},
+                "version": movies.c.version + 1,
+            })
+            db.connection().execute(stmt, [
+                {"b_id": row["id"], **{f"b_{column}": row[column] for column in columns}} for row in group
+            ])
+        if genre_ids:
+            self._replace_genres(db, genre_ids)
+        # the UPDATEs bypass the ORM, so movies already in the session would keep their old values
+        for row in rows:
+            movie = db.identity_map.get(db.identity_key(Movie, row["id"]))
+            if movie is not None:
+                db.expire(movie)
+        db.commit()
+
+    def update(
+            self,
+            db: Session,
+            movie_id: int,
+            values: dict,
+            genre_ids: list[int] | None = None
+    ) -> tuple[Movie, list[int], float, int] | None:
+        """Set `values` (and the genres, when given) on one movie and commit.
+
+        Returns (movie, genre_ids, average_rating, ratings_count), or None when the
+        movie does not exist. The movie and its rating totals come back from
+        UPDATE ... RETURNING, so unchanged genres are the only thing read afterwards.
+        The version is bumped even when only the genres change.
+        """
+        stmt = (
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values({**values, "version": Movie.version + 1})
+            .returning(
+                Movie,
+                self._summary_value(MovieRatingSummary.average_rating),
+                self._summary_value(MovieRatingSummary.ratings_count),
+            )
+        )
+        # populate_existing: a Movie already in the session takes the returned row
+        row = db.execute(stmt, execution_options={"synchronize_session": False, "populate_existing": True}).first()
+        if row is None:
+            return None
+
+        if genre_ids is not None:
+            self._replace_genres(db, {movie_id: genre_ids})
+        else:
+            genre_ids = list(db.execute(
+                select(movie_genres.c.genre_id).where(movie_genres.c.movie_id == movie_id)
+            ).scalars())
+        db.commit()
+        movie, average_rating, ratings_count = row
+        return movie, genre_ids, average_rating, ratings_count
+
+    @staticmethod
+    def _summary_value(column):
+        # correlated subquery, so it can sit in RETURNING; 0 for a movie without a summary
+        subquery = select(column).where(MovieRatingSummary.movie_id == Movie.id).scalar_subquery()
+        return func.coalesce(subquery, 0)
+
+    @staticmethod
+    def _replace_genres(db: Session, genre_ids: dict[int, list[int]]) -> None:
+        db.execute(delete(movie_genres).where(movie_genres.c.movie_id.in_(list(genre_ids))))
+        links = [
+            {"movie_id": movie_id, "genre_id": genre_id}
+            for movie_id, genres in genre_ids.items()
+            for genre_id in dict.fromkeys(genres)
+        ]
+        if links:
+            db.execute(insert(movie_genres), links)
+
+    def existing_movie_ids(self, db: Session, movie_ids) -> set[int]:
+        return set(db.execute(select(Movie.id).where(Movie.id.in_(list(movie_ids)))).scalars())
 
     def get_genres_by_ids(self, db: Session, genre_ids: list[int]) -> list[Genre]:
         return db.query(Genre).filter(Genre.id.in_(genre_ids)).all()
@@ -31,16 +198,30 @@ class MovieRepository:
     def save(self, db: Session, movie: Movie) -> Movie:
         db.add(movie)
         db.commit()
-        db.refresh(movie)
         return movie
     
     def list_all(self, db: Session) -> list[Movie]:
         return db.query(Movie).all()
     
+    def movie_version(self, db: Session, movie_id: int) -> tuple[int, int] | None:
+        """(version, ratings_count) of a movie: what its ETag is made of, by primary key only."""
+        return db.execute(
+            select(Movie.version, ratings_count_expr())
+            .outerjoin(MovieRatingSummary, MovieRatingSummary.movie_id == Movie.id)
+            .where(Movie.id == movie_id)
+        ).first()
+
     def delete(self, db: Session, movie: Movie) -> None:
         db.delete(movie)
         db.commit()
 
+    def delete_by_id(self, db: Session, movie_id: int) -> bool:
+        """Delete a movie with one statement; ratings, summaries and genre links go
+        through their ON DELETE CASCADE foreign keys. False when there was no such movie."""
+        deleted = db.execute(delete(Movie).where(Movie.id == movie_id)).rowcount
+        db.commit()
+        return deleted > 0
+
     # Aggregation / Ratings Methods
 
     def fetch_movies_with_aggregation(
@@ -51,40 +232,312 @@ class MovieRepository:
             title: str | None = None,
             director_name: str | None = None,
             genre_name: str | None = None,
+            release_year: int | None = None,
+            after_id: int | None = None,
+            sort: str = "id",
+            descending: bool = False,
+            after_key=None,
+            versions_only: bool = False
+    ):
+        """Rows of (Movie, director_name, average_rating, ratings_count) ordered by SORT_KEYS[sort].
+
+        Keyset mode: pass the previous page's last id as `after_id` and, for
+        sorts other than id, its sort key (sort_key_of) as `after_key`.
+        With `versions_only` the same page comes back as (id, version,
+        ratings_count) rows, without directors, genres or averages.
+        """
+        if versions_only:
+            query = db.query(Movie.id, Movie.version, ratings_count_expr().label("ratings_count"))
+            if director_name:
+                query = query.join(Movie.director)
+            else:
+                # what the inner join to directors filters out in the full query
+                query = query.filter(Movie.director_id.isnot(None))
+        else:
+            query = (
+                db.query(
+                    Movie,
+                    Director.name.label("director_name"),
+                    average_rating_expr().label("average_rating"),
+                    ratings_count_expr().label("ratings_count")
+                )
+                .join(Movie.director)
+                # one batched SELECT ... WHERE movie_id IN (...) for the whole page
+                .options(selectinload(Movie.genres))
+            )
+        if sort in SUMMARY_SORTS:
+            # every movie gets a summary row when created or loaded; an inner join
+            # lets the planner drive the query from the summary index
+            query = query.join(Movie.rating_summary)
+        else:
+            query = query.outerjoin(Movie.rating_summary)
+
+        query = self._apply_filters(query, title, director_name, genre_name, release_year)
+
+        key, tie_breaker = SORT_KEYS[sort]
+        if after_id is not None:
+            # keyset mode: seek past the previous page on the sort index
+            if tie_breaker is None:
+                query = query.filter(key < after_id if descending else key > after_id)
+            else:
+                position = tuple_(key, tie_breaker)
+                after = tuple_(after_key, after_id)
+                query = query.filter(position < after if descending else position > after)
+
+        columns = [key] if tie_breaker is None else [key, tie_breaker]
+        query = query.order_by(*[column.desc() if descending else column for column in columns])
+        if after_id is None and skip:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
+    @staticmethod
+    def sort_key_of(sort: str, movie: Movie, average_rating, ratings_count):
+        """The value SORT_KEYS[sort] has for a fetched row, for the next page's cursor."""
+        if sort == "title":
+            return movie.title
+        if sort == "release_year":
+            return movie.release_year or 0
+        if sort == "average_rating":
+            return float(average_rating)
+        if sort == "ratings_count":
+            return ratings_count
+        return movie.id
+
+    def top_movies(
+            self,
+            db: Session,
+            limit: int = 10,
+            genre_name: str | None = None,
+            release_year: int | None = None,
+            since: date | None = None,
+            by: str = "rating"
+    ):
+        """Rows of (Movie, director_name, average_rating, ratings_count, score), best first.
+
+        `by` is "rating" (Bayesian average) or "ratings_count". Without `since`
+        the stored summaries are read in index order, so only about `limit`
+        rows are visited; with it the daily totals from `since` on are summed and
+        sorted, which reads every movie_rating_daily row in the window.
+        """
+        if since is None:
+            count = MovieRatingSummary.ratings_count
+            score = MovieRatingSummary.bayesian_score
+            average = average_rating_expr()
+            movie_id = MovieRatingSummary.movie_id
+            query = db.query(Movie).join(Movie.rating_summary)
+        else:
+            window = (
+                select(
+                    MovieRatingDaily.movie_id,
+                    func.sum(MovieRatingDaily.ratings_count).label("ratings_count"),
+                    func.sum(MovieRatingDaily.ratings_sum).label("ratings_sum"),
+                )
+                .where(MovieRatingDaily.day >= since)
+                .group_by(MovieRatingDaily.movie_id)
+                .subquery()
+            )
+            count = window.c.ratings_count
+            total = cast(window.c.ratings_sum, Float)
+            score = (total + PRIOR_MEAN * PRIOR_WEIGHT) / (count + PRIOR_WEIGHT)
+            average = total / count
+            movie_id = window.c.movie_id
+            query = db.query(Movie).join(window, window.c.movie_id == Movie.id)
+
+        query = (
+            query.join(Movie.director)
+            .add_columns(
+                Director.name.label("director_name"),
+                average.label("average_rating"),
+                count.label("ratings_count"),
+                score.label("score")
+            )
+            .options(selectinload(Movie.genres))
+        )
+        query = self._apply_filters(query, None, None, genre_name, release_year)
+
+        # same column order as the (score, movie_id) indexes, scanned backwards
+        order = count if by == "ratings_count" else score
+        query = query.order_by(order.desc(), movie_id.desc())
+        return query.limit(limit).all()
+
+    def export_query(
+            self,
+            db: Session,
+            title: str | None = None,
+            director_name: str | None = None,
+            genre_name: str | None = None,
             release_year: int | None = None
     ):
+        """Column rows (no ORM entities) for every matching movie in id order, meant to be streamed."""
+        query = (
+            db.query(
+                Movie.id,
+                Movie.title,
+                Movie.release_year,
+                Movie.cast,
+                Director.name.label("director"),
+                average_rating_expr().label("average_rating"),
+                ratings_count_expr().label("ratings_count")
+            )
+            .join(Movie.director)
+            .outerjoin(Movie.rating_summary)
+        )
+        query = self._apply_filters(query, title, director_name, genre_name, release_year)
+        return query.order_by(Movie.id)
+
+    def genre_names_by_movie(self, db: Session, movie_ids: list[int]) -> dict[int, list[str]]:
+        rows = (
+            db.query(movie_genres.c.movie_id, Genre.name)
+            .join(Genre, Genre.id == movie_genres.c.genre_id)
+            .filter(movie_genres.c.movie_id.in_(movie_ids))
+            .order_by(movie_genres.c.movie_id, Genre.name)
+            .all()
+        )
+        names: dict[int, list[str]] = {movie_id: [] for movie_id in movie_ids}
+        for movie_id, name in rows:
+            names[movie_id].append(name)
+        return names
+
+    def search_movies(
+            self,
+            db: Session,
+            q: str,
+            skip: int = 0,
+            limit: int = 10,
+            after: tuple[float, int] | None = None
+    ):
+        """Rows of (Movie, director_name, average_rating, ratings_count, rank), best match first."""
+        match, rank = self._search_terms(db, q)
         query = (
             db.query(
                 Movie,
                 Director.name.label("director_name"),
-                func.coalesce(func.avg(Rating.score), 0).label("average_rating"),
-                func.count(Rating.id).label("ratings_count")
+                average_rating_expr().label("average_rating"),
+                ratings_count_expr().label("ratings_count"),
+                rank.label("rank")
             )
             .join(Movie.director)
-            .outerjoin(Movie.ratings)
-            .outerjoin(Movie.genres)
+            .outerjoin(Movie.rating_summary)
+            .options(selectinload(Movie.genres))
+            .filter(match)
         )
 
+        if after is not None:
+            after_rank, after_id = after
+            query = query.filter(or_(rank < after_rank, and_(rank == after_rank, Movie.id > after_id)))
+
+        query = query.order_by(rank.desc(), Movie.id)
+        if after is None and skip:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
+    def count_search_results(self, db: Session, q: str) -> int:
+        match, _ = self._search_terms(db, q)
+        return (
+            db.query(func.count(Movie.id))
+            .join(Movie.director)
+            .filter(match)
+            .scalar()
+        )
+
+    def _search_terms(self, db: Session, q: str):
+        """(match predicate, rank expression) for a free-text query."""
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            # served by the GIN index on movies.search_vector (see migration 5e81c0d6f2a9)
+            tsquery = func.websearch_to_tsquery("english", q)
+            # ts_rank_cd returns real; as double precision it survives the JSON cursor exactly
+            rank = cast(func.ts_rank_cd(Movie.search_vector, tsquery), Float)
+            return Movie.search_vector.op("@@")(tsquery), rank
+
+        # no full-text engine (SQLite): substring match without ranking
+        match = or_(*[
+            self._contains(dialect_name, column, q)
+            for column in (Movie.title, Movie.cast, Movie.description, Director.name)
+        ])
+        return match, literal(0.0)
+
+    def count_movies(
+            self,
+            db: Session,
+            title: str | None = None,
+            director_name: str | None = None,
+            genre_name: str | None = None,
+            release_year: int | None = None
+    ) -> int:
+        # no ratings join and no GROUP BY; directors only when filtering on them
+        query = self._count_query(db, title, director_name, genre_name, release_year)
+        return query.with_entities(func.count(Movie.id)).scalar()
+
+    def estimate_movie_count(
+            self,
+            db: Session,
+            title: str | None = None,
+            director_name: str | None = None,
+            genre_name: str | None = None,
+            release_year: int | None = None
+    ) -> int | None:
+        """Planner-statistics estimate; None when the backend cannot provide one."""
+        bind = db.get_bind()
+        if bind.dialect.name != "postgresql":
+            return None
+
+        if not any((title, director_name, genre_name, release_year)):
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'movies'::regclass")
+            ).scalar()
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            return estimate if estimate is not None and estimate >= 0 else None
+
+        query = self._count_query(db, title, director_name, genre_name, release_year)
+        plan = db.execute(Explain(query.with_entities(Movie.id).statement)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _count_query(self, db, title, director_name, genre_name, release_year):
+        query = db.query(Movie)
+        if director_name:
+            query = query.join(Movie.director)
+        else:
+            # the list query inner-joins directors, so movies without one are never listed
+            query = query.filter(Movie.director_id.isnot(None))
+        return self._apply_filters(query, title, director_name, genre_name, release_year)
+
+    def _apply_filters(self, query, title, director_name, genre_name, release_year):
+        dialect_name = query.session.get_bind().dialect.name
+
         if title:
-            query = query.filter(Movie.title.ilike(f"%{title}%"))
+            query = query.filter(self._contains(dialect_name, Movie.title, title))
 
         if director_name:
-            query = query.join(Movie.director).filter(Director.name.ilike(f"%{director_name}%"))
+            query = query.filter(self._contains(dialect_name, Director.name, director_name))
 
         if genre_name:
-            query = query.filter(Movie.genres.any(Genre.name.ilike(f"%{genre_name}%")))
+            # names are matched against the cached genre list, so only ids reach the database
+            genre_ids = reference_data.genre_ids_matching(query.session, genre_name)
+            query = query.filter(
+                exists().where(movie_genres.c.movie_id == Movie.id, movie_genres.c.genre_id.in_(genre_ids))
+                if genre_ids else false()
+            )
 
         if release_year:
             query = query.filter(Movie.release_year == release_year)
 
+        return query
 
-        query = (
-            query.group_by(Movie.id, Director.name)
-            .order_by(Movie.id)
-            .offset(skip)
-            .limit(limit)
-        )
-        return query.all()
+    @staticmethod
+    def _contains(dialect_name: str, column, value: str):
+        """Case-insensitive substring match that the trigram indexes can serve."""
+        escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        if dialect_name == "postgresql":
+            # ILIKE is answered by the gin_trgm_ops indexes (see migration a7d4e2b9c031)
+            return column.ilike(pattern, escape="\\")
+        # SQLite's LIKE is already case-insensitive for ASCII and has no ILIKE
+        return column.like(pattern, escape="\\")
 
     def fetch_movie_by_id(self, db: Session, movie_id: int):
         movie = db.query(Movie)\
@@ -97,11 +550,11 @@ class MovieRepository:
         return db.query(
             Movie,
             Director.name.label("director_name"),
-            func.coalesce(func.avg(Rating.score), 0).label("average_rating"),
-            func.count(Rating.id).label("ratings_count")
+            average_rating_expr().label("average_rating"),
+            ratings_count_expr().label("ratings_count")
         ).join(Movie.director)\
-        .outerjoin(Movie.ratings)\
+        .outerjoin(Movie.rating_summary)\
+        .options(selectinload(Movie.genres))\
         .filter(Movie.id == movie_id)\
-        .group_by(Movie.id, Director.name)\
         .first()
 
@@ -0,0 +1,188 @@
+from sqlalchemy.orm import Session
+from collections import Counter, defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import bindparam, delete, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.movie import Movie
+from app.models.rating import Rating
+from app.models.rating_daily import MovieRatingDaily
+from app.models.rating_summary import MovieRatingSummary, SCORES
+
+SUMMARY_COLUMNS = ["ratings_count", "ratings_sum"] + [f"score_{score}" for score in SCORES]
+
+
+def average_rating_expr():
+    """avg(score) as stored with the summary (0 for unrated movies)."""
+    return func.coalesce(MovieRatingSummary.average_rating, 0)
+
+
+def ratings_count_expr():
+    return func.coalesce(MovieRatingSummary.ratings_count, 0)
+
+
+class RatingSummaryRepository:
+
+    def apply_rating(self, db: Session, movie_id: int, score: int, rated_at: datetime) -> tuple[int, int] | None:
+        """Count one more `score` for the movie; returns the new (ratings_count, ratings_sum).
+
+        None, with nothing written, when the movie has no summary row.
+        """
+        column = MovieRatingSummary.score_column(score)
+        totals = db.execute(
+            update(MovieRatingSummary)
+            .where(MovieRatingSummary.movie_id == movie_id)
+            .values({
+                MovieRatingSummary.ratings_count: MovieRatingSummary.ratings_count + 1,
+                MovieRatingSummary.ratings_sum: MovieRatingSummary.ratings_sum + score,
+                column: column + 1,
+            })
+            .returning(MovieRatingSummary.ratings_count, MovieRatingSummary.ratings_sum)
+        ).first()
+        if totals is None:
+            return None
+        self._add_daily(db, [{"movie_id": movie_id, "day": rated_at.date(), "count": 1, "sum": score}])
+        return totals.ratings_count, totals.ratings_sum
+
+    def apply_ratings(self, db: Session, scores: list[tuple[int, int, datetime | None]]) -> None:
+        """Count many (movie_id, score, rated_at) rows with one UPDATE per affected movie."""
+        histograms: dict[int, Counter] = defaultdict(Counter)
+        days: dict[tuple[int, date], list[int]] = defaultdict(lambda: [0, 0])
+        for movie_id, score, rated_at in scores:
+            histograms[movie_id][score] += 1
+            if rated_at is not None:
+                totals = days[movie_id, rated_at.date()]
+                totals[0] += 1
+                totals[1] += score
+        if not histograms:
+            return
+
+        missing = set(histograms) - set(db.execute(
+            select(MovieRatingSummary.movie_id)
+            .where(MovieRatingSummary.movie_id.in_(list(histograms)))
+        ).scalars())
+        if missing:
+            # rebuilt from movie_ratings, which already holds the new rows
+            db.flush()
+            self.rebuild(db, movie_ids=sorted(missing))
+
+        increments = [
+            {
+                "b_movie_id": movie_id,
+                "b_count": sum(histogram.values()),
+                "b_sum": sum(score * count for score, count in histogram.items()),
+                **{f"b_score_{score}": histogram[score] for score in SCORES},
+            }
+            for movie_id, histogram in histograms.items()
+            if movie_id not in missing
+        ]
+        if not increments:
+            return
+
+        self._add_daily(db, [
+            {"movie_id": movie_id, "day": day, "count": count, "sum": total}
+            for (movie_id, day), (count, total) in days.items()
+            if movie_id not in missing
+        ])
+        stmt = (
+            update(MovieRatingSummary)
+            .where(MovieRatingSummary.movie_id == bindparam("b_movie_id"))
+            .values({
+                MovieRatingSummary.ratings_count: MovieRatingSummary.ratings_count + bindparam("b_count"),
+                MovieRatingSummary.ratings_sum: MovieRatingSummary.ratings_sum + bindparam("b_sum"),
+                **{
+                    MovieRatingSummary.score_column(score):
+                        MovieRatingSummary.score_column(score) + bindparam(f"b_score_{score}")
+                    for score in SCORES
+                },
+            })
+        )
+        db.connection().execute(stmt, increments)
+
+    def _add_daily(self, db: Session, rows: list[dict]) -> None:
+        """Upsert {movie_id, day, count, sum} increments into movie_rating_daily."""
+        if not rows:
+            return
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(MovieRatingDaily).values(
+            movie_id=bindparam("movie_id"),
+            day=bindparam("day"),
+            ratings_count=bindparam("count"),
+            ratings_sum=bindparam("sum"),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MovieRatingDaily.movie_id, MovieRatingDaily.day],
+            set_={
+                "ratings_count": MovieRatingDaily.ratings_count + stmt.excluded.ratings_count,
+                "ratings_sum": MovieRatingDaily.ratings_sum + stmt.excluded.ratings_sum,
+            },
+        )
+        db.connection().execute(stmt, rows)
+
+    def rebuild(self, db: Session, movie_ids: list[int] | None = None) -> int:
+        """Recompute summaries and daily totals from movie_ratings; returns the summaries written."""
+        computed = self._computed_query(movie_ids)
+
+        stmt = delete(MovieRatingSummary)
+        daily_stmt = delete(MovieRatingDaily)
+        if movie_ids is not None:
+            stmt = stmt.where(MovieRatingSummary.movie_id.in_(movie_ids))
+            daily_stmt = daily_stmt.where(MovieRatingDaily.movie_id.in_(movie_ids))
+        db.execute(stmt)
+        db.execute(daily_stmt)
+
+        result = db.execute(
+            insert(MovieRatingSummary).from_select(["movie_id"] + SUMMARY_COLUMNS, computed)
+        )
+        db.execute(
+            insert(MovieRatingDaily).from_select(
+                ["movie_id", "day", "ratings_count", "ratings_sum"], self._daily_query(movie_ids)
+            )
+        )
+        return result.rowcount
+
+    def find_drift(self, db: Session, movie_ids: list[int] | None = None) -> list[int]:
+        """Return ids of movies whose stored summary differs from movie_ratings."""
+        computed = self._computed_query(movie_ids).subquery()
+        stored = MovieRatingSummary
+
+        mismatches = [
+            getattr(stored, name) != getattr(computed.c, name) for name in SUMMARY_COLUMNS
+        ]
+        query = (
+            select(computed.c.movie_id)
+            .outerjoin(stored, stored.movie_id == computed.c.movie_id)
+            .where(or_(stored.movie_id.is_(None), *mismatches))
+            .order_by(computed.c.movie_id)
+        )
+        return list(db.execute(query).scalars())
+
+    def _computed_query(self, movie_ids: list[int] | None = None):
+        histogram = [
+            func.count(Rating.id).filter(Rating.score == score).label(f"score_{score}")
+            for score in SCORES
+        ]
+        query = (
+            select(
+                Movie.id.label("movie_id"),
+                func.count(Rating.id).label("ratings_count"),
+                func.coalesce(func.sum(Rating.score), 0).label("ratings_sum"),
+                *histogram,
+            )
+            .outerjoin(Rating, Rating.movie_id == Movie.id)
+            .group_by(Movie.id)
+        )
+        if movie_ids is not None:
+            query = query.where(Movie.id.in_(movie_ids))
+        return query
+
+    def _daily_query(self, movie_ids: list[int] | None = None):
+        day = func.date(Rating.rated_at)
+        query = (
+            select(Rating.movie_id, day, func.count(Rating.id), func.sum(Rating.score))
+            .where(Rating.rated_at.isnot(None))
+            .group_by(Rating.movie_id, day)
+        )
+        if movie_ids is not None:
+            query = query.where(Rating.movie_id.in_(movie_ids))
+        return query
@@ -0,0 +1,116 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.movie import Movie
+from app.models.rating import Rating
+from app.services.export import ENCODERS
+from app.services.movie_service import MovieService
+
+# rows fetched from the server-side cursor per chunk of the export stream
+EXPORT_BATCH_SIZE = 1000
+
+
+class AsyncMovieService:
+    """Async counterpart of MovieService for the API.
+
+    Each method runs the MovieService / repository code through
+    AsyncSession.run_sync, so the queries go over the async driver without
+    blocking the event loop, and validation and SQL live in one place.
+    Anything returned is fully loaded: lazy loads are not possible once we
+    are back on the event loop.
+    """
+
+    def __init__(self, service: MovieService | None = None):
+        self.service = service or MovieService()
+
+    # CRUD Methods
+
+    async def create_movie(self, db: AsyncSession, **kwargs) -> Movie:
+        return await db.run_sync(self.service.create_movie, **kwargs)
+
+    async def update_movie(self, db: AsyncSession, movie_id: int, **kwargs) -> Movie:
+        return await db.run_sync(self.service.update_movie, movie_id, **kwargs)
+
+    async def create_movies_batch(self, db: AsyncSession, items: list[dict]) -> dict:
+        return await db.run_sync(self.service.create_movies_batch, items)
+
+    async def update_movies_batch(self, db: AsyncSession, items: list[dict]) -> dict:
+        return await db.run_sync(self.service.update_movies_batch, items)
+
+    async def delete_movie(self, db: AsyncSession, movie_id: int) -> None:
+        await db.run_sync(self.service.delete_movie, movie_id)
+
+    # Aggregation / Ratings Methods
+
+    async def get_movies(self, db: AsyncSession, **kwargs) -> dict:
+        return await db.run_sync(self.service.get_movies, **kwargs)
+
+    async def get_movies_etag(self, db: AsyncSession, **kwargs) -> str:
+        return await db.run_sync(self.service.get_movies_etag, **kwargs)
+
+    async def search_movies(self, db: AsyncSession, **kwargs) -> dict:
+        return await db.run_sync(self.service.search_movies, **kwargs)
+
+    async def get_top_movies(self, db: AsyncSession, **kwargs) -> list[dict]:
+        return await db.run_sync(self.service.get_top_movies, **kwargs)
+
+    async def add_rating(self, db: AsyncSession, movie_id: int, score: int) -> Rating:
+        return await db.run_sync(self.service.add_rating, movie_id, score)
+
+    async def add_ratings_batch(self, db: AsyncSession, items: list[dict]) -> dict:
+        return await db.run_sync(self.service.add_ratings_batch, items)
+
+    async def export_movies(
+        self,
+        db: AsyncSession,
+        format: str = "ndjson",
+        title: str | None = None,
+        director: str | None = None,
+        genre: str | None = None,
+        release_year: int | None = None
+    ) -> AsyncIterator[str]:
+        """Yield the encoded catalog in chunks of EXPORT_BATCH_SIZE movies.
+
+        Rows come from a server-side cursor and genres are loaded per chunk,
+        so memory use does not grow with the size of the catalog.
+        """
+        encode = ENCODERS[format]
+        repo = self.service.movie_repo
+        # built under run_sync: the genre filter may read the reference tables
+        statement = await db.run_sync(lambda session: repo.export_query(
+            session,
+            title=title,
+            director_name=director,
+            genre_name=genre,
+            release_year=release_year
+        ).statement)
+        result = await db.stream(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        first = True
+        async for rows in result.partitions():
+            genres = await db.run_sync(repo.genre_names_by_movie, [row.id for row in rows])
+            movies = [
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "release_year": row.release_year,
+                    "cast": row.cast,
+                    "director": row.director,
+                    "genres": genres[row.id],
+                    "average_rating": float(row.average_rating),
+                    "ratings_count": row.ratings_count
+                }
+                for row in rows
+            ]
+            yield encode(movies, header=first)
+            first = False
+
+        if first and format == "csv":
+            # empty result: still send the header row
+            yield encode([], header=True)
+
+    async def get_movie_detail(self, db: AsyncSession, movie_id: int) -> dict | None:
+        return await db.run_sync(self.service.get_movie_detail, movie_id)
+
+    async def get_movie_etag(self, db: AsyncSession, movie_id: int) -> str | None:
+        return await db.run_sync(self.service.get_movie_etag, movie_id)
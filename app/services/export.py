@@ -0,0 +1,34 @@
+import csv
+import io
+import json
+
+CSV_COLUMNS = ["id", "title", "release_year", "cast", "director", "genres", "average_rating", "ratings_count"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def encode_ndjson(movies: list[dict], header: bool = False) -> str:
+    return "".join(json.dumps(movie, ensure_ascii=False) + "\n" for movie in movies)
+
+
+def encode_csv(movies: list[dict], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for movie in movies:
+        # genres share one cell, separated by "|"
+        writer.writerow([
+            "|".join(movie[column]) if column == "genres" else movie[column]
+            for column in CSV_COLUMNS
+        ])
+    return buffer.getvalue()
+
+
+ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+}
@@ -1,26 +1,66 @@
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+
 from sqlalchemy.orm import Session
-from app.models.movie import Movie
+from sqlalchemy.orm.attributes import set_committed_value
+from app.cache import MemoryCache, build_cache
+from app.cache.reference import reference_data
+from app.models.movie import MAX_RELEASE_YEAR, MIN_RELEASE_YEAR, Movie
 from app.models.director import Director
 from app.repositories.movie_repository import MovieRepository
 from app.repositories.director_repository import DirectorRepository
 from app.models.rating import Rating
+from app.services.pagination import encode_cursor, decode_cursor
 from sqlalchemy import func
 from app.exceptions.movie_exceptions import (
+    MovieError,
     MovieNotFoundError,
     InvalidTitleError,
     InvalidReleaseYearError,
     DirectorNotFoundError,
     InvalidGenreError,
-    InvalidRatingError
+    InvalidRatingError,
+    InvalidCursorError
 )
 
+# seconds a filtered total is reused before it is counted again
+COUNT_CACHE_TTL = float(os.getenv("MOVIE_COUNT_CACHE_TTL", "30"))
+# movie detail responses; writes through this service keep them current
+DETAIL_CACHE_TTL = float(os.getenv("MOVIE_DETAIL_CACHE_TTL", "300"))
+DETAIL_CACHE_SIZE = int(os.getenv("MOVIE_DETAIL_CACHE_SIZE", "10000"))
+# leaderboards are not invalidated by writes; they trail new ratings by up to this many seconds
+LEADERBOARD_CACHE_TTL = float(os.getenv("MOVIE_LEADERBOARD_CACHE_TTL", "60"))
+
+# Movie columns a batch item may set
+MOVIE_COLUMNS = ("title", "release_year", "director_id", "cast")
+
+# JSON types a cursor's sort key may have, per sort
+SORT_KEY_TYPES = {
+    "title": str,
+    "release_year": int,
+    "average_rating": (int, float),
+    "ratings_count": int,
+}
+
+# days covered by each leaderboard window, today (UTC) included
+LEADERBOARD_WINDOWS = {"all": None, "day": 1, "week": 7, "month": 30, "year": 365}
+
+
+def _etag(*parts) -> str:
+    """Strong HTTP entity tag: a short digest of everything the response body depends on."""
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest() + '"'
 
 
 class MovieService:
 
-    def __init__(self):
+    def __init__(self, detail_cache=None):
         self.movie_repo = MovieRepository()
         self.director_repo = DirectorRepository()
+        self.count_cache = MemoryCache(maxsize=512, ttl=COUNT_CACHE_TTL)
+        self.leaderboard_cache = MemoryCache(maxsize=512, ttl=LEADERBOARD_CACHE_TTL)
+        # any MemoryCache-like backend: get/set/delete/clear plus hits and misses
+        self.detail_cache = detail_cache or build_cache("movie", DETAIL_CACHE_SIZE, DETAIL_CACHE_TTL)
 
     # CRUD Methods
 
@@ -37,26 +77,29 @@ class MovieService:
         if not title or not title.strip():
             raise InvalidTitleError(title)
 
-        if release_year and (release_year < 1888 or release_year > 2100):
+        if release_year is not None and not MIN_RELEASE_YEAR <= release_year <= MAX_RELEASE_YEAR:
             raise InvalidReleaseYearError(release_year)
 
-        director = self.director_repo.get_by_id(db, director_id)
-        if not director:
+        # reference data comes from the in-process cache; see app.cache.reference
+        director = reference_data.director_by_id(db, director_id)
+        if director is None:
             raise DirectorNotFoundError(director_id)
 
-        genres = self.movie_repo.get_genres_by_ids(db, genre_ids)
-        if len(genres) != len(genre_ids):
+        genres = reference_data.genres_by_ids(db, genre_ids)
+        if genres is None:
             raise InvalidGenreError(genre_ids)
 
         movie = Movie(
             title=title,
             release_year=release_year,
-            director_id=director_id,
+            director=director,
             cast=cast,
             genres=genres
         )
 
-        return self.movie_repo.create(db, movie)
+        movie = self.movie_repo.create(db, movie)
+        self.count_cache.clear()
+        return movie
     
     def update_movie(
         self,
@@ -69,48 +112,156 @@ class MovieService:
         cast: str | None = None,
         genre_ids: list[int] | None = None
     ):
-        movie = self.movie_repo.get_by_id(db, movie_id)
-        if not movie:
-            raise MovieNotFoundError(movie_id)
+        """Apply the given fields; the returned movie has director and genres loaded.
 
+        The fresh detail is written to the detail cache, so reading it back
+        right after (as the PUT endpoint does) costs no query.
+        """
         if title is not None and not title.strip():
             raise InvalidTitleError(title)
 
-        if release_year is not None and (release_year < 1888 or release_year > 2100):
+        if release_year is not None and not MIN_RELEASE_YEAR <= release_year <= MAX_RELEASE_YEAR:
             raise InvalidReleaseYearError(release_year)
 
-        if director_id is not None:
-            director = self.director_repo.get_by_id(db, director_id)
-            if not director:
-                raise DirectorNotFoundError(director_id)
-            movie.director_id = director_id
-
-        if title is not None:
-            movie.title = title
-
-        if release_year is not None:
-            movie.release_year = release_year
-
-        if cast is not None:
-            movie.cast = cast
+        if director_id is not None and not reference_data.known_director_ids(db, {director_id}):
+            raise DirectorNotFoundError(director_id)
 
+        genres = None
         if genre_ids is not None:
-            genres = self.movie_repo.get_genres_by_ids(db, genre_ids)
-            if len(genres) != len(genre_ids):
+            genres = reference_data.genres_by_ids(db, genre_ids)
+            if genres is None:
                 raise InvalidGenreError(genre_ids)
 
-            movie.genres.clear()
-            movie.genres.extend(genres)
-
-        return self.movie_repo.save(db, movie)
+        values = {
+            column: value
+            for column, value in (("title", title), ("release_year", release_year),
+                                  ("director_id", director_id), ("cast", cast))
+            if value is not None
+        }
+        row = self.movie_repo.update(db, movie_id, values, genre_ids)
+        if row is None:
+            raise MovieNotFoundError(movie_id)
+        if any(value is not None for value in (title, release_year, director_id, genre_ids)):
+            # filtered totals may have moved; cast is not a filter
+            self.count_cache.clear()
+
+        movie, genre_ids, average_rating, ratings_count = row
+        director = reference_data.director_by_id(db, movie.director_id) if movie.director_id else None
+        if genres is None:
+            # a genre newer than the cached list is read from the table instead
+            genres = reference_data.genres_by_ids(db, genre_ids) or self.movie_repo.get_genres_by_ids(db, genre_ids)
+        # loaded state, not changes: the session has nothing to flush
+        set_committed_value(movie, "director", director)
+        set_committed_value(movie, "genres", genres)
+
+        self.detail_cache.set(self._detail_key(movie_id), {
+            **self._movie_to_dict(movie, director.name if director else None, average_rating, ratings_count),
+            "version": movie.version,
+            # the names above were read through the reference cache at these versions
+            "reference_versions": dict(reference_data.versions)
+        })
+        return movie
     
     
+    def create_movies_batch(self, db: Session, items: list[dict]) -> dict:
+        """Validate and insert many movies in one transaction; invalid items are reported, not raised.
+
+        Each item has create_movie's fields ("genres" holds the genre ids).
+        Directors and genres are checked with one query each.
+        """
+        known_directors, known_genres = self._known_references(db, items)
+
+        valid, results = [], []
+        for index, item in enumerate(items):
+            error = self._batch_item_error(item, known_directors, known_genres, creating=True)
+            if error is not None:
+                results.append({"index": index, "id": None, "status": "failed", "message": str(error)})
+                continue
+            valid.append(index)
+            results.append({"index": index, "id": None, "status": "created", "message": None})
+
+        movie_ids = self.movie_repo.create_many(
+            db,
+            [{column: items[index][column] for column in MOVIE_COLUMNS} for index in valid],
+            [items[index]["genres"] for index in valid]
+        )
+        for index, movie_id in zip(valid, movie_ids):
+            results[index]["id"] = movie_id
+        if movie_ids:
+            self.count_cache.clear()
+
+        return {"received": len(items), "succeeded": len(movie_ids), "results": results}
+
+    def update_movies_batch(self, db: Session, items: list[dict]) -> dict:
+        """Partial updates for many movies in one transaction, like update_movie for each item.
+
+        Each item has an "id" and any of update_movie's fields; None leaves a field as is.
+        """
+        movie_ids = [item["id"] for item in items]
+        known_movies = self.movie_repo.existing_movie_ids(db, movie_ids)
+        known_directors, known_genres = self._known_references(db, items)
+
+        rows, genre_ids, results, seen = [], {}, [], set()
+        for index, item in enumerate(items):
+            if item["id"] not in known_movies:
+                error = MovieNotFoundError(item["id"])
+            elif item["id"] in seen:
+                error = MovieError(f"movie with id {item['id']} appears more than once in the batch")
+            else:
+                error = self._batch_item_error(item, known_directors, known_genres, creating=False)
+            if error is not None:
+                results.append({"index": index, "id": item["id"], "status": "failed", "message": str(error)})
+                continue
+
+            seen.add(item["id"])
+            rows.append({
+                "id": item["id"],
+                **{column: item[column] for column in MOVIE_COLUMNS if item.get(column) is not None}
+            })
+            if item.get("genres") is not None:
+                genre_ids[item["id"]] = item["genres"]
+            results.append({"index": index, "id": item["id"], "status": "updated", "message": None})
+
+        self.movie_repo.update_many(db, rows, genre_ids)
+        if rows:
+            self.count_cache.clear()
+        for row in rows:
+            self.detail_cache.delete(self._detail_key(row["id"]))
+
+        return {"received": len(items), "succeeded": len(rows), "results": results}
+
+    def _known_references(self, db: Session, items: list[dict]) -> tuple[set[int], set[int]]:
+        """Ids of the directors and genres that the batch refers to and that exist."""
+        director_ids = {item["director_id"] for item in items if item.get("director_id") is not None}
+        genre_ids = {genre_id for item in items for genre_id in item.get("genres") or []}
+        return reference_data.known_director_ids(db, director_ids), reference_data.known_genre_ids(db, genre_ids)
+
+    @staticmethod
+    def _batch_item_error(item: dict, known_directors: set[int], known_genres: set[int], creating: bool):
+        """The error create_movie / update_movie would raise for this item, or None."""
+        title = item.get("title")
+        if (creating or title is not None) and (not title or not title.strip()):
+            return InvalidTitleError(title)
+
+        release_year = item.get("release_year")
+        if release_year is not None and not MIN_RELEASE_YEAR <= release_year <= MAX_RELEASE_YEAR:
+            return InvalidReleaseYearError(release_year)
+
+        director_id = item.get("director_id")
+        if (creating or director_id is not None) and director_id not in known_directors:
+            return DirectorNotFoundError(director_id)
+
+        genres = item.get("genres")
+        if genres is not None and not set(genres) <= known_genres:
+            return InvalidGenreError(genres)
+        return None
+
     def delete_movie(self, db: Session, movie_id: int) -> None:
-        movie = self.movie_repo.get_by_id(db, movie_id)
-        if not movie:
+        if not self.movie_repo.delete_by_id(db, movie_id):
             raise MovieNotFoundError(movie_id)
 
-        self.movie_repo.delete(db, movie)
+        self.count_cache.clear()
+        self.detail_cache.delete(self._detail_key(movie_id))
 
     # Aggregation / Ratings Methods
 
@@ -122,69 +273,359 @@ class MovieService:
         title: str | None = None,
         director: str | None = None,
         genre: str | None = None,
-        release_year: int | None = None
+        release_year: int | None = None,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+        sort: str = "id",
+        order: str = "asc"
     ):
-        skip = (page - 1) * page_size
+        page, raw_movies, has_more, (total_items, total_is_estimate) = self._movie_page(
+            db, page, page_size, title, director, genre, release_year, cursor, estimate_total, sort, order
+        )
+
+        result = [self._movie_to_dict(*row) for row in raw_movies]
 
-        raw_movies = self.movie_repo.fetch_movies_with_aggregation(
+        next_cursor = None
+        if has_more:
+            last_movie, _, last_average, last_count = raw_movies[-1]
+            position = {"id": last_movie.id}
+            if sort != "id":
+                position["sort"] = sort
+                position["key"] = self.movie_repo.sort_key_of(sort, last_movie, last_average, last_count)
+            if order != "asc":
+                position["order"] = order
+            next_cursor = encode_cursor(position)
+
+        return {
+            "page": page,
+            "page_size": page_size,
+            "data": result,
+            "total_items": total_items,
+            "total_is_estimate": total_is_estimate,
+            "next_cursor": next_cursor,
+            "etag": self._page_etag(
+                page, has_more, (total_items, total_is_estimate),
+                [(movie.id, movie.version, ratings_count) for movie, _, _, ratings_count in raw_movies],
+                reference_data.current_versions(db)
+            )
+        }
+
+    def get_movies_etag(
+        self,
+        db: Session,
+        page: int = 1,
+        page_size: int = 10,
+        title: str | None = None,
+        director: str | None = None,
+        genre: str | None = None,
+        release_year: int | None = None,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+        sort: str = "id",
+        order: str = "asc"
+    ) -> str:
+        """The etag get_movies would return, from the page's ids and versions only.
+
+        Same page query without directors, genres or averages; the total
+        comes from the count cache as usual.
+        """
+        page, rows, has_more, total = self._movie_page(
+            db, page, page_size, title, director, genre, release_year, cursor, estimate_total, sort, order,
+            versions_only=True
+        )
+        return self._page_etag(
+            page, has_more, total, [tuple(row) for row in rows], reference_data.current_versions(db)
+        )
+
+    def _movie_page(
+        self, db, page, page_size, title, director, genre, release_year, cursor, estimate_total, sort, order,
+        versions_only: bool = False
+    ):
+        """(page, rows, has_more, (total, is_estimate)) for get_movies / get_movies_etag."""
+        after_id = after_key = None
+        if cursor:
+            position = decode_cursor(cursor)
+            # a cursor only continues the ordering it was issued for
+            if (position.get("sort", "id"), position.get("order", "asc")) != (sort, order):
+                raise InvalidCursorError(cursor)
+            after_id, after_key = position["id"], position.get("key")
+            if sort != "id" and not isinstance(after_key, SORT_KEY_TYPES[sort]):
+                raise InvalidCursorError(cursor)
+            page = None
+            skip = 0
+        else:
+            skip = (page - 1) * page_size
+
+        # one extra row tells us whether there is a next page
+        rows = self.movie_repo.fetch_movies_with_aggregation(
             db,
             skip=skip,
-            limit=page_size,
+            limit=page_size + 1,
+            title=title,
+            director_name=director,
+            genre_name=genre,
+            release_year=release_year,
+            after_id=after_id,
+            sort=sort,
+            descending=order == "desc",
+            after_key=after_key,
+            versions_only=versions_only
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if page is not None and not has_more and (rows or skip == 0):
+            # last page reached by offset: the total is already known
+            total = (skip + len(rows), False)
+        else:
+            total = self.count_movies(
+                db,
+                title=title,
+                director=director,
+                genre=genre,
+                release_year=release_year,
+                estimate=estimate_total
+            )
+        return page, rows, has_more, total
+
+    def count_movies(
+        self,
+        db: Session,
+        title: str | None = None,
+        director: str | None = None,
+        genre: str | None = None,
+        release_year: int | None = None,
+        estimate: bool = False
+    ) -> tuple[int, bool]:
+        """Return (total, is_estimate) for a filter set, cached for COUNT_CACHE_TTL seconds."""
+        key = (title, director, genre, release_year, estimate)
+        cached = self.count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        filters = dict(
             title=title,
             director_name=director,
             genre_name=genre,
             release_year=release_year
         )
+        total = self.movie_repo.estimate_movie_count(db, **filters) if estimate else None
+        if total is not None:
+            cached = (total, True)
+        else:
+            cached = (self.movie_repo.count_movies(db, **filters), False)
+
+        self.count_cache.set(key, cached)
+        return cached
+
+    def search_movies(
+        self,
+        db: Session,
+        q: str,
+        page: int = 1,
+        page_size: int = 10,
+        cursor: str | None = None
+    ):
+        after = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if not isinstance(position.get("rank"), (int, float)):
+                raise InvalidCursorError(cursor)
+            after = (position["rank"], position["id"])
+            page = None
+            skip = 0
+        else:
+            skip = (page - 1) * page_size
+
+        raw_movies = self.movie_repo.search_movies(
+            db, q, skip=skip, limit=page_size + 1, after=after
+        )
+        has_more = len(raw_movies) > page_size
+        raw_movies = raw_movies[:page_size]
 
         result = []
-        for movie, director_name, avg_rating, ratings_count in raw_movies:
-            genres = [g.name for g in movie.genres]
-            result.append({
-                "id": movie.id,
-                "title": movie.title,
-                "release_year": movie.release_year,
-                "cast": movie.cast,
-                "director": director_name,
-                "genres": genres,
-                "average_rating": float(avg_rating),
-                "ratings_count": ratings_count
-            })
+        for *row, rank in raw_movies:
+            item = self._movie_to_dict(*row)
+            item["rank"] = float(rank)
+            result.append(item)
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor({"id": result[-1]["id"], "rank": result[-1]["rank"]})
+
+        if page is not None and not has_more and (result or skip == 0):
+            total_items = skip + len(result)
+        else:
+            key = ("search", q)
+            total_items = self.count_cache.get(key)
+            if total_items is None:
+                total_items = self.movie_repo.count_search_results(db, q)
+                self.count_cache.set(key, total_items)
 
         return {
             "page": page,
             "page_size": page_size,
             "data": result,
-            "total_items": len(result)
+            "total_items": total_items,
+            "total_is_estimate": False,
+            "next_cursor": next_cursor
         }
 
 
     def add_rating(self, db: Session, movie_id: int, score: int):
 
-        movie = self.movie_repo.get_by_id(db, movie_id)
-        if not movie:
-            raise MovieNotFoundError(movie_id)
-
         if not 1 <= score <= 10:
             raise InvalidRatingError(score)
 
-        rate = self.movie_repo.add_rating(db, movie_id, score)
+        stored = self.movie_repo.add_rating(db, movie_id, score)
+        if stored is None:
+            raise MovieNotFoundError(movie_id)
+
+        rate, (ratings_count, ratings_sum) = stored
+
+        # patch the cached detail with the totals the UPDATE returned instead of dropping it
+        key = self._detail_key(movie_id)
+        cached = self.detail_cache.get(key)
+        if cached is not None:
+            self.detail_cache.set(key, {
+                **cached,
+                "average_rating": ratings_sum / ratings_count,
+                "ratings_count": ratings_count
+            })
         return rate
 
+    def add_ratings_batch(self, db: Session, items: list[dict]) -> dict:
+        """Validate and store many ratings at once; invalid items are reported, not raised.
+
+        Each item is {"movie_id", "score", "rated_at"}. Movie ids are checked with a
+        single query and all valid rows go in with one commit.
+        """
+        known_ids = self.movie_repo.existing_movie_ids(db, {item["movie_id"] for item in items})
+
+        rows, errors = [], []
+        for index, item in enumerate(items):
+            if item["movie_id"] not in known_ids:
+                error = MovieNotFoundError(item["movie_id"])
+            elif not 1 <= item["score"] <= 10:
+                error = InvalidRatingError(item["score"])
+            else:
+                rows.append({**item, "rated_at": self._utc(item.get("rated_at"))})
+                continue
+            errors.append({"index": index, "movie_id": item["movie_id"], "message": str(error)})
+
+        inserted = self.movie_repo.add_ratings(db, rows)
+        for movie_id in {row["movie_id"] for row in rows}:
+            self.detail_cache.delete(self._detail_key(movie_id))
+
+        return {"received": len(items), "inserted": inserted, "errors": errors}
+
+    def get_top_movies(
+        self,
+        db: Session,
+        genre: str | None = None,
+        release_year: int | None = None,
+        window: str = "all",
+        by: str = "rating",
+        limit: int = 10
+    ) -> list[dict]:
+        """Best movies by Bayesian average (or by number of ratings) over a rated_at window.
+
+        Only the "all" window is read from precomputed rows (the summaries, in index
+        order). The others aggregate the window's daily totals on every cache miss,
+        so leaderboard_cache is what keeps that GROUP BY off most requests.
+        """
+        key = ("top", genre, release_year, window, by, limit)
+        cached = self.leaderboard_cache.get(key)
+        if cached is not None:
+            return cached
+
+        days = LEADERBOARD_WINDOWS[window]
+        since = None
+        if days is not None:
+            since = datetime.utcnow().date() - timedelta(days=days - 1)
+
+        rows = self.movie_repo.top_movies(
+            db, limit=limit, genre_name=genre, release_year=release_year, since=since, by=by
+        )
+        result = []
+        for position, (*row, score) in enumerate(rows, start=1):
+            item = self._movie_to_dict(*row)
+            item["rank"] = position
+            item["score"] = float(score)
+            result.append(item)
+
+        self.leaderboard_cache.set(key, result)
+        return result
+
     def get_movie_detail(self, db: Session, movie_id: int):
-        row = self.movie_repo.fetch_movie_with_aggregation(db, movie_id)
-        if not row:
+        """The movie as served by GET /movies/{id}, plus its "version" and "etag"."""
+        key = self._detail_key(movie_id)
+        reference = reference_data.current_versions(db)
+        detail = self._current_detail(key, reference)
+        if detail is None:
+            row = self.movie_repo.fetch_movie_with_aggregation(db, movie_id)
+            if not row:
+                return None
+
+            detail = {**self._movie_to_dict(*row), "version": row[0].version, "reference_versions": reference}
+            self.detail_cache.set(key, detail)
+        return {**detail, "etag": self._movie_etag(movie_id, detail["version"], detail["ratings_count"], reference)}
+
+    def get_movie_etag(self, db: Session, movie_id: int) -> str | None:
+        """The etag get_movie_detail would return, without the aggregate query; None for no such movie."""
+        reference = reference_data.current_versions(db)
+        detail = self._current_detail(self._detail_key(movie_id), reference)
+        if detail is not None:
+            return self._movie_etag(movie_id, detail["version"], detail["ratings_count"], reference)
+
+        versions = self.movie_repo.movie_version(db, movie_id)
+        if versions is None:
             return None
+        return self._movie_etag(movie_id, *versions, reference)
 
-        movie, director_name, avg_rating, ratings_count = row
-        genres = [g.name for g in movie.genres]
+    def _current_detail(self, key: str, reference: dict[str, int]) -> dict | None:
+        """The cached detail, unless its director / genre names predate `reference`.
 
+        Entries written before movies had a version (redis outlives a deploy) are misses too.
+        """
+        detail = self.detail_cache.get(key)
+        if detail is None or "version" not in detail or detail.get("reference_versions") != reference:
+            return None
+        return detail
+
+    @staticmethod
+    def _movie_etag(movie_id: int, version: int, ratings_count: int, reference: dict[str, int]) -> str:
+        # director and genre names are part of the body; their table versions cover renames
+        return _etag("movie", movie_id, version, ratings_count, sorted(reference.items()))
+
+    @staticmethod
+    def _page_etag(page, has_more: bool, total: tuple[int, bool], versions: list[tuple[int, int, int]],
+                   reference: dict[str, int]) -> str:
+        """Collection etag: every (id, version, ratings_count) on the page, plus what else the body holds."""
+        return _etag("page", page, has_more, total, versions, sorted(reference.items()))
+
+    @staticmethod
+    def _utc(moment: datetime | None) -> datetime:
+        """Naive UTC, as rated_at is stored; now when missing."""
+        if moment is None:
+            return datetime.utcnow()
+        if moment.tzinfo is not None:
+            return moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return moment
+
+    @staticmethod
+    def _detail_key(movie_id: int) -> str:
+        return f"detail:{movie_id}"
+
+    @staticmethod
+    def _movie_to_dict(movie: Movie, director_name: str, avg_rating, ratings_count: int) -> dict:
         return {
             "id": movie.id,
             "title": movie.title,
             "release_year": movie.release_year,
             "cast": movie.cast,
             "director": director_name,
-            "genres": genres,
+            "genres": [g.name for g in movie.genres],
             "average_rating": float(avg_rating),
             "ratings_count": ratings_count
             }
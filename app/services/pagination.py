@@ -0,0 +1,22 @@
+import base64
+import json
+
+from app.exceptions.movie_exceptions import InvalidCursorError
+
+
+def encode_cursor(position: dict) -> str:
+    """Opaque, url-safe token for the last row of a page."""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursorError(cursor)
+
+    if not isinstance(position, dict) or not isinstance(position.get("id"), int):
+        raise InvalidCursorError(cursor)
+    return position
@@ -0,0 +1,267 @@
+"""Fill the schema with a synthetic catalog large enough to expose scaling problems.
+
+Movies, directors, genre links, ratings and rating summaries are generated
+with numpy in chunks and written with COPY. Ratings per movie follow a Zipf
+distribution (a few blockbusters, a long tail of barely rated titles), and
+the summaries are computed from the generated ratings instead of being
+rebuilt with a GROUP BY afterwards.
+
+Usage (from the project root, against a migrated Postgres database):
+    python -m benchmarks.datagen --movies 100000 --ratings 5000000
+    python -m benchmarks.datagen --movies 1000000 --ratings 100000000 --reset
+    python -m benchmarks.datagen --movies 50000 --ratings 1000000 --zipf 0   # uniform
+
+From Python (e.g. the benchmark suite):
+    from benchmarks.datagen import generate
+    with engine.connect() as conn:
+        generate(conn, movies=100_000, ratings=2_000_000)
+        conn.commit()
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from app.db.bulk import copy_csv, drop_foreign_keys, drop_secondary_indexes, restore_ddl, sync_sequence
+from app.db.session import engine
+from app.models.rating_summary import SCORES
+
+GENRES = [
+    "Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary", "Drama",
+    "Family", "Fantasy", "Foreign", "History", "Horror", "Music", "Mystery", "Romance",
+    "Science Fiction", "TV Movie", "Thriller", "War", "Western",
+]
+WORDS = (
+    "night city love war last dark star man woman king queen river road house fire ice "
+    "dream secret journey return lost blood shadow light heart stone ghost island storm "
+    "summer winter empire wild silent golden broken iron paper glass moon sun sea sky "
+    "garden hunter stranger family game machine world time edge story song letter"
+).split()
+FIRST_NAMES = "Ava Ben Cleo Dan Eva Finn Gia Hugo Ivy Jon Kai Lea Max Nia Omar Pia Quinn Rosa Sam Tara".split()
+LAST_NAMES = "Adams Brooks Chen Diaz Evans Fox Gray Hill Ito Jones Khan Lopez Moore Nolan Ortiz Park Reed Silva Tran Wolfe".split()
+
+RATED_SPAN_SECONDS = 5 * 365 * 24 * 3600
+TABLES = ["movies", "movie_genres", "movie_ratings", "movie_rating_summaries", "movie_rating_daily", "directors"]
+
+
+def _phrases(rng, count: int, low: int, high: int) -> list[str]:
+    lengths = rng.integers(low, high + 1, size=count)
+    words = np.array(WORDS)[rng.integers(0, len(WORDS), size=int(lengths.sum()))]
+    return [" ".join(chunk) for chunk in np.split(words, np.cumsum(lengths)[:-1])]
+
+
+def _names(rng, count: int) -> np.ndarray:
+    first = np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), size=count)]
+    last = np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), size=count)]
+    return np.char.add(np.char.add(first, " "), last)
+
+
+def _copy_frame(conn, table: str, frame: pd.DataFrame) -> None:
+    buffer = io.StringIO()
+    frame.to_csv(buffer, header=False, index=False)
+    copy_csv(conn, table, list(frame.columns), buffer.getvalue())
+
+
+def ratings_per_movie(rng, movies: int, ratings: int, zipf: float) -> np.ndarray:
+    """Split `ratings` across movies; zipf=0 spreads them uniformly."""
+    if zipf <= 0:
+        weights = np.ones(movies)
+    else:
+        weights = 1.0 / np.arange(1, movies + 1) ** zipf
+        # popularity should not follow the id order
+        rng.shuffle(weights)
+    return rng.multinomial(ratings, weights / weights.sum())
+
+
+def generate(
+    conn,
+    movies: int,
+    ratings: int,
+    directors: int | None = None,
+    zipf: float = 1.1,
+    seed: int = 42,
+    chunk_size: int = 1_000_000,
+    log=print,
+) -> dict:
+    """Append `movies` movies and `ratings` ratings to the catalog on `conn` (not committed)."""
+    rng = np.random.default_rng(seed)
+    directors = directors or max(movies // 10, 1)
+    started = time.perf_counter()
+
+    def step(label: str, rows: int, elapsed: float) -> None:
+        log(f"{label:<14} {rows:>11} rows  {elapsed:7.2f}s  {rows / max(elapsed, 1e-9):>10.0f} rows/s")
+
+    conn.execute(
+        text("INSERT INTO genres (name, description) SELECT unnest(CAST(:names AS text[])), 'Synthetic' "
+             "ON CONFLICT (name) DO NOTHING"),
+        {"names": GENRES},
+    )
+    genre_ids = np.array(conn.execute(
+        text("SELECT id FROM genres WHERE name = ANY(:names) ORDER BY id"), {"names": GENRES}
+    ).scalars().all())
+
+    index_definitions = drop_secondary_indexes(conn, TABLES)
+    foreign_keys = drop_foreign_keys(conn, TABLES)
+
+    # directors
+    since = time.perf_counter()
+    first_director = conn.execute(text("SELECT coalesce(max(id), 0) + 1 FROM directors")).scalar_one()
+    director_ids = np.arange(first_director, first_director + directors)
+    _copy_frame(conn, "directors", pd.DataFrame({
+        "id": director_ids,
+        "name": np.char.add(_names(rng, directors), np.char.add(" ", director_ids.astype(str))),
+        "birth_year": rng.integers(1920, 2000, size=directors),
+    }))
+    sync_sequence(conn, "directors")
+    step("directors", directors, time.perf_counter() - since)
+
+    counts = ratings_per_movie(rng, movies, ratings, zipf)
+    first_movie = conn.execute(text("SELECT coalesce(max(id), 0) + 1 FROM movies")).scalar_one()
+
+    # movies, genre links and ratings, one chunk of movies at a time
+    histogram = np.zeros((movies, len(SCORES)), dtype=np.int64)
+    movie_rows = link_rows = rating_rows = daily_rows = 0
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("s")
+    movie_seconds = link_seconds = rating_seconds = daily_seconds = 0.0
+    movies_per_chunk = max(chunk_size // 10, 1)
+
+    for offset in range(0, movies, movies_per_chunk):
+        size = min(movies_per_chunk, movies - offset)
+        ids = np.arange(first_movie + offset, first_movie + offset + size)
+
+        since = time.perf_counter()
+        cast = [", ".join(names) for names in _names(rng, size * 3).reshape(size, 3)]
+        _copy_frame(conn, "movies", pd.DataFrame({
+            "id": ids,
+            "title": [phrase.title() for phrase in _phrases(rng, size, 1, 4)],
+            "director_id": director_ids[rng.zipf(1.5, size=size) % directors],
+            # skewed towards recent years, like real catalogs
+            "release_year": 2025 - np.minimum(rng.exponential(18, size=size).astype(int), 105),
+            "cast": cast,
+            "description": _phrases(rng, size, 8, 20),
+        }))
+        movie_seconds += time.perf_counter() - since
+        movie_rows += size
+
+        since = time.perf_counter()
+        per_movie = rng.integers(1, 4, size=size)
+        link_movies = np.repeat(ids, per_movie)
+        link_genres = genre_ids[rng.integers(0, len(genre_ids), size=len(link_movies))]
+        links = pd.DataFrame({"movie_id": link_movies, "genre_id": link_genres}).drop_duplicates()
+        _copy_frame(conn, "movie_genres", links)
+        link_seconds += time.perf_counter() - since
+        link_rows += len(links)
+
+        # ratings for this chunk of movies, split so one COPY holds about chunk_size rows
+        since, daily_before = time.perf_counter(), daily_seconds
+        chunk_counts = counts[offset:offset + size]
+        quality = np.clip(rng.normal(6.5, 1.5, size=size), 1, 10)
+        bounds = np.searchsorted(np.cumsum(chunk_counts), np.arange(chunk_size, chunk_counts.sum(), chunk_size))
+        for part in np.split(np.arange(size), bounds):
+            if not len(part):
+                continue
+            rated = np.repeat(part, chunk_counts[part])
+            if not len(rated):
+                continue
+            scores = np.clip(np.rint(rng.normal(quality[rated], 2.0)), 1, 10).astype(np.int64)
+            np.add.at(histogram, (offset + rated, scores - 1), 1)
+            seconds_ago = rng.integers(0, RATED_SPAN_SECONDS, size=len(rated))
+            frame = pd.DataFrame({
+                "movie_id": ids[rated],
+                "score": scores,
+                # naive UTC, like the API writes
+                "rated_at": (now - pd.to_timedelta(seconds_ago, unit="s")),
+            })
+            _copy_frame(conn, "movie_ratings", frame)
+            rating_rows += len(rated)
+
+            daily_since = time.perf_counter()
+            # a movie's ratings never span two parts, so each (movie, day) is written once
+            daily = (
+                frame.groupby(["movie_id", frame["rated_at"].dt.date.rename("day")])["score"]
+                .agg(ratings_count="count", ratings_sum="sum")
+                .reset_index()
+            )
+            _copy_frame(conn, "movie_rating_daily", daily)
+            daily_rows += len(daily)
+            daily_seconds += time.perf_counter() - daily_since
+        rating_seconds += time.perf_counter() - since - (daily_seconds - daily_before)
+
+    step("movies", movie_rows, movie_seconds)
+    step("movie_genres", link_rows, link_seconds)
+    step("movie_ratings", rating_rows, rating_seconds)
+    step("rating_daily", daily_rows, daily_seconds)
+    sync_sequence(conn, "movies")
+
+    # summaries straight from the generated histogram
+    since = time.perf_counter()
+    summary = pd.DataFrame({
+        "movie_id": np.arange(first_movie, first_movie + movies),
+        "ratings_count": histogram.sum(axis=1),
+        "ratings_sum": histogram @ np.arange(1, len(SCORES) + 1),
+        **{f"score_{score}": histogram[:, score - 1] for score in SCORES},
+    })
+    for offset in range(0, movies, chunk_size):
+        _copy_frame(conn, "movie_rating_summaries", summary.iloc[offset:offset + chunk_size])
+    step("summaries", movies, time.perf_counter() - since)
+
+    since = time.perf_counter()
+    restore_ddl(conn, index_definitions)
+    step("indexes", len(index_definitions), time.perf_counter() - since)
+
+    since = time.perf_counter()
+    restore_ddl(conn, foreign_keys)
+    step("foreign keys", len(foreign_keys), time.perf_counter() - since)
+
+    since = time.perf_counter()
+    for table in TABLES:
+        conn.execute(text(f"ANALYZE {table}"))
+    step("analyze", len(TABLES), time.perf_counter() - since)
+
+    elapsed = time.perf_counter() - started
+    log(f"Generated {movies} movies and {rating_rows} ratings in {elapsed:.1f}s")
+    return {"movies": movies, "ratings": rating_rows, "directors": directors, "seconds": elapsed}
+
+
+def reset_catalog(conn) -> None:
+    conn.execute(text(
+        "TRUNCATE movie_rating_daily, movie_rating_summaries, movie_ratings, movie_genres, movies, directors "
+        "RESTART IDENTITY"
+    ))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic movie catalog")
+    parser.add_argument("--movies", type=int, default=100_000)
+    parser.add_argument("--ratings", type=int, default=1_000_000)
+    parser.add_argument("--directors", type=int, help="default: movies / 10")
+    parser.add_argument("--zipf", type=float, default=1.1,
+                        help="Zipf exponent of ratings per movie (0 = uniform)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="rows per COPY")
+    parser.add_argument("--reset", action="store_true", help="empty the catalog first (genres are kept)")
+    args = parser.parse_args(argv)
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("The data generator needs a Postgres DATABASE_URL.")
+
+    with engine.connect() as conn:
+        if args.reset:
+            reset_catalog(conn)
+        generate(
+            conn,
+            movies=args.movies,
+            ratings=args.ratings,
+            directors=args.directors,
+            zipf=args.zipf,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+        )
+        conn.commit()
+
+
+if __name__ == "__main__":
+    main()
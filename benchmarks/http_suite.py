@@ -0,0 +1,357 @@
+"""End-to-end HTTP benchmark of every movie endpoint, with JSON results and a regression check.
+
+`run` seeds the database at each requested scale (with benchmarks.datagen,
+after emptying the catalog, so it asks for --reset),
+starts the app under uvicorn, and drives it with a weighted mix of requests
+from concurrent clients. Latency percentiles and throughput per operation
+are written as JSON. `compare` checks a result file against a baseline and
+exits non-zero when p95 latency or throughput regressed past a threshold.
+
+Usage (from the project root, against a migrated Postgres database):
+    python -m benchmarks.http_suite run --scales 10000,100000 --reset --output bench.json
+    python -m benchmarks.http_suite run --no-seed --concurrency 32 --duration 30 --output bench.json
+    python -m benchmarks.http_suite run --url http://127.0.0.1:8000 --no-seed --mix detail=1
+    python -m benchmarks.http_suite compare baseline.json bench.json --max-regression 0.15
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import text
+
+from app.db.session import engine
+
+DEFAULT_MIX = {
+    "list": 10,
+    "list_title": 8,
+    "list_director": 8,
+    "list_genre": 8,
+    "list_year": 8,
+    "search": 5,
+    "detail": 25,
+    "rating": 12,
+    "create": 6,
+    "update": 5,
+    "delete": 5,
+}
+RATINGS_PER_MOVIE = 20
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+class Workload:
+    """Request parameters sampled from the database, and the ids the run itself created."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        with engine.connect() as conn:
+            self.movie_ids = conn.execute(
+                text("SELECT id FROM movies ORDER BY random() LIMIT 2000")
+            ).scalars().all()
+            rows = conn.execute(text(
+                "SELECT m.title, m.release_year, d.id AS director_id, d.name AS director "
+                "FROM movies m JOIN directors d ON d.id = m.director_id WHERE m.id = ANY(:ids)"
+            ), {"ids": self.movie_ids[:500]}).all()
+            self.genre_ids = conn.execute(text("SELECT id FROM genres ORDER BY id")).scalars().all()
+            self.genres = conn.execute(text("SELECT name FROM genres ORDER BY id")).scalars().all()
+
+        if not self.movie_ids:
+            raise SystemExit("The database has no movies; seed it or drop --no-seed.")
+
+        self.title_words = [row.title.split()[0] for row in rows if row.title.split()]
+        self.directors = [row.director for row in rows]
+        self.director_ids = [row.director_id for row in rows]
+        self.years = [row.release_year for row in rows if row.release_year]
+        self.created: list[int] = []
+
+    def pick(self, values):
+        return values[self.rng.randrange(len(values))]
+
+    def movie_payload(self) -> dict:
+        return {
+            "title": f"Benchmark {self.rng.randrange(10 ** 9)}",
+            "release_year": self.rng.randint(1950, 2025),
+            "director_id": self.pick(self.director_ids),
+            "genres": self.rng.sample(self.genre_ids, k=min(2, len(self.genre_ids))),
+            "cast": "Bench Actor",
+        }
+
+    async def call(self, client: httpx.AsyncClient, operation: str) -> httpx.Response:
+        base = "/api/v1/movies"
+        if operation == "list":
+            return await client.get(f"{base}/", params={"page": self.rng.randint(1, 5)})
+        if operation == "list_title":
+            return await client.get(f"{base}/", params={"title": self.pick(self.title_words)})
+        if operation == "list_director":
+            return await client.get(f"{base}/", params={"director": self.pick(self.directors)})
+        if operation == "list_genre":
+            return await client.get(f"{base}/", params={"genre": self.pick(self.genres)})
+        if operation == "list_year":
+            return await client.get(f"{base}/", params={"release_year": self.pick(self.years)})
+        if operation == "search":
+            return await client.get(f"{base}/search", params={"q": self.pick(self.title_words)})
+        if operation == "detail":
+            return await client.get(f"{base}/{self.pick(self.movie_ids)}")
+        if operation == "rating":
+            return await client.post(f"{base}/{self.pick(self.movie_ids)}/ratings",
+                                     json={"score": self.rng.randint(1, 10)})
+        if operation == "create" or (operation in ("update", "delete") and not self.created):
+            response = await client.post(f"{base}/", json=self.movie_payload())
+            if response.status_code == 201:
+                self.created.append(response.json()["data"]["id"])
+            return response
+        if operation == "update":
+            return await client.put(f"{base}/{self.pick(self.created)}",
+                                    json={"cast": f"Bench Actor {self.rng.randrange(1000)}"})
+        if operation == "delete":
+            movie_id = self.created.pop(self.rng.randrange(len(self.created)))
+            return await client.delete(f"{base}/{movie_id}")
+        raise ValueError(f"unknown operation {operation!r}")
+
+
+async def drive(base_url: str, workload: Workload, mix: dict, concurrency: int,
+                duration: float, warmup: float) -> dict:
+    operations, weights = zip(*mix.items())
+    latencies = {operation: [] for operation in operations}
+    errors = {operation: 0 for operation in operations}
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+
+        async def worker(deadline: float, record: bool) -> None:
+            while time.perf_counter() < deadline:
+                operation = workload.rng.choices(operations, weights)[0]
+                started = time.perf_counter()
+                try:
+                    response = await workload.call(client, operation)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                if record:
+                    latencies[operation].append(time.perf_counter() - started)
+                    errors[operation] += failed
+
+        if warmup:
+            deadline = time.perf_counter() + warmup
+            await asyncio.gather(*[worker(deadline, False) for _ in range(concurrency)])
+
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[worker(deadline, True) for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+        # leave the catalog as we found it
+        for movie_id in workload.created:
+            await client.delete(f"/api/v1/movies/{movie_id}")
+        workload.created.clear()
+
+    every = [latency for samples in latencies.values() for latency in samples]
+    return {
+        "overall": summarize(every, sum(errors.values()), elapsed),
+        "operations": {
+            operation: summarize(latencies[operation], errors[operation], elapsed)
+            for operation in operations
+        },
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, env: dict | None = None) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, **(env or {})},
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if httpx.get(f"{url}/openapi.json", timeout=1).status_code == 200:
+                return process, url
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("uvicorn did not start; run it by hand to see the error")
+
+
+def seed(scale: int) -> None:
+    from benchmarks.datagen import generate, reset_catalog
+
+    with engine.connect() as conn:
+        reset_catalog(conn)
+        generate(conn, movies=scale, ratings=scale * RATINGS_PER_MOVIE, log=lambda line: None)
+        conn.commit()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_mix(value: str | None) -> dict:
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"unknown operation {name!r}; choose from {', '.join(DEFAULT_MIX)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def run(args) -> int:
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("The HTTP benchmark needs a Postgres DATABASE_URL.")
+
+    mix = parse_mix(args.mix)
+    scales = [int(scale) for scale in args.scales.split(",")] if args.scales else [None]
+    if args.scales and not args.no_seed and not args.reset:
+        raise SystemExit(
+            "Seeding a scale deletes every movie, rating and director in DATABASE_URL "
+            f"({engine.url.render_as_string(hide_password=True)}). Pass --reset to do that, "
+            "or --no-seed to benchmark the data already there."
+        )
+    report = {
+        "commit": git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "mix": mix,
+        "scales": {},
+    }
+
+    for scale in scales:
+        if scale is not None and not args.no_seed:
+            print(f"seeding {scale} movies ...", file=sys.stderr)
+            seed(scale)
+
+        workload = Workload(args.seed)
+        process, url = (None, args.url) if args.url else start_server(args.workers)
+        try:
+            result = asyncio.run(drive(url, workload, mix, args.concurrency, args.duration, args.warmup))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+        with engine.connect() as conn:
+            movies = conn.execute(text("SELECT count(*) FROM movies")).scalar_one()
+        report["scales"][str(scale or movies)] = {"movies": movies, **result}
+        overall = result["overall"]
+        print(f"{movies:>9} movies: {overall['throughput_rps']:8.1f} req/s  "
+              f"p50 {overall['p50_ms']:.1f}  p95 {overall['p95_ms']:.1f}  p99 {overall['p99_ms']:.1f} ms  "
+              f"errors {overall['errors']}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+
+    failures = 0
+    for scale, result in current["scales"].items():
+        before = baseline["scales"].get(scale)
+        if before is None:
+            print(f"[   skip] scale {scale}: not in baseline")
+            continue
+        for operation, stats in {"overall": result["overall"], **result["operations"]}.items():
+            old = before["operations"].get(operation) if operation != "overall" else before["overall"]
+            if not old or not old["requests"] or not stats["requests"]:
+                continue
+            slower = stats["p95_ms"] / old["p95_ms"] - 1 if old["p95_ms"] else 0.0
+            fewer = 1 - stats["throughput_rps"] / old["throughput_rps"] if old["throughput_rps"] else 0.0
+            regressed = slower > args.max_regression or (operation == "overall" and fewer > args.max_regression)
+            failures += regressed
+            status = "REGRESS" if regressed else "ok"
+            print(f"[{status:>7}] {scale:>8} {operation:<14} p95 {old['p95_ms']:8.1f} -> {stats['p95_ms']:8.1f} ms "
+                  f"({slower:+.0%})  throughput {old['throughput_rps']:8.1f} -> {stats['throughput_rps']:8.1f}")
+
+    if failures:
+        print(f"{failures} regression(s) beyond {args.max_regression:.0%}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP benchmark of the movie API")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark the API and write JSON results")
+    run_parser.add_argument("--scales", help="comma-separated catalog sizes to seed and test, e.g. 10000,100000")
+    run_parser.add_argument("--no-seed", action="store_true", help="use the data already in the database")
+    run_parser.add_argument("--reset", action="store_true",
+                            help="allow --scales to empty the catalog before seeding (use a dedicated database)")
+    run_parser.add_argument("--url", help="benchmark a running server instead of starting uvicorn")
+    run_parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--duration", type=float, default=20.0, help="measured seconds per scale")
+    run_parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds before each run")
+    run_parser.add_argument("--mix", help="operation weights, e.g. list=5,detail=10,rating=2 "
+                                          f"(default: {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})")
+    run_parser.add_argument("--seed", type=int, default=7, help="random seed for the request mix")
+    run_parser.add_argument("--output", help="write JSON here instead of stdout")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="fail when results regressed against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--max-regression", type=float, default=0.20,
+                                help="allowed relative p95 increase / throughput drop (default 0.20)")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Closed-loop HTTP load test: requests per second against a running server.
+
+Every worker sends requests back to back for --duration seconds, so the
+result is the throughput the server sustains at that concurrency. Run it
+before and after a change, with the server started the same way each time:
+
+    poetry run uvicorn app.main:app --workers 1
+    python -m benchmarks.load_test --concurrency 50 --duration 20
+    python -m benchmarks.load_test --path "/api/v1/movies/search?q=love"
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/v1/movies/?page=1&page_size=10",
+    "/api/v1/movies/?genre=drama&page_size=10",
+    "/api/v1/movies/1",
+]
+
+
+async def worker(client: httpx.AsyncClient, paths: list[str], deadline: float,
+                 latencies: list[float], errors: list[int]) -> None:
+    index = 0
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            failed = response.status_code >= 500
+        except httpx.HTTPError:
+            failed = True
+        latencies.append(time.perf_counter() - started)
+        if failed:
+            errors.append(1)
+
+
+async def run(base_url: str, paths: list[str], concurrency: int, duration: float) -> None:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        # one request per path first, so connection setup and cold caches are not measured
+        for path in paths:
+            await client.get(path)
+
+        latencies: list[float] = []
+        errors: list[int] = []
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            worker(client, paths, deadline, latencies, errors) for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    if not latencies:
+        print("No requests completed.")
+        return
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"{len(latencies)} requests in {elapsed:.1f}s at concurrency {concurrency}")
+    print(f"throughput: {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency ms: p50 {quantiles[49] * 1000:.1f}  p95 {quantiles[94] * 1000:.1f}  "
+          f"p99 {quantiles[98] * 1000:.1f}")
+    print(f"server errors: {len(errors)}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Requests per second against a running API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="server base URL")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help="path to request (repeatable, requests rotate through them)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.url, args.paths or DEFAULT_PATHS, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
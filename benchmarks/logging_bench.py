@@ -0,0 +1,64 @@
+"""Request latency under load with each logging configuration.
+
+Starts the app under uvicorn once per configuration (synchronous handlers,
+queued text, queued JSON, queued with INFO sampling) and drives the logging
+endpoints (listing and rating) with the benchmarks.http_suite workload.
+Prints p50/p95/p99 and throughput side by side.
+
+Usage (from the project root, against a seeded Postgres database):
+    python -m benchmarks.logging_bench
+    python -m benchmarks.logging_bench --concurrency 64 --duration 30 --output logging.json
+"""
+import argparse
+import asyncio
+import json
+
+from benchmarks.http_suite import Workload, drive, start_server
+
+CONFIGURATIONS = {
+    "sync": {"LOG_QUEUE": "false"},
+    "queued": {"LOG_QUEUE": "true"},
+    "queued-json": {"LOG_QUEUE": "true", "LOG_FORMAT": "json"},
+    "queued-sampled": {"LOG_QUEUE": "true", "LOG_INFO_SAMPLE_RATE": "0.1"},
+}
+# the endpoints that log on every request
+MIX = {"list": 4, "list_genre": 2, "search": 2, "rating": 2}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Request latency per logging configuration")
+    parser.add_argument("--configs", default=",".join(CONFIGURATIONS),
+                        help=f"comma-separated subset of {', '.join(CONFIGURATIONS)}")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per configuration")
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.configs.split(","):
+        process, url = start_server(args.workers, env=CONFIGURATIONS[name])
+        try:
+            # same seed for every configuration, so each sees the same request sequence
+            run = asyncio.run(drive(url, Workload(args.seed), MIX, args.concurrency,
+                                    args.duration, args.warmup))
+        finally:
+            process.terminate()
+            process.wait()
+        results[name] = run["overall"]
+        print(f"{name}: done", flush=True)
+
+    print(f"\n{'config':<16} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, overall in results.items():
+        print(f"{name:<16} {overall['throughput_rps']:>9.1f} {overall['p50_ms']:>9.2f} "
+              f"{overall['p95_ms']:>9.2f} {overall['p99_ms']:>9.2f} {overall['errors']:>7}")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Micro-benchmarks of MovieRepository and MovieService methods with SQL accounting.
+
+Every case runs against the seeded database inside a transaction that is
+rolled back at the end, so write paths are measured without changing data.
+For each case we report the median wall time and, from app.db.instrumentation,
+the SQL statements issued, rows fetched and ORM objects loaded per call.
+Statement counts are checked against per-case budgets so that regressions
+such as an N+1 lazy load or an extra refresh after commit fail loudly.
+
+Usage (from the project root, against a seeded Postgres database):
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter service. --repeat 50
+    python -m benchmarks.micro --check --json micro.json
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.instrumentation import track_queries
+from app.db.session import engine
+from app.models.movie import Movie
+from app.cache.reference import reference_data
+from app.repositories.movie_repository import MovieRepository
+from app.services.movie_service import MovieService
+from app.services.pagination import encode_cursor
+
+# import models so every relationship can be resolved
+import app.models.director
+import app.models.genre
+import app.models.rating
+import app.models.rating_daily
+import app.models.rating_summary
+
+
+@dataclass
+class Case:
+    name: str
+    call: Callable[[], object]
+    # most SQL statements one call may issue; None = not budgeted
+    budget: int | None
+    setup: Callable[[], None] | None = None
+
+
+def build_cases(db: Session) -> list[Case]:
+    repo = MovieRepository()
+    service = MovieService()
+    # as after app startup; the periodic version check is left out of the per-call counts
+    reference_data.warm(db)
+    reference_data.check_interval = float("inf")
+
+    sample = db.execute(text(
+        """
+        SELECT m.id, m.title, m.release_year, d.id AS director_id, d.name AS director
+        FROM movies m JOIN directors d ON d.id = m.director_id
+        ORDER BY m.id DESC LIMIT 1
+        """
+    )).one()
+    genre = db.execute(text("SELECT id, name FROM genres ORDER BY id LIMIT 1")).one()
+    word = sample.title.split()[0]
+    page_ids = db.execute(text("SELECT id FROM movies ORDER BY id LIMIT 10")).scalars().all()
+
+    def new_movie() -> Movie:
+        return Movie(title="Micro benchmark", release_year=2000, director_id=sample.director_id,
+                     genres=repo.get_genres_by_ids(db, [genre.id]))
+
+    def scratch_movie_id() -> int:
+        return service.create_movie(db, "Micro benchmark", 2000, sample.director_id, [genre.id]).id
+
+    def clear_caches():
+        service.detail_cache.clear()
+        service.count_cache.clear()
+        service.leaderboard_cache.clear()
+
+    batch = [{"movie_id": movie_id, "score": 7, "rated_at": datetime.utcnow()} for movie_id in page_ids for _ in range(10)]
+    cursor = encode_cursor({"id": page_ids[-1]})
+    new_movies = [{"title": f"Micro batch {index}", "release_year": 2000, "director_id": sample.director_id,
+                   "genres": [genre.id], "cast": None} for index in range(100)]
+    updates = [{"id": movie_id, "title": None, "release_year": 2001, "director_id": None, "cast": None,
+                "genres": [genre.id]} for movie_id in page_ids]
+
+    # for cases that need a movie of their own (update / delete), made in setup
+    scratch: dict[str, int] = {}
+
+    def make_scratch():
+        scratch["id"] = scratch_movie_id()
+
+    return [
+        # repository reads
+        Case("repo.get_by_id", lambda: repo.get_by_id(db, sample.id), 1),
+        Case("repo.get_genres_by_ids", lambda: repo.get_genres_by_ids(db, [genre.id]), 1),
+        Case("repo.existing_movie_ids", lambda: repo.existing_movie_ids(db, page_ids), 1),
+        Case("repo.fetch_movie_by_id", lambda: repo.fetch_movie_by_id(db, sample.id), 1),
+        Case("repo.fetch_movie_with_aggregation", lambda: repo.fetch_movie_with_aggregation(db, sample.id), 2),
+        Case("repo.fetch_movies_with_aggregation", lambda: repo.fetch_movies_with_aggregation(db, limit=20), 2),
+        Case("repo.fetch_movies_with_aggregation(after_id)",
+             lambda: repo.fetch_movies_with_aggregation(db, limit=20, after_id=page_ids[-1]), 2),
+        Case("repo.fetch_movies_with_aggregation(filters)",
+             lambda: repo.fetch_movies_with_aggregation(db, title=word, genre_name=genre.name), 2),
+        Case("repo.count_movies", lambda: repo.count_movies(db, genre_name=genre.name), 1),
+        Case("repo.estimate_movie_count", lambda: repo.estimate_movie_count(db, genre_name=genre.name), 1),
+        Case("repo.search_movies", lambda: repo.search_movies(db, word), 2),
+        Case("repo.count_search_results", lambda: repo.count_search_results(db, word), 1),
+        Case("repo.genre_names_by_movie", lambda: repo.genre_names_by_movie(db, page_ids), 1),
+        Case("repo.export_query(1000 rows)", lambda: repo.export_query(db).limit(1000).all(), 1),
+        # repository writes
+        Case("repo.create", lambda: repo.create(db, new_movie()), 4),
+        Case("repo.save", lambda: repo.save(db, repo.get_by_id(db, sample.id)), 1),
+        Case("repo.update", lambda: repo.update(db, sample.id, {"cast": "Updated"}), 2),
+        Case("repo.add_rating", lambda: repo.add_rating(db, sample.id, 7), 3),
+        Case("repo.add_ratings(100)", lambda: repo.add_ratings(db, batch), 4),
+        Case("repo.delete", lambda: repo.delete(db, repo.get_by_id(db, scratch["id"])), 7, setup=make_scratch),
+        Case("repo.delete_by_id", lambda: repo.delete_by_id(db, scratch["id"]), 1, setup=make_scratch),
+        # service
+        Case("service.get_movies", lambda: service.get_movies(db, page_size=20), 3, setup=clear_caches),
+        Case("service.get_movies(cursor)", lambda: service.get_movies(db, page_size=20, cursor=cursor), 3,
+             setup=clear_caches),
+        Case("service.get_movies(filters)", lambda: service.get_movies(db, genre=genre.name), 3,
+             setup=clear_caches),
+        Case("service.search_movies", lambda: service.search_movies(db, word), 3, setup=clear_caches),
+        Case("service.get_top_movies", lambda: service.get_top_movies(db, genre=genre.name), 2,
+             setup=clear_caches),
+        Case("service.get_top_movies(week)", lambda: service.get_top_movies(db, window="week"), 2,
+             setup=clear_caches),
+        Case("service.get_movie_detail(cold)", lambda: service.get_movie_detail(db, sample.id), 2,
+             setup=clear_caches),
+        Case("service.get_movie_detail(cached)", lambda: service.get_movie_detail(db, sample.id), 0),
+        # If-None-Match revalidation: versions only, no aggregate query
+        Case("service.get_movie_etag(cold)", lambda: service.get_movie_etag(db, sample.id), 1,
+             setup=clear_caches),
+        Case("service.get_movies_etag", lambda: service.get_movies_etag(db, page_size=20), 2,
+             setup=clear_caches),
+        Case("service.get_movies_etag(cursor)",
+             lambda: service.get_movies_etag(db, page_size=20, cursor=cursor), 2, setup=clear_caches),
+        # write paths: no reads around the writes (reference data is cached), so these
+        # budgets are what the POST / PUT / DELETE / rating endpoints cost
+        Case("service.create_movie", scratch_movie_id, 3),
+        Case("service.update_movie", lambda: service.update_movie(db, scratch["id"], cast="Updated"), 2,
+             setup=make_scratch),
+        Case("service.update_movie(genres)",
+             lambda: service.update_movie(db, scratch["id"], director_id=sample.director_id, genre_ids=[genre.id]),
+             3, setup=make_scratch),
+        Case("service.update_movie + get_movie_detail",
+             lambda: (service.update_movie(db, scratch["id"], release_year=2001),
+                      service.get_movie_detail(db, scratch["id"])), 2, setup=make_scratch),
+        Case("service.delete_movie", lambda: service.delete_movie(db, scratch["id"]), 1, setup=make_scratch),
+        Case("service.create_movies_batch(100)", lambda: service.create_movies_batch(db, new_movies), 3),
+        Case("service.update_movies_batch(10)", lambda: service.update_movies_batch(db, updates), 4),
+        Case("service.add_rating", lambda: service.add_rating(db, sample.id, 7), 3),
+        Case("service.add_ratings_batch(100)", lambda: service.add_ratings_batch(db, batch), 5),
+    ]
+
+
+def measure(db: Session, case: Case, repeat: int) -> dict:
+    samples, stats = [], None
+    for _ in range(repeat + 1):
+        if case.setup:
+            case.setup()
+        # identity-map hits would hide the queries a fresh request makes
+        db.expunge_all()
+        with track_queries(record_sql=True) as stats:
+            started = time.perf_counter()
+            case.call()
+            elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+
+    # the first call warms caches and compiled statements; the last one is accounted
+    return {
+        "median_ms": round(statistics.median(samples[1:]) * 1000, 3),
+        **stats.as_dict(),
+        "budget": case.budget,
+        "over_budget": case.budget is not None and stats.statements > case.budget,
+        "sql": stats.sql,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Repository / service micro-benchmarks")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--filter", default="", help="only cases whose name contains this")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a case exceeds its statement budget")
+    parser.add_argument("--verbose", action="store_true", help="print the SQL of every case")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with engine.connect() as conn:
+        outer = conn.begin()
+        # repository commits become savepoint releases inside the outer transaction
+        db = Session(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        try:
+            for case in build_cases(db):
+                if args.filter not in case.name:
+                    continue
+                results[case.name] = measure(db, case, args.repeat)
+        finally:
+            db.close()
+            outer.rollback()
+
+    print(f"{'case':<46} {'median ms':>10} {'stmts':>6} {'budget':>6} {'rows':>7} {'orm objs':>9}")
+    for name, result in results.items():
+        flag = "  OVER BUDGET" if result["over_budget"] else ""
+        budget = "-" if result["budget"] is None else result["budget"]
+        print(f"{name:<46} {result['median_ms']:>10.3f} {result['statements']:>6} {budget:>6} "
+              f"{result['rows']:>7} {result['orm_objects']:>9}{flag}")
+        if args.verbose or result["over_budget"]:
+            for statement in result["sql"]:
+                print("      " + " ".join(statement.split())[:160])
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    over = [name for name, result in results.items() if result["over_budget"]]
+    if args.check and over:
+        print(f"{len(over)} case(s) over their statement budget: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
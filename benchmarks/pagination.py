@@ -0,0 +1,107 @@
+"""Compare OFFSET and keyset (cursor) pagination on the movie list query.
+
+Usage (from the project root, against a seeded database):
+    python -m benchmarks.pagination --page 5000 --page-size 20
+    python -m benchmarks.pagination --fill 100000   # top the catalog up first
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.services.movie_service import MovieService
+from app.services.pagination import encode_cursor
+
+
+def fill_movies(db, target: int) -> None:
+    """Insert synthetic movies (and their empty rating summaries) up to `target` rows."""
+    current = db.execute(text("SELECT count(*) FROM movies")).scalar_one()
+    missing = target - current
+    if missing <= 0:
+        return
+
+    director_id = db.execute(text("SELECT min(id) FROM directors")).scalar_one()
+    if director_id is None:
+        director_id = db.execute(
+            text("INSERT INTO directors (name) VALUES ('Benchmark Director') RETURNING id")
+        ).scalar_one()
+
+    db.execute(
+        text(
+            """
+            INSERT INTO movies (title, director_id, release_year)
+            SELECT 'Benchmark movie ' || g, :director_id, 1950 + g % 75
+            FROM generate_series(1, :missing) AS g
+            """
+        ),
+        {"director_id": director_id, "missing": missing},
+    )
+    db.execute(
+        text(
+            """
+            INSERT INTO movie_rating_summaries (movie_id)
+            SELECT m.id FROM movies m
+            WHERE NOT EXISTS (SELECT 1 FROM movie_rating_summaries s WHERE s.movie_id = m.id)
+            """
+        )
+    )
+    db.commit()
+    db.execute(text("ANALYZE movies"))
+    db.execute(text("ANALYZE movie_rating_summaries"))
+    print(f"Inserted {missing} synthetic movies")
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="OFFSET vs cursor pagination benchmark")
+    parser.add_argument("--page", type=int, default=1000, help="deep page number to compare")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fill", type=int, default=0, help="top movies up to this many rows")
+    args = parser.parse_args(argv)
+
+    service = MovieService()
+
+    with SessionLocal() as db:
+        if args.fill:
+            fill_movies(db, args.fill)
+
+        total = db.execute(text("SELECT count(*) FROM movies")).scalar_one()
+        skip = (args.page - 1) * args.page_size
+        if skip >= total:
+            raise SystemExit(f"page {args.page} is past the end of the catalog ({total} movies)")
+
+        # the cursor a client would hold after walking to page N - 1
+        last_id = db.execute(
+            text("SELECT id FROM movies ORDER BY id OFFSET :skip LIMIT 1"),
+            {"skip": skip - 1},
+        ).scalar_one() if skip else 0
+        cursor = encode_cursor({"id": last_id})
+
+        def run(**kwargs):
+            service.get_movies(db, page_size=args.page_size, **kwargs)
+            db.rollback()
+
+        results = {
+            "page 1": timed(lambda: run(page=1), args.repeat),
+            f"page {args.page} (offset)": timed(lambda: run(page=args.page), args.repeat),
+            f"page {args.page} (cursor)": timed(lambda: run(cursor=cursor), args.repeat),
+        }
+
+    print(f"movies={total} page_size={args.page_size} repeat={args.repeat} (median ms)")
+    for name, ms in results.items():
+        print(f"  {name:<24} {ms:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
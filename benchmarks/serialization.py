@@ -0,0 +1,142 @@
+"""Per-item cost of turning a page of movie rows into response bytes.
+
+Builds one page of (Movie, director_name, average_rating, ratings_count) rows,
+shaped like MovieRepository.fetch_movies_with_aggregation returns them, and
+times each serialization path of GET /api/v1/movies from rows to body:
+
+    model        dict per row, MovieDetail per dict, Response[MovieListItem[...]],
+                 then what FastAPI does with a returned model: re-validate it
+                 against the response_model, jsonable_encoder, JSONResponse
+    fast-json    dict per row straight into the envelope, stdlib json
+    fast-orjson  the same with orjson (skipped when it is not installed)
+
+The rows are built in memory, so no database is needed.
+
+Usage (from the project root):
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --page-size 100 --repeat 1000 --json serialization.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api import serialization
+from app.api.schemas.movie import MovieDetail, MovieListItem, Response
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.services.movie_service import MovieService
+
+GENRES = ["Action", "Comedy", "Drama", "Horror", "Romance", "Sci-Fi", "Thriller", "Animation"]
+WORDS = ["Dark", "Island", "Machine", "Blood", "Song", "Garden", "Golden", "City", "Night", "River"]
+
+
+def make_rows(page_size: int, seed: int) -> list[tuple]:
+    rng = random.Random(seed)
+    genres = [Genre(id=index, name=name) for index, name in enumerate(GENRES, start=1)]
+    rows = []
+    for movie_id in range(1, page_size + 1):
+        movie = Movie(
+            id=movie_id,
+            title=" ".join(rng.sample(WORDS, 3)),
+            release_year=rng.randint(1950, 2025),
+            cast=", ".join(f"Actor {rng.randint(1, 500)}" for _ in range(3)),
+            genres=rng.sample(genres, rng.randint(1, 3)),
+        )
+        ratings_count = rng.randint(0, 200)
+        average = rng.uniform(1, 10) if ratings_count else 0.0
+        rows.append((movie, f"Director {rng.randint(1, 1000)}", average, ratings_count))
+    return rows
+
+
+def page_envelope(items: list, page_size: int) -> dict:
+    return {
+        "page": 1,
+        "page_size": page_size,
+        "total_items": 100_000,
+        "total_is_estimate": False,
+        "items": items,
+        "next_cursor": "eyJpZCI6MTAwfQ",
+    }
+
+
+async def model_path(rows: list[tuple], page_size: int, field) -> bytes:
+    data = [MovieService._movie_to_dict(*row) for row in rows]
+    content = Response(
+        status="success",
+        data=MovieListItem(**page_envelope([MovieDetail(**item) for item in data], page_size))
+    )
+    # what fastapi.routing does with the endpoint's return value
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+def fast_path(rows: list[tuple], page_size: int) -> bytes:
+    data = [MovieService._movie_to_dict(*row) for row in rows]
+    return serialization.success(page_envelope(data, page_size)).body
+
+
+async def measure(paths: dict, repeat: int) -> dict:
+    results = {}
+    for name, run in paths.items():
+        body = await run()
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await run()
+            samples.append(time.perf_counter() - started)
+        results[name] = {"median_s": statistics.median(samples), "bytes": len(body)}
+    return results
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serialization cost per list item")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.page_size, args.seed)
+    field = create_response_field(name="list_movies_response", type_=Response[MovieListItem[list[MovieDetail]]])
+    orjson = serialization.orjson
+
+    async def run_model():
+        return await model_path(rows, args.page_size, field)
+
+    async def run_fast_json():
+        serialization.orjson = None
+        try:
+            return fast_path(rows, args.page_size)
+        finally:
+            serialization.orjson = orjson
+
+    async def run_fast_orjson():
+        return fast_path(rows, args.page_size)
+
+    paths = {"model": run_model, "fast-json": run_fast_json}
+    if orjson is not None:
+        paths["fast-orjson"] = run_fast_orjson
+    results = asyncio.run(measure(paths, args.repeat))
+
+    baseline = results["model"]["median_s"]
+    print(f"page_size={args.page_size}, median of {args.repeat} runs")
+    print(f"{'path':<12} {'page ms':>9} {'us/item':>9} {'speedup':>8} {'bytes':>8}")
+    for name, result in results.items():
+        per_item = result["median_s"] / args.page_size * 1e6
+        result["us_per_item"] = round(per_item, 3)
+        print(f"{name:<12} {result['median_s'] * 1000:>9.3f} {per_item:>9.2f} "
+              f"{baseline / result['median_s']:>7.1f}x {result['bytes']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump({"page_size": args.page_size, "results": results}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
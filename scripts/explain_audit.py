@@ -0,0 +1,166 @@
+"""EXPLAIN every repository query and fail on sequential scans of large tables.
+
+Each repository method is called against the seeded database inside a
+transaction that is rolled back at the end, so write paths are audited
+too without changing any data. Every SQL statement they issue is captured
+and re-run as EXPLAIN (FORMAT JSON).
+
+Usage (from the project root, against a seeded Postgres database):
+    python -m scripts.explain_audit
+    python -m scripts.explain_audit --min-rows 50000 --verbose
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.db.session import engine
+from app.repositories.director_repository import DirectorRepository
+from app.repositories.movie_repository import MovieRepository
+
+# import models so every relationship can be resolved
+import app.models.director
+import app.models.genre
+import app.models.movie
+import app.models.rating
+import app.models.rating_daily
+import app.models.rating_summary
+
+
+def build_cases(db: Session) -> list[tuple[str, object, bool]]:
+    """(name, call, seq scan allowed) for every repository query worth auditing."""
+    movies = MovieRepository()
+    directors = DirectorRepository()
+
+    movie_id = db.execute(text("SELECT max(id) FROM movies")).scalar_one()
+    sample = db.execute(
+        text(
+            """
+            SELECT m.title, m.release_year, d.id AS director_id, d.name AS director_name
+            FROM movies m JOIN directors d ON d.id = m.director_id
+            WHERE m.id = :id
+            """
+        ),
+        {"id": movie_id},
+    ).one()
+    genre = db.execute(text("SELECT id, name FROM genres ORDER BY id LIMIT 1")).one()
+    title_word = sample.title.split()[0]
+    deep_skip = max(db.execute(text("SELECT count(*) FROM movies")).scalar_one() - 20, 0)
+
+    return [
+        ("list: first page", lambda: movies.fetch_movies_with_aggregation(db), False),
+        ("list: deep offset", lambda: movies.fetch_movies_with_aggregation(db, skip=deep_skip), False),
+        ("list: cursor", lambda: movies.fetch_movies_with_aggregation(db, after_id=movie_id // 2), False),
+        ("list: title", lambda: movies.fetch_movies_with_aggregation(db, title=title_word), False),
+        ("list: director", lambda: movies.fetch_movies_with_aggregation(db, director_name=sample.director_name), False),
+        ("list: genre", lambda: movies.fetch_movies_with_aggregation(db, genre_name=genre.name), False),
+        ("list: release_year", lambda: movies.fetch_movies_with_aggregation(db, release_year=sample.release_year), False),
+        *[
+            (f"list: sort={sort} {'desc' if descending else 'asc'}",
+             lambda sort=sort, descending=descending: movies.fetch_movies_with_aggregation(
+                 db, sort=sort, descending=descending), False)
+            for sort in ("title", "release_year", "average_rating", "ratings_count")
+            for descending in (False, True)
+        ],
+        ("list: sort=average_rating cursor", lambda: movies.fetch_movies_with_aggregation(
+            db, sort="average_rating", descending=True, after_key=5.0, after_id=movie_id // 2), False),
+        ("top: all time", lambda: movies.top_movies(db), False),
+        ("top: genre", lambda: movies.top_movies(db, genre_name=genre.name), False),
+        ("top: week", lambda: movies.top_movies(db, since=date.today() - timedelta(days=6)), False),
+        # counting the whole catalog has to read it; that is what estimate_total is for
+        ("count: unfiltered", lambda: movies.count_movies(db), True),
+        ("count: title", lambda: movies.count_movies(db, title=title_word), False),
+        ("count: director", lambda: movies.count_movies(db, director_name=sample.director_name), False),
+        ("count: genre", lambda: movies.count_movies(db, genre_name=genre.name), False),
+        ("count: release_year", lambda: movies.count_movies(db, release_year=sample.release_year), False),
+        ("search", lambda: movies.search_movies(db, sample.title), False),
+        ("search: count", lambda: movies.count_search_results(db, sample.title), False),
+        # If-None-Match revalidation
+        ("list: versions", lambda: movies.fetch_movies_with_aggregation(db, versions_only=True), False),
+        ("list: versions sort=title cursor", lambda: movies.fetch_movies_with_aggregation(
+            db, sort="title", after_key=sample.title, after_id=movie_id, versions_only=True), False),
+        ("list: versions genre", lambda: movies.fetch_movies_with_aggregation(
+            db, genre_name=genre.name, versions_only=True), False),
+        ("detail", lambda: movies.fetch_movie_with_aggregation(db, movie_id), False),
+        ("detail: version", lambda: movies.movie_version(db, movie_id), False),
+        ("get_by_id", lambda: movies.get_by_id(db, movie_id), False),
+        ("genres by ids", lambda: movies.get_genres_by_ids(db, [genre.id]), False),
+        ("director by id", lambda: directors.get_by_id(db, sample.director_id), False),
+        ("add_rating", lambda: movies.add_rating(db, movie_id, 7), False),
+    ]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fail on sequential scans of large tables")
+    parser.add_argument("--min-rows", type=int, default=10_000,
+                        help="tables with at least this many rows count as large")
+    parser.add_argument("--verbose", action="store_true", help="print every captured statement")
+    args = parser.parse_args(argv)
+
+    if engine.dialect.name != "postgresql":
+        print("The EXPLAIN audit needs a Postgres DATABASE_URL.")
+        return 2
+
+    failures = 0
+    with engine.connect() as conn:
+        outer = conn.begin()
+        # repository commits become savepoint releases inside the outer transaction
+        db = Session(bind=conn, join_transaction_mode="create_savepoint")
+
+        table_rows = dict(conn.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r'"
+        )).all())
+        large = {name for name, rows in table_rows.items() if rows >= args.min_rows}
+
+        captured: list[tuple[str, object]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")):
+                captured.append((statement, parameters[0] if executemany else parameters))
+
+        for name, call, allow_seq_scan in build_cases(db):
+            captured.clear()
+            event.listen(conn, "before_cursor_execute", capture)
+            try:
+                call()
+            finally:
+                event.remove(conn, "before_cursor_execute", capture)
+
+            statements = list(captured)
+            for number, (statement, parameters) in enumerate(statements, start=1):
+                label = f"{name} #{number}" if len(statements) > 1 else name
+                plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+                scanned = sorted(set(seq_scans(plan[0]["Plan"])) & large)
+
+                status = "ok"
+                if scanned:
+                    status = "allowed" if allow_seq_scan else "FAIL"
+                    failures += 0 if allow_seq_scan else 1
+
+                print(f"[{status:>7}] {label}" + (f": seq scan on {', '.join(scanned)}" if scanned else ""))
+                if args.verbose or status == "FAIL":
+                    print("          " + " ".join(statement.split()))
+
+        db.close()
+        outer.rollback()
+
+    if failures:
+        print(f"{failures} statement(s) sequentially scan a table with >= {args.min_rows} rows")
+        return 1
+    print("No unexpected sequential scans.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
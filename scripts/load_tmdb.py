@@ -0,0 +1,262 @@
+"""Load the TMDB 5000 dataset into the database.
+
+The CSVs are read and their JSON columns parsed once in Python. One row
+per movie is streamed into a temporary staging table with COPY, and set-based
+INSERT ... ON CONFLICT statements upsert genres, directors, movies and their
+genre links from there. Movies are keyed on movies.tmdb_id, so a rerun only
+touches rows whose data changed and is otherwise a no-op.
+
+Usage (from the project root, against a migrated Postgres database):
+    python -m scripts.load_tmdb                          # all ~4800 movies
+    python -m scripts.load_tmdb --limit 1000 --fake-ratings 40
+    python -m scripts.load_tmdb --movies data/tmdb_5000_movies.csv --credits data/tmdb_5000_credits.csv
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.bulk import copy_rows, drop_secondary_indexes, pg_array, restore_ddl
+from app.db.session import engine
+from app.repositories.rating_summary_repository import RatingSummaryRepository
+
+# import models so every relationship can be resolved
+import app.models.director
+import app.models.genre
+import app.models.movie
+import app.models.rating
+import app.models.rating_daily
+import app.models.rating_summary
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+LOADED_TABLES = ["movies", "movie_genres", "movie_ratings", "directors", "genres"]
+STAGE_COLUMNS = ["tmdb_id", "title", "release_year", "cast", "description", "director", "genres"]
+
+
+class Timer:
+    def __init__(self, label: str):
+        self.label = label
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.started
+
+    def report(self, rows: int, detail: str = "") -> None:
+        rate = rows / self.elapsed if self.elapsed > 0 else float("inf")
+        print(f"{self.label:<14} {rows:>8} rows  {self.elapsed:7.2f}s  {rate:>10.0f} rows/s{detail}")
+
+
+def read_movies(movies_path: Path, credits_path: Path, limit: int | None) -> list[dict]:
+    """Join both CSVs on the TMDB id; movies without a director are skipped."""
+    csv.field_size_limit(sys.maxsize)
+
+    credits = {}
+    with open(credits_path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            crew = json.loads(row["crew"] or "[]")
+            director = next(
+                (member["name"].strip() for member in crew if member.get("job") == "Director" and member.get("name")),
+                None
+            )
+            if director is None:
+                continue
+            cast = sorted(json.loads(row["cast"] or "[]"), key=lambda member: member.get("order", 999999))
+            credits[int(row["movie_id"])] = (director, ", ".join(m["name"] for m in cast[:3] if m.get("name")) or None)
+
+    movies = []
+    with open(movies_path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            tmdb_id = int(row["id"])
+            if tmdb_id not in credits:
+                continue
+            director, cast = credits[tmdb_id]
+            year = row["release_date"][:4]
+            movies.append({
+                "tmdb_id": tmdb_id,
+                "title": row["title"],
+                "release_year": int(year) if year.isdigit() else 2000,
+                "cast": cast,
+                "description": row["overview"] or None,
+                "director": director,
+                "genres": sorted({genre["name"].strip() for genre in json.loads(row["genres"] or "[]") if genre.get("name")}),
+                # only used to pick the best-known titles when --limit is given
+                "rank": (-int(row["vote_count"] or 0), -float(row["popularity"] or 0), -float(row["vote_average"] or 0), tmdb_id),
+            })
+
+    movies.sort(key=lambda movie: movie["rank"])
+    return movies[:limit] if limit else movies
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load the TMDB 5000 dataset")
+    parser.add_argument("--movies", type=Path, default=SCRIPTS_DIR / "tmdb_5000_movies.csv")
+    parser.add_argument("--credits", type=Path, default=SCRIPTS_DIR / "tmdb_5000_credits.csv")
+    parser.add_argument("--limit", type=int, help="load only the N most-voted movies (default: all)")
+    parser.add_argument("--fake-ratings", type=int, default=0, metavar="MAX",
+                        help="give every newly inserted movie 1..MAX random ratings")
+    parser.add_argument("--drop-indexes", choices=["auto", "always", "never"], default="auto",
+                        help="drop and rebuild secondary indexes around the load "
+                             "(auto: when loading more movies than the table holds)")
+    parser.add_argument("--reset", action="store_true", help="delete all movies, ratings, directors and genres first")
+    args = parser.parse_args(argv)
+
+    if engine.dialect.name != "postgresql":
+        print("The TMDB loader needs a Postgres DATABASE_URL.")
+        return 2
+
+    with Timer("parse") as timer:
+        movies = read_movies(args.movies, args.credits, args.limit)
+    timer.report(len(movies))
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        if args.reset:
+            conn.execute(text(
+                "TRUNCATE movie_rating_daily, movie_rating_summaries, movie_ratings, movie_genres, movies, directors, genres "
+                "RESTART IDENTITY"
+            ))
+
+        existing = conn.execute(text("SELECT count(*) FROM movies")).scalar_one()
+        drop = args.drop_indexes == "always" or (args.drop_indexes == "auto" and len(movies) > existing)
+        index_definitions = drop_secondary_indexes(conn, LOADED_TABLES) if drop else []
+
+        conn.execute(text(
+            """
+            CREATE TEMP TABLE tmdb_stage (
+                tmdb_id integer PRIMARY KEY,
+                title text,
+                release_year integer,
+                "cast" text,
+                description text,
+                director text,
+                genres text[]
+            ) ON COMMIT DROP
+            """
+        ))
+        with Timer("copy") as timer:
+            copy_rows(conn, "tmdb_stage", STAGE_COLUMNS, (
+                [movie[column] if column != "genres" else pg_array(movie["genres"]) for column in STAGE_COLUMNS]
+                for movie in movies
+            ))
+        timer.report(len(movies))
+        conn.execute(text("ANALYZE tmdb_stage"))
+
+        with Timer("genres") as timer:
+            count = conn.execute(text(
+                """
+                INSERT INTO genres (name, description)
+                SELECT DISTINCT name, 'Imported from TMDB genres'
+                FROM tmdb_stage, unnest(genres) AS genre(name)
+                ON CONFLICT (name) DO NOTHING
+                """
+            )).rowcount
+        timer.report(count, " new")
+
+        with Timer("directors") as timer:
+            count = conn.execute(text(
+                """
+                INSERT INTO directors (name, description)
+                SELECT DISTINCT s.director, 'Imported from TMDB credits as Director'
+                FROM tmdb_stage s
+                WHERE NOT EXISTS (SELECT 1 FROM directors d WHERE d.name = s.director)
+                """
+            )).rowcount
+        timer.report(count, " new")
+
+        with Timer("movies") as timer:
+            changed = conn.execute(text(
+                """
+                INSERT INTO movies (tmdb_id, title, director_id, release_year, "cast", description)
+                SELECT s.tmdb_id, s.title, d.id, s.release_year, s."cast", s.description
+                FROM tmdb_stage s
+                JOIN (SELECT DISTINCT ON (name) id, name FROM directors ORDER BY name, id) d
+                  ON d.name = s.director
+                ON CONFLICT (tmdb_id) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    director_id = EXCLUDED.director_id,
+                    release_year = EXCLUDED.release_year,
+                    "cast" = EXCLUDED."cast",
+                    description = EXCLUDED.description,
+                    version = movies.version + 1
+                WHERE (movies.title, movies.director_id, movies.release_year, movies."cast", movies.description)
+                      IS DISTINCT FROM
+                      (EXCLUDED.title, EXCLUDED.director_id, EXCLUDED.release_year, EXCLUDED."cast", EXCLUDED.description)
+                RETURNING id, (xmax = 0) AS inserted
+                """
+            )).all()
+        new_ids = [row.id for row in changed if row.inserted]
+        timer.report(len(changed), f" ({len(new_ids)} new, {len(changed) - len(new_ids)} updated)")
+
+        with Timer("movie_genres") as timer:
+            removed = conn.execute(text(
+                """
+                DELETE FROM movie_genres mg
+                USING movies m, tmdb_stage s, genres g
+                WHERE mg.movie_id = m.id AND m.tmdb_id = s.tmdb_id
+                  AND g.id = mg.genre_id AND NOT g.name = ANY(s.genres)
+                RETURNING mg.movie_id
+                """
+            )).scalars().all()
+            added = conn.execute(text(
+                """
+                INSERT INTO movie_genres (movie_id, genre_id)
+                SELECT m.id, g.id
+                FROM tmdb_stage s
+                JOIN movies m ON m.tmdb_id = s.tmdb_id
+                CROSS JOIN unnest(s.genres) AS genre(name)
+                JOIN genres g ON g.name = genre.name
+                ON CONFLICT DO NOTHING
+                RETURNING movie_id
+                """
+            )).scalars().all()
+            # the genres are part of a movie's ETag; rows upserted above were already bumped
+            relinked = (set(removed) | set(added)) - {row.id for row in changed}
+            if relinked:
+                conn.execute(
+                    text("UPDATE movies SET version = version + 1 WHERE id = ANY(CAST(:ids AS integer[]))"),
+                    {"ids": sorted(relinked)}
+                )
+        timer.report(len(added) + len(removed), f" ({len(added)} added, {len(removed)} removed)")
+
+        if new_ids and args.fake_ratings > 0:
+            with Timer("ratings") as timer:
+                count = conn.execute(text(
+                    """
+                    INSERT INTO movie_ratings (movie_id, score, rated_at)
+                    SELECT m.id, (floor(random() * 10) + 1)::int,
+                           (now() AT TIME ZONE 'utc') - random() * interval '5 years'
+                    FROM unnest(CAST(:ids AS integer[])) AS m(id),
+                         LATERAL generate_series(1, (1 + floor(random() * :max))::int) AS g(i)
+                    """
+                ), {"ids": new_ids, "max": args.fake_ratings}).rowcount
+            timer.report(count, " fake")
+
+        if new_ids:
+            with Timer("summaries") as timer:
+                count = RatingSummaryRepository().rebuild(Session(bind=conn), movie_ids=new_ids)
+            timer.report(count)
+
+        if index_definitions:
+            with Timer("indexes") as timer:
+                restore_ddl(conn, index_definitions)
+            timer.report(len(index_definitions), " rebuilt")
+
+        for table in LOADED_TABLES + ["movie_rating_summaries", "movie_rating_daily"]:
+            conn.execute(text(f"ANALYZE {table}"))
+        conn.commit()
+
+    elapsed = time.perf_counter() - started
+    print(f"Loaded {len(movies)} movies in {elapsed:.2f}s ({len(movies) / elapsed:.0f} movies/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Rebuild or verify movie_rating_summaries from movie_ratings.
+
+Usage (from the project root):
+    python -m scripts.rebuild_rating_summaries            # rebuild every movie
+    python -m scripts.rebuild_rating_summaries --verify   # report drift only
+    python -m scripts.rebuild_rating_summaries --movie-id 1 --movie-id 2
+"""
+import argparse
+import sys
+
+from app.db.session import SessionLocal
+from app.repositories.rating_summary_repository import RatingSummaryRepository
+
+# import models so every relationship can be resolved
+import app.models.director
+import app.models.genre
+import app.models.movie
+import app.models.rating
+import app.models.rating_daily
+import app.models.rating_summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verify", action="store_true", help="only compare, do not rewrite")
+    parser.add_argument("--movie-id", type=int, action="append", dest="movie_ids",
+                        help="limit to these movies (repeatable)")
+    args = parser.parse_args(argv)
+
+    repo = RatingSummaryRepository()
+
+    with SessionLocal() as db:
+        drift = repo.find_drift(db, args.movie_ids)
+
+        if args.verify:
+            if drift:
+                print(f"Rating summaries out of date for {len(drift)} movies: {drift[:20]}")
+                return 1
+            print("Rating summaries match movie_ratings.")
+            return 0
+
+        rows = repo.rebuild(db, args.movie_ids)
+        db.commit()
+        print(f"Rebuilt {rows} rating summaries ({len(drift)} were out of date).")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 import os
+import sys
 
 load_dotenv()
 
@@ -10,27 +11,29 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 
 engine = create_engine(DATABASE_URL)
 
-def verify_seeding():
+def verify_seeding(expected_movies: int | None = None):
     """Checks if the database has the expected number of records after seeding."""
     try:
         with Session(engine) as session:
-            # Check for 1000 movies
+            # Check for the loaded movies (`--limit` of scripts.load_tmdb, or any)
             movie_count = session.execute(
                 text("SELECT COUNT(*) FROM movies")
             ).scalar_one()
 
-            # Check for the number of directors (should be > 1000)
+            # Check that directors were loaded with them
             director_count = session.execute(
                 text("SELECT COUNT(*) FROM directors")
             ).scalar_one()
 
-            if movie_count == 1000 and director_count > 1000:
+            movies_ok = movie_count == expected_movies if expected_movies else movie_count > 0
+            if movies_ok and director_count > 0:
                 print("Seeding Successful!")
                 print(f"   - Movies loaded: {movie_count}")
                 print(f"   - Directors loaded: {director_count}")
                 return True
             else:
-                print(f"Seeding Failed. Expected 1000 movies, found {movie_count}.")
+                expected = expected_movies or "at least one"
+                print(f"Seeding Failed. Expected {expected} movies, found {movie_count}.")
                 return False
 
     except Exception as e:
@@ -38,4 +41,4 @@ def verify_seeding():
         return False
 
 if __name__ == "__main__":
-    verify_seeding()
\ No newline at end of file
+    verify_seeding(int(sys.argv[1]) if len(sys.argv) > 1 else None)
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Fixtures shared by the test suite.
+
+Tests run against a throwaway SQLite database built with create_all, so they
+need neither Postgres nor migrations. DATABASE_URL is set before anything from
+`app` is imported, because app.db.session builds its engines at import.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="movierating-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_DB_DIR) / 'test.db'}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["CACHE_BACKEND"] = "memory"
+
+import asyncio  # noqa: E402
+import fnmatch  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+
+import pytest  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+
+from app.cache.reference import reference_data  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, async_engine, engine  # noqa: E402
+from app.models.director import Director  # noqa: E402
+from app.models.genre import Genre  # noqa: E402
+from app.models.movie import Movie  # noqa: E402
+from app.models.reference_version import ReferenceVersion  # noqa: E402
+from app.repositories.rating_summary_repository import RatingSummaryRepository  # noqa: E402
+from app.services.movie_service import MovieService  # noqa: E402
+
+# import models so every relationship can be resolved
+import app.models.rating  # noqa: E402,F401
+import app.models.rating_daily  # noqa: E402,F401
+import app.models.rating_summary  # noqa: E402,F401
+
+CATALOG_SIZE = 120
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis-py calls RedisCache makes.
+
+    Expiry follows `now`, which tests move forward instead of sleeping.
+    """
+
+    def __init__(self):
+        self.now = time.monotonic()
+        self._values: dict[str, tuple[float, bytes]] = {}
+        # ident of the thread each call ran on
+        self.threads: list[int] = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        entry = self._values.get(key)
+        if entry is None or entry[0] <= self.now:
+            self._values.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key, value, px=None):
+        self.threads.append(threading.get_ident())
+        expires_at = self.now + px / 1000 if px is not None else float("inf")
+        self._values[key] = (expires_at, value.encode() if isinstance(value, str) else value)
+        return True
+
+    def delete(self, *keys):
+        return sum(self._values.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self._values) if self.get(key) is not None and fnmatch.fnmatchcase(key, match)]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    Base.metadata.create_all(engine)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        # reference_versions keeps its rows: the triggers only ever update them
+        for table in reversed(Base.metadata.sorted_tables):
+            if table.name != ReferenceVersion.__tablename__:
+                session.execute(delete(table))
+        session.commit()
+        session.close()
+
+
+@pytest.fixture
+def catalog(db):
+    """CATALOG_SIZE movies over two directors and three genres, with the reference cache warm.
+
+    The periodic version check is switched off so it never lands inside a
+    counted block; tests that change reference data call warm() again.
+    """
+    directors = [Director(name="Christopher Nolan"), Director(name="Denis Villeneuve")]
+    genres = [Genre(name="Action"), Genre(name="Drama"), Genre(name="Sci-Fi")]
+    db.add_all(directors + genres)
+    db.flush()
+    movies = [
+        Movie(
+            title=f"Movie {index:03d}",
+            release_year=1990 + index % 30,
+            director_id=directors[index % 2].id,
+            genres=[genres[index % 3], genres[(index + 1) % 3]],
+        )
+        for index in range(CATALOG_SIZE)
+    ]
+    db.add_all(movies)
+    db.flush()
+    # empty rating summaries, as the app and the seeding scripts leave them
+    RatingSummaryRepository().rebuild(db)
+    db.commit()
+
+    reference_data.warm(db)
+    reference_data.check_interval = float("inf")
+    return {"directors": directors, "genres": genres, "movies": movies}
+
+
+@pytest.fixture
+def service():
+    return MovieService()
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def client(catalog):
+    """HTTP client for the app over the catalog; startup and shutdown run around each test."""
+    from fastapi.testclient import TestClient
+
+    from app.api.controller.movie_controller import movie_service
+    from app.main import app
+
+    # the app's service outlives a test, and SQLite hands the ids of deleted movies out again
+    service = movie_service.service
+    for cache in (service.detail_cache, service.count_cache, service.leaderboard_cache):
+        cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def run_on_loop():
+    """Run an async function on a fresh event loop in a thread; fails when the loop hangs."""
+    def run(coroutine_function, timeout: float = 10):
+        outcome = {}
+
+        def target():
+            async def main():
+                try:
+                    return await coroutine_function()
+                finally:
+                    await async_engine.dispose()
+
+            try:
+                outcome["result"] = asyncio.run(main())
+            except BaseException as error:
+                outcome["error"] = error
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        assert not thread.is_alive(), "the event loop is blocked"
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    return run
@@ -0,0 +1,160 @@
+"""Cache backends, and how movie writes keep the cached detail current."""
+import threading
+
+import pytest
+
+from app.cache import MemoryCache, RedisCache, cache_stats
+from app.cache.reference import reference_data
+from app.db.session import AsyncSessionLocal
+from app.exceptions.movie_exceptions import MovieNotFoundError
+from app.services.async_movie_service import AsyncMovieService
+
+
+@pytest.fixture
+def redis_cache(fake_redis):
+    return RedisCache(client=fake_redis, ttl=60, prefix="test:detail:")
+
+
+def test_redis_cache_round_trips_json(redis_cache):
+    redis_cache.set(1, {"title": "Dune", "genres": ["Sci-Fi"], "average_rating": 8.5})
+
+    assert redis_cache.get(1) == {"title": "Dune", "genres": ["Sci-Fi"], "average_rating": 8.5}
+    assert redis_cache.get(2, "missing") == "missing"
+    assert (redis_cache.hits, redis_cache.misses) == (1, 1)
+
+
+def test_redis_cache_entries_expire(redis_cache, fake_redis):
+    redis_cache.set("short", 1, ttl=5)
+    redis_cache.set("default", 2)
+
+    fake_redis.now += 10
+    assert redis_cache.get("short") is None
+    assert redis_cache.get("default") == 2
+
+    fake_redis.now += 60
+    assert redis_cache.get("default") is None
+
+
+def test_redis_cache_delete_and_clear_stay_in_their_prefix(redis_cache, fake_redis):
+    other = RedisCache(client=fake_redis, prefix="test:other:")
+    other.set(1, "kept")
+    redis_cache.set(1, "a")
+    redis_cache.set(2, "b")
+
+    redis_cache.delete(1)
+    assert redis_cache.get(1) is None
+    assert fake_redis.scan_iter("test:detail:*") == ["test:detail:2"]
+
+    redis_cache.clear()
+    assert fake_redis.scan_iter("test:detail:*") == []
+    assert other.get(1) == "kept"
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache_stats(cache)["size"] == 2
+
+
+def test_memory_cache_entries_expire():
+    cache = MemoryCache(ttl=60)
+    cache.set("gone", 1, ttl=-1)
+
+    assert cache.get("gone") is None
+    assert cache_stats(cache)["misses"] == 1
+
+
+@pytest.fixture
+def cached_service(service, redis_cache):
+    service.detail_cache = redis_cache
+    return service
+
+
+def test_detail_is_read_through(db, catalog, cached_service):
+    movie_id = catalog["movies"][0].id
+
+    first = cached_service.get_movie_detail(db, movie_id)
+    second = cached_service.get_movie_detail(db, movie_id)
+
+    assert first == second
+    assert cache_stats(cached_service.detail_cache) == {
+        "backend": "RedisCache", "size": None, "hits": 1, "misses": 1, "hit_ratio": 0.5
+    }
+
+
+def test_update_writes_the_new_detail_through(db, catalog, cached_service):
+    movie_id = catalog["movies"][0].id
+    before = cached_service.get_movie_detail(db, movie_id)
+
+    cached_service.update_movie(db, movie_id, title="Renamed", genre_ids=[catalog["genres"][2].id])
+
+    cached = cached_service.detail_cache.get(cached_service._detail_key(movie_id))
+    assert (cached["title"], cached["genres"]) == ("Renamed", ["Sci-Fi"])
+    after = cached_service.get_movie_detail(db, movie_id)
+    assert after["version"] == before["version"] + 1
+    assert after["etag"] != before["etag"]
+
+
+def test_delete_drops_the_cached_detail(db, catalog, cached_service):
+    movie_id = catalog["movies"][0].id
+    cached_service.get_movie_detail(db, movie_id)
+
+    cached_service.delete_movie(db, movie_id)
+
+    assert cached_service.detail_cache.get(cached_service._detail_key(movie_id)) is None
+    assert cached_service.get_movie_detail(db, movie_id) is None
+    with pytest.raises(MovieNotFoundError):
+        cached_service.add_rating(db, movie_id, 5)
+
+
+def test_rating_patches_the_cached_detail(db, catalog, cached_service):
+    movie_id = catalog["movies"][0].id
+    cached_service.get_movie_detail(db, movie_id)
+
+    cached_service.add_rating(db, movie_id, 8)
+    cached_service.add_rating(db, movie_id, 5)
+
+    cached = cached_service.detail_cache.get(cached_service._detail_key(movie_id))
+    assert (cached["average_rating"], cached["ratings_count"]) == (6.5, 2)
+    cached_service.detail_cache.clear()
+    fresh = cached_service.get_movie_detail(db, movie_id)
+    assert (fresh["average_rating"], fresh["ratings_count"]) == (6.5, 2)
+
+
+def test_reference_change_refetches_the_detail(db, catalog, cached_service, monkeypatch):
+    movie = catalog["movies"][0]
+    before = cached_service.get_movie_detail(db, movie.id)
+    movie.director.name = "Renamed Director"
+    db.commit()
+    monkeypatch.setattr(reference_data, "check_interval", 0)
+
+    after = cached_service.get_movie_detail(db, movie.id)
+
+    assert after["director"] == "Renamed Director"
+    assert after["etag"] != before["etag"]
+    assert cached_service.get_movie_etag(db, movie.id) == after["etag"]
+
+
+def test_redis_calls_leave_the_event_loop_thread(db, catalog, cached_service, fake_redis, run_on_loop):
+    service = AsyncMovieService(cached_service)
+    movie_id = catalog["movies"][0].id
+
+    async def detail_twice():
+        async with AsyncSessionLocal() as session:
+            await service.get_movie_detail(session, movie_id)
+            return threading.get_ident(), await service.get_movie_detail(session, movie_id)
+
+    loop_thread, detail = run_on_loop(detail_twice)
+
+    assert detail["title"] == "Movie 000"
+    # get (miss), set, get (hit)
+    assert len(fake_redis.threads) == 3 and loop_thread not in fake_redis.threads
+    # outside the async stack the client is called directly
+    cached_service.detail_cache.get(cached_service._detail_key(movie_id))
+    assert fake_redis.threads[-1] == threading.get_ident()
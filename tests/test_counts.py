@@ -0,0 +1,67 @@
+"""total_items: the exact count path, and the planner estimate on Postgres.
+
+The estimate needs Postgres; set TEST_POSTGRES_URL to a migrated database to
+run those tests (they only EXPLAIN, nothing is written).
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.repositories.movie_repository import MovieRepository
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def test_total_counts_every_matching_movie(db, catalog, service):
+    drama_by_nolan = [
+        movie for movie in catalog["movies"]
+        if movie.director.name == "Christopher Nolan" and "Drama" in (genre.name for genre in movie.genres)
+    ]
+
+    result = service.get_movies(db, page_size=5, genre="drama", director="nolan")
+
+    assert (result["total_items"], result["total_is_estimate"]) == (len(drama_by_nolan), False)
+
+
+def test_update_of_a_filtered_field_drops_cached_totals(db, catalog, service):
+    action, _, sci_fi = catalog["genres"]
+    movie = next(movie for movie in catalog["movies"] if sci_fi not in movie.genres)
+    before = service.get_movies(db, page_size=5, genre="sci-fi")["total_items"]
+
+    service.update_movie(db, movie.id, genre_ids=[action.id, sci_fi.id])
+
+    assert service.get_movies(db, page_size=5, genre="sci-fi")["total_items"] == before + 1
+
+
+def test_cast_update_keeps_cached_totals(db, catalog, service):
+    service.get_movies(db, page_size=5, genre="sci-fi")
+
+    service.update_movie(db, catalog["movies"][0].id, cast="Someone")
+
+    assert len(service.count_cache) == 1
+
+
+@pytest.mark.parametrize("title", ["war :peace", "100%", "under_score", "back\\slash", "it's"])
+def test_search_text_is_matched_literally(db, catalog, service, title):
+    result = service.get_movies(db, title=title, estimate_total=True)
+
+    assert (result["total_items"], result["data"]) == (0, [])
+
+
+@pytest.fixture
+def postgres():
+    if not TEST_POSTGRES_URL:
+        pytest.skip("set TEST_POSTGRES_URL to run the planner-estimate tests")
+    engine = create_engine(TEST_POSTGRES_URL)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.mark.parametrize("title", ["war :peace", "100% _x", "back\\slash", "it's"])
+def test_estimate_keeps_search_text_out_of_the_sql(postgres, title):
+    estimate = MovieRepository().estimate_movie_count(postgres, title=title, release_year=2000)
+
+    assert isinstance(estimate, int) and estimate >= 0
@@ -0,0 +1,55 @@
+"""GET /api/v1/movies/export: NDJSON and CSV bodies, streamed in chunks."""
+import csv
+import io
+import json
+
+import app.services.async_movie_service as async_movie_service
+from app.services.export import CSV_COLUMNS
+
+EXPORT_URL = "/api/v1/movies/export"
+
+
+def test_ndjson_has_one_movie_per_line(client, catalog, monkeypatch):
+    # several chunks, the last one partial
+    monkeypatch.setattr(async_movie_service, "EXPORT_BATCH_SIZE", 50)
+
+    response = client.get(EXPORT_URL)
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="movies.ndjson"'
+    movies = [json.loads(line) for line in response.text.splitlines()]
+    assert [movie["id"] for movie in movies] == sorted(movie.id for movie in catalog["movies"])
+    first = catalog["movies"][0]
+    assert movies[0] == {
+        "id": first.id, "title": "Movie 000", "release_year": first.release_year, "cast": None,
+        "director": "Christopher Nolan", "genres": sorted(genre.name for genre in first.genres),
+        "average_rating": 0.0, "ratings_count": 0,
+    }
+
+
+def test_csv_has_a_header_and_quotes_its_cells(client, db, catalog):
+    catalog["movies"][0].title = 'Crouching "Tiger", Hidden Dragon'
+    db.commit()
+
+    response = client.get(EXPORT_URL, params={"format": "csv", "director": "nolan"})
+
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == CSV_COLUMNS
+    assert len(rows) == len(catalog["movies"]) // 2 + 1
+    assert rows[1][1] == 'Crouching "Tiger", Hidden Dragon'
+    assert rows[1][5] == "|".join(sorted(genre.name for genre in catalog["movies"][0].genres))
+
+
+def test_export_applies_the_list_filters(client, catalog):
+    response = client.get(EXPORT_URL, params={"genre": "sci", "release_year": 1995})
+
+    exported = {json.loads(line)["id"] for line in response.text.splitlines()}
+    assert exported == {
+        movie.id for movie in catalog["movies"]
+        if movie.release_year == 1995 and "Sci-Fi" in (genre.name for genre in movie.genres)
+    }
+
+
+def test_unknown_format_is_rejected(client):
+    assert client.get(EXPORT_URL, params={"format": "xml"}).status_code == 422
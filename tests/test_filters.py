@@ -0,0 +1,51 @@
+"""Substring filters of GET /api/v1/movies on title, director and genre."""
+import pytest
+
+from app.models.movie import Movie
+
+
+def matching_ids(service, db, **filters):
+    return [movie["id"] for movie in service.get_movies(db, page_size=200, **filters)["data"]]
+
+
+@pytest.mark.parametrize("title", ["movie 01", "MOVIE 01", "ie 01"])
+def test_title_matches_anywhere_ignoring_case(db, catalog, service, title):
+    expected = [movie.id for movie in catalog["movies"] if "Movie 01" in movie.title]
+
+    assert matching_ids(service, db, title=title) == expected
+
+
+@pytest.mark.parametrize("director", ["nolan", "VILLE", "topher n"])
+def test_director_matches_part_of_the_name(db, catalog, service, director):
+    expected = [
+        movie.id for movie in catalog["movies"] if director.lower() in movie.director.name.lower()
+    ]
+
+    assert matching_ids(service, db, director=director) == expected and expected
+
+
+def test_genre_matches_part_of_the_name(db, catalog, service):
+    expected = [
+        movie.id for movie in catalog["movies"] if any("-" in genre.name for genre in movie.genres)
+    ]
+
+    assert matching_ids(service, db, genre="I-f") == expected
+    assert matching_ids(service, db, genre="western") == []
+
+
+def test_filters_combine(db, catalog, service):
+    expected = [
+        movie.id for movie in catalog["movies"]
+        if movie.release_year == 1995 and movie.director.name == "Denis Villeneuve"
+        and "Action" in (genre.name for genre in movie.genres)
+    ]
+
+    assert matching_ids(service, db, release_year=1995, director="denis", genre="act") == expected
+
+
+def test_wildcards_in_the_filter_are_literal(db, catalog, service):
+    db.add(Movie(title="100% Pure_Cinema", release_year=2000, director_id=catalog["directors"][0].id))
+    db.commit()
+
+    assert len(matching_ids(service, db, title="0% pure_c")) == 1
+    assert matching_ids(service, db, title="1_0") == []
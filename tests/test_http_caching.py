@@ -0,0 +1,62 @@
+"""ETag / If-None-Match revalidation of the movie list and detail."""
+import pytest
+
+from app.api.http_cache import CACHE_CONTROL, etag_matches
+from app.cache.reference import reference_data
+
+LIST_URL = "/api/v1/movies/"
+
+
+@pytest.mark.parametrize("if_none_match, matches", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+    ("abc", False),
+    ("", False),
+])
+def test_etag_matching(if_none_match, matches):
+    assert etag_matches(if_none_match, '"abc"') is matches
+
+
+def test_detail_revalidates_to_304_until_the_movie_changes(client, catalog):
+    url = f"{LIST_URL}{catalog['movies'][0].id}"
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == CACHE_CONTROL
+
+    unchanged = client.get(url, headers={"If-None-Match": etag})
+    assert (unchanged.status_code, unchanged.content, unchanged.headers["etag"]) == (304, b"", etag)
+
+    client.post(f"{url}/ratings", json={"score": 9})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()["data"]["ratings_count"] == 1
+
+
+def test_detail_of_a_missing_movie_is_404_with_if_none_match(client, catalog):
+    assert client.get(f"{LIST_URL}999999", headers={"If-None-Match": "*"}).status_code == 404
+
+
+def test_list_revalidates_to_304_until_a_listed_movie_changes(client, catalog):
+    params = {"page_size": 5, "genre": "drama"}
+    etag = client.get(LIST_URL, params=params).headers["etag"]
+
+    assert client.get(LIST_URL, params=params, headers={"If-None-Match": etag}).status_code == 304
+    # another page of the same filters has its own etag
+    assert client.get(LIST_URL, params={**params, "page": 2}, headers={"If-None-Match": etag}).status_code == 200
+
+    first_id = client.get(LIST_URL, params=params).json()["data"]["items"][0]["id"]
+    client.put(f"{LIST_URL}{first_id}", json={"title": "Renamed"})
+    changed = client.get(LIST_URL, params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+
+
+def test_genre_rename_changes_the_list_etag(client, db, catalog, monkeypatch):
+    etag = client.get(LIST_URL).headers["etag"]
+    catalog["genres"][0].name = "Adventure"
+    db.commit()
+    monkeypatch.setattr(reference_data, "check_interval", 0)
+
+    assert client.get(LIST_URL, headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,34 @@
+"""Server-Timing headers and the per-route Prometheus metrics."""
+import re
+
+from app import metrics
+
+
+def requests_seen(route: str, status: str = "200") -> float:
+    return metrics.requests_total._values.get(("GET", route, status), 0.0)
+
+
+def test_server_timing_reports_db_serialization_and_total(client, catalog):
+    response = client.get(f"/api/v1/movies/{catalog['movies'][0].id}")
+
+    timing = response.headers["server-timing"]
+    assert re.fullmatch(
+        r'db;dur=[\d.]+;desc="(\d+) statements", serialize;dur=[\d.]+, total;dur=[\d.]+', timing
+    )
+    # movie with director and summary, then its genres
+    assert re.match(r'db;dur=[\d.]+;desc="2 statements"', timing)
+
+
+def test_requests_are_counted_by_route_template(client, catalog):
+    route = "/api/v1/movies/{movie_id}"
+    before = requests_seen(route)
+
+    for movie in catalog["movies"][:3]:
+        client.get(f"/api/v1/movies/{movie.id}")
+    client.get("/no/such/path")
+
+    assert requests_seen(route) == before + 3
+    assert requests_seen("<unmatched>", "404") >= 1
+    exposition = client.get("/metrics").text
+    assert f'http_requests_total{{method="GET",route="{route}",status="200"}}' in exposition
+    assert "# TYPE http_request_sql_statements histogram" in exposition
@@ -0,0 +1,80 @@
+"""GET /api/v1/movies/top: Bayesian ranking, rating-count ranking, and rated_at windows."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.rating_summary import PRIOR_MEAN, PRIOR_WEIGHT
+
+
+@pytest.fixture
+def rated(db, catalog, service):
+    """Three rated movies: one 10 today, five 8s today, thirty 9s a hundred days ago."""
+    one_ten, five_eights, thirty_nines = catalog["movies"][:3]
+    now = datetime.utcnow()
+    old = now - timedelta(days=100)
+    service.add_ratings_batch(db, [
+        {"movie_id": one_ten.id, "score": 10, "rated_at": now},
+        *({"movie_id": five_eights.id, "score": 8, "rated_at": now} for _ in range(5)),
+        *({"movie_id": thirty_nines.id, "score": 9, "rated_at": old} for _ in range(30)),
+    ])
+    return one_ten.id, five_eights.id, thirty_nines.id
+
+
+def bayesian(scores: list[int]) -> float:
+    return (sum(scores) + PRIOR_MEAN * PRIOR_WEIGHT) / (len(scores) + PRIOR_WEIGHT)
+
+
+def test_all_time_board_ranks_by_bayesian_average(db, rated, service):
+    one_ten, five_eights, thirty_nines = rated
+
+    top = service.get_top_movies(db, limit=3)
+
+    assert [movie["id"] for movie in top] == [thirty_nines, five_eights, one_ten]
+    assert [movie["rank"] for movie in top] == [1, 2, 3]
+    assert top[0]["score"] == pytest.approx(bayesian([9] * 30))
+    assert top[2]["score"] == pytest.approx(bayesian([10]))
+    assert (top[0]["average_rating"], top[0]["ratings_count"]) == (9.0, 30)
+
+
+def test_board_by_ratings_count(db, rated, service):
+    one_ten, five_eights, thirty_nines = rated
+
+    top = service.get_top_movies(db, by="ratings_count", limit=3)
+
+    assert [(movie["id"], movie["ratings_count"]) for movie in top] == [
+        (thirty_nines, 30), (five_eights, 5), (one_ten, 1)
+    ]
+
+
+def test_window_only_counts_recent_ratings(db, rated, service):
+    one_ten, five_eights, _ = rated
+
+    week = service.get_top_movies(db, window="week")
+
+    assert [movie["id"] for movie in week] == [five_eights, one_ten]
+    assert [movie["id"] for movie in service.get_top_movies(db, window="year", limit=3)][0] == rated[2]
+
+
+def test_board_filters_by_genre(db, rated, service):
+    one_ten, five_eights, _ = rated
+
+    drama = service.get_top_movies(db, genre="drama", limit=2)
+
+    assert [movie["id"] for movie in drama] == [five_eights, one_ten]
+
+
+def test_board_is_cached(db, rated, service):
+    service.get_top_movies(db, window="week")
+    service.add_rating(db, rated[2], 10)
+
+    assert len(service.get_top_movies(db, window="week")) == 2
+
+
+def test_top_endpoint(client, rated):
+    response = client.get("/api/v1/movies/top", params={"window": "week", "limit": 5})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["window"], data["by"]) == ("week", "rating")
+    assert [item["id"] for item in data["items"]] == [rated[1], rated[0]]
+    assert client.get("/api/v1/movies/top", params={"window": "decade"}).status_code == 422
@@ -0,0 +1,52 @@
+"""Queued logging: records are formatted and written on the listener thread."""
+import json
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+
+from app.logging_config import InfoSampler, JsonFormatter, LazyQueueHandler
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines: list[tuple[str, int]] = []
+
+    def emit(self, record):
+        self.lines.append((self.format(record), threading.get_ident()))
+
+
+def test_records_are_formatted_on_the_listener_thread():
+    log_queue = queue.SimpleQueue()
+    handler = RecordingHandler()
+    listener = QueueListener(log_queue, handler)
+    logger = logging.Logger("queued-test")
+    logger.addHandler(LazyQueueHandler(log_queue))
+
+    listener.start()
+    logger.info("listed %d movies", 10)
+    listener.stop()
+
+    [(line, thread)] = handler.lines
+    assert line == "listed 10 movies" and thread != threading.get_ident()
+
+
+def test_json_lines_include_extra_fields():
+    record = logging.makeLogRecord({
+        "name": "movie_rating", "levelno": logging.WARNING, "levelname": "WARNING",
+        "msg": "slow request %s", "args": ("/api/v1/movies/",), "route": "/api/v1/movies/", "ms": 812,
+    })
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "slow request /api/v1/movies/"
+    assert (entry["level"], entry["route"], entry["ms"]) == ("WARNING", "/api/v1/movies/", 812)
+
+
+def test_sampling_never_drops_warnings():
+    sampler = InfoSampler(rate=0.0)
+
+    assert not sampler.filter(logging.makeLogRecord({"levelno": logging.INFO}))
+    assert sampler.filter(logging.makeLogRecord({"levelno": logging.WARNING}))
+    assert InfoSampler(rate=1.0).filter(logging.makeLogRecord({"levelno": logging.INFO}))
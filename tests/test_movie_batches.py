@@ -0,0 +1,62 @@
+"""Batch create and update: per-item errors, and the request schema's checks."""
+from app.models.movie import MAX_RELEASE_YEAR, MIN_RELEASE_YEAR
+
+BATCH_URL = "/api/v1/movies:batch"
+
+
+def test_batch_create_reports_bad_items_and_creates_the_rest(db, catalog, service):
+    director_id = catalog["directors"][0].id
+    genre_id = catalog["genres"][0].id
+    items = [
+        {"title": "Good", "release_year": 2000, "director_id": director_id, "genres": [genre_id], "cast": None},
+        {"title": " ", "release_year": 2000, "director_id": director_id, "genres": [genre_id], "cast": None},
+        {"title": "No director", "release_year": 2000, "director_id": 999, "genres": [genre_id], "cast": None},
+        {"title": "No genre", "release_year": 2000, "director_id": director_id, "genres": [999], "cast": None},
+        {"title": "Too old", "release_year": 1800, "director_id": director_id, "genres": [genre_id], "cast": None},
+    ]
+
+    result = service.create_movies_batch(db, items)
+
+    assert (result["received"], result["succeeded"]) == (5, 1)
+    assert [item["status"] for item in result["results"]] == ["created"] + ["failed"] * 4
+    assert all(item["message"] for item in result["results"][1:])
+    created = service.get_movie_detail(db, result["results"][0]["id"])
+    assert (created["title"], created["genres"]) == ("Good", ["Action"])
+
+
+def test_batch_update_reports_bad_items_and_updates_the_rest(db, catalog, service):
+    first, second = (movie.id for movie in catalog["movies"][:2])
+    items = [
+        {"id": first, "title": "Renamed", "release_year": None, "director_id": None, "genres": None, "cast": None},
+        {"id": 999999, "title": "Missing"},
+        {"id": first, "title": "Twice"},
+        {"id": second, "release_year": 3000},
+        {"id": second, "genres": [999]},
+    ]
+
+    result = service.update_movies_batch(db, items)
+
+    assert (result["received"], result["succeeded"]) == (5, 1)
+    assert [item["status"] for item in result["results"]] == ["updated"] + ["failed"] * 4
+    assert service.get_movie_detail(db, first)["title"] == "Renamed"
+    assert service.get_movie_detail(db, second)["title"] == "Movie 001"
+
+
+def test_batch_create_requires_a_release_year_in_range(client, catalog):
+    item = {"title": "Dune", "director_id": catalog["directors"][0].id, "genres": [catalog["genres"][0].id]}
+
+    for release_year in (None, MIN_RELEASE_YEAR - 1, MAX_RELEASE_YEAR + 1):
+        body = {"items": [{**item, "release_year": release_year} if release_year else item]}
+        assert client.post(BATCH_URL, json=body).status_code == 422
+
+    response = client.post(BATCH_URL, json={"items": [{**item, "release_year": MIN_RELEASE_YEAR}]})
+    assert response.status_code == 200
+    assert response.json()["data"]["succeeded"] == 1
+
+
+def test_batch_update_checks_the_release_year_range(client, catalog):
+    movie_id = catalog["movies"][0].id
+
+    response = client.patch(BATCH_URL, json={"items": [{"id": movie_id, "release_year": MAX_RELEASE_YEAR + 1}]})
+
+    assert response.status_code == 422
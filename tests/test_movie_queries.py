@@ -0,0 +1,64 @@
+"""The read paths issue a fixed number of statements, whatever the page size."""
+import pytest
+
+from app.db.instrumentation import track_queries
+
+
+def count_statements(db, call) -> int:
+    # identity-map hits would hide the queries a fresh request makes
+    db.expunge_all()
+    with track_queries() as stats:
+        call()
+    return stats.statements
+
+
+def test_list_statement_count_does_not_grow_with_page_size(db, catalog, service):
+    counts = {}
+    for page_size in (1, 10, 100):
+        service.count_cache.clear()
+        counts[page_size] = count_statements(db, lambda: service.get_movies(db, page_size=page_size))
+
+    # page, genres of the page in one batch, total
+    assert counts == {1: 3, 10: 3, 100: 3}
+
+
+@pytest.mark.parametrize("page_size", [1, 10, 100])
+def test_list_reads_genres_for_the_whole_page(db, catalog, service, page_size):
+    result = service.get_movies(db, page_size=page_size)
+
+    assert len(result["data"]) == page_size
+    first = catalog["movies"][0]
+    assert result["data"][0]["genres"] == sorted(genre.name for genre in first.genres)
+
+
+def test_filtered_list_statement_count_does_not_grow_with_page_size(db, catalog, service):
+    # about 40 movies match, so every page here leaves more to fetch and needs the total
+    counts = set()
+    for page_size in (1, 10, 30):
+        service.count_cache.clear()
+        counts.add(count_statements(
+            db, lambda: service.get_movies(db, page_size=page_size, genre="drama", director="nolan")
+        ))
+
+    assert counts == {3}
+
+
+def test_next_page_reuses_the_counted_total(db, catalog, service):
+    cursor = service.get_movies(db, page_size=10)["next_cursor"]
+
+    assert count_statements(db, lambda: service.get_movies(db, page_size=100, cursor=cursor)) == 2
+
+
+def test_detail_statement_count(db, catalog, service):
+    movie_id = catalog["movies"][0].id
+
+    # movie with director and rating summary, then its genres
+    assert count_statements(db, lambda: service.get_movie_detail(db, movie_id)) == 2
+    assert count_statements(db, lambda: service.get_movie_detail(db, movie_id)) == 0
+
+
+def test_etag_revalidation_reads_versions_only(db, catalog, service):
+    movie_id = catalog["movies"][0].id
+
+    assert count_statements(db, lambda: service.get_movie_etag(db, movie_id)) == 1
+    assert service.get_movie_etag(db, movie_id) == service.get_movie_detail(db, movie_id)["etag"]
@@ -0,0 +1,63 @@
+"""Keyset pagination of GET /api/v1/movies: cursors, and the offset pages beside them."""
+import pytest
+
+from app.exceptions.movie_exceptions import InvalidCursorError
+from app.services.pagination import encode_cursor
+
+
+def all_pages(service, db, **filters):
+    """Every page from the first to the last, following next_cursor."""
+    pages = [service.get_movies(db, **filters)]
+    while pages[-1]["next_cursor"]:
+        pages.append(service.get_movies(db, cursor=pages[-1]["next_cursor"], **filters))
+    return pages
+
+
+def test_cursor_walks_the_catalog_without_gaps_or_repeats(db, catalog, service):
+    pages = all_pages(service, db, page_size=25)
+
+    ids = [movie["id"] for page in pages for movie in page["data"]]
+    assert ids == sorted(movie.id for movie in catalog["movies"])
+    assert [len(page["data"]) for page in pages] == [25, 25, 25, 25, 20]
+    assert pages[0]["page"] == 1 and all(page["page"] is None for page in pages[1:])
+
+
+def test_cursor_keeps_the_filters(db, catalog, service):
+    pages = all_pages(service, db, page_size=7, genre="drama", director="nolan")
+
+    ids = [movie["id"] for page in pages for movie in page["data"]]
+    assert ids == sorted(
+        movie.id for movie in catalog["movies"]
+        if movie.director.name == "Christopher Nolan" and "Drama" in (genre.name for genre in movie.genres)
+    )
+
+
+def test_rows_deleted_behind_the_cursor_do_not_shift_the_next_page(db, catalog, service):
+    first = service.get_movies(db, page_size=10)
+    offset_second = service.get_movies(db, page=2, page_size=10)
+
+    db.delete(catalog["movies"][0])
+    db.commit()
+
+    second = service.get_movies(db, page_size=10, cursor=first["next_cursor"])
+    assert second["data"] == offset_second["data"]
+
+
+def test_offset_pages_match_the_cursor_pages(db, catalog, service):
+    by_cursor = all_pages(service, db, page_size=30)
+
+    for number, page in enumerate(by_cursor, start=1):
+        assert service.get_movies(db, page=number, page_size=30)["data"] == page["data"]
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor({"id": "1"}), "W10"])
+def test_malformed_cursor_is_rejected(db, catalog, service, cursor):
+    with pytest.raises(InvalidCursorError):
+        service.get_movies(db, cursor=cursor)
+
+
+def test_malformed_cursor_is_a_validation_error(client):
+    response = client.get("/api/v1/movies/", params={"cursor": "garbage"})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["message"] == "cursor is invalid or expired"
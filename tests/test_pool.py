@@ -0,0 +1,63 @@
+"""Pool settings from the environment, and the checkout statistics of the metered pools."""
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import NullPool
+
+from app.db import pool as db_pool
+
+
+def test_postgres_urls_get_a_metered_pool():
+    options = db_pool.engine_options("postgresql+psycopg://app@db/movies")
+    async_options = db_pool.engine_options("postgresql+asyncpg://app@db/movies", is_async=True)
+
+    assert options["poolclass"] is db_pool.MeteredQueuePool
+    assert async_options["poolclass"] is db_pool.MeteredAsyncQueuePool
+    assert (options["pool_size"], options["max_overflow"]) == (db_pool.POOL_SIZE, db_pool.MAX_OVERFLOW)
+    assert db_pool.engine_options("sqlite:///movies.db") == {}
+
+
+def test_zero_pool_size_leaves_pooling_to_pgbouncer(monkeypatch):
+    monkeypatch.setattr(db_pool, "POOL_SIZE", 0)
+    monkeypatch.setattr(db_pool, "PGBOUNCER", True)
+
+    options = db_pool.engine_options("postgresql+psycopg://app@pgbouncer/movies")
+
+    assert options["poolclass"] is NullPool
+    assert options["connect_args"] == {"prepare_threshold": None}
+
+
+@pytest.fixture
+def one_connection_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=db_pool.MeteredQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_checkouts_and_timeouts_are_counted(one_connection_engine):
+    with one_connection_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            one_connection_engine.connect()
+
+    stats = one_connection_engine.pool.stats.snapshot()
+    assert (stats["checkouts"], stats["timeouts"]) == (1, 1)
+    assert stats["wait_max_ms"] >= 50
+
+
+def test_stats_survive_dispose(one_connection_engine):
+    with one_connection_engine.connect():
+        pass
+    stats = one_connection_engine.pool.stats
+
+    one_connection_engine.dispose()
+
+    assert one_connection_engine.pool.stats is stats and stats.checkouts == 1
+
+
+def test_pool_status(one_connection_engine):
+    with one_connection_engine.connect():
+        status = db_pool.pool_status(one_connection_engine)
+
+    assert (status["pool_class"], status["size"], status["checked_out"]) == ("MeteredQueuePool", 1, 1)
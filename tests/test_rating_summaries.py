@@ -0,0 +1,69 @@
+"""Per-movie rating summaries: kept current by every rating write, and rebuildable."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.models.rating_daily import MovieRatingDaily
+from app.models.rating_summary import MovieRatingSummary
+from app.repositories.rating_summary_repository import RatingSummaryRepository
+
+
+def summary_of(db, movie_id: int) -> MovieRatingSummary:
+    db.expire_all()
+    return db.get(MovieRatingSummary, movie_id)
+
+
+def daily_rows(db) -> list[tuple]:
+    return sorted(db.execute(select(
+        MovieRatingDaily.movie_id, MovieRatingDaily.day, MovieRatingDaily.ratings_count, MovieRatingDaily.ratings_sum
+    )).all())
+
+
+def test_single_ratings_update_count_sum_and_histogram(db, catalog, service):
+    movie_id = catalog["movies"][0].id
+
+    for score in (4, 8, 8):
+        service.add_rating(db, movie_id, score)
+
+    summary = summary_of(db, movie_id)
+    assert (summary.ratings_count, summary.ratings_sum, summary.average_rating) == (3, 20, 20 / 3)
+    assert (summary.score_4, summary.score_8, summary.score_10) == (1, 2, 0)
+
+
+def test_new_movies_start_with_an_empty_summary(db, catalog, service):
+    movie = service.create_movie(db, "Fresh", 2020, catalog["directors"][0].id, [catalog["genres"][0].id])
+
+    summary = summary_of(db, movie.id)
+    assert (summary.ratings_count, summary.ratings_sum, summary.average_rating) == (0, 0, 0)
+
+
+def test_writes_leave_nothing_for_a_rebuild_to_fix(db, catalog, service):
+    first, second = (movie.id for movie in catalog["movies"][:2])
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    service.add_rating(db, first, 7)
+    service.add_ratings_batch(db, [
+        {"movie_id": first, "score": 3, "rated_at": yesterday},
+        {"movie_id": second, "score": 10, "rated_at": yesterday},
+        {"movie_id": second, "score": 9, "rated_at": None},
+    ])
+    repo = RatingSummaryRepository()
+    maintained = daily_rows(db)
+
+    assert repo.find_drift(db) == []
+    repo.rebuild(db, [first, second])
+    db.commit()
+    assert repo.find_drift(db) == [] and daily_rows(db) == maintained
+
+
+def test_drift_is_found_and_rebuilt(db, catalog, service):
+    movie_id = catalog["movies"][0].id
+    service.add_rating(db, movie_id, 6)
+    summary = summary_of(db, movie_id)
+    summary.ratings_count = 5
+    db.commit()
+    repo = RatingSummaryRepository()
+
+    assert repo.find_drift(db) == [movie_id]
+    repo.rebuild(db, [movie_id])
+    db.commit()
+    assert repo.find_drift(db) == [] and summary_of(db, movie_id).ratings_count == 1
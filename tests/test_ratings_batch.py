@@ -0,0 +1,47 @@
+"""POST /api/v1/ratings:batch: per-item errors and the totals the batch leaves behind."""
+from datetime import datetime
+
+BATCH_URL = "/api/v1/ratings:batch"
+
+
+def test_batch_reports_bad_items_and_stores_the_rest(db, catalog, service):
+    first, second = (movie.id for movie in catalog["movies"][:2])
+    items = [
+        {"movie_id": first, "score": 8, "rated_at": datetime(2024, 1, 1)},
+        {"movie_id": 999999, "score": 5, "rated_at": None},
+        {"movie_id": first, "score": 11, "rated_at": None},
+        {"movie_id": second, "score": 0, "rated_at": None},
+        {"movie_id": first, "score": 6, "rated_at": None},
+    ]
+
+    result = service.add_ratings_batch(db, items)
+
+    assert (result["received"], result["inserted"]) == (5, 2)
+    assert [(error["index"], error["movie_id"]) for error in result["errors"]] == [
+        (1, 999999), (2, first), (3, second)
+    ]
+    detail = service.get_movie_detail(db, first)
+    assert (detail["average_rating"], detail["ratings_count"]) == (7.0, 2)
+    assert service.get_movie_detail(db, second)["ratings_count"] == 0
+
+
+def test_batch_drops_the_cached_detail_of_rated_movies(db, catalog, service):
+    movie_id = catalog["movies"][0].id
+    service.get_movie_detail(db, movie_id)
+
+    service.add_ratings_batch(db, [{"movie_id": movie_id, "score": 9, "rated_at": None}])
+
+    assert service.detail_cache.get(service._detail_key(movie_id)) is None
+    assert service.get_movie_detail(db, movie_id)["average_rating"] == 9.0
+
+
+def test_batch_endpoint(client, catalog):
+    movie_id = catalog["movies"][0].id
+    body = {"items": [{"movie_id": movie_id, "score": 7}, {"movie_id": movie_id, "score": 12}]}
+
+    response = client.post(BATCH_URL, json=body)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["received"], data["inserted"], len(data["errors"])) == (2, 1, 1)
+    assert client.post(BATCH_URL, json={"items": []}).status_code == 422
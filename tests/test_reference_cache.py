@@ -0,0 +1,55 @@
+"""The genre / director cache: lookups, invalidation, and use from the async stack."""
+import asyncio
+
+from app.cache.reference import reference_data
+from app.db.session import AsyncSessionLocal
+from app.models.genre import Genre
+from app.services.async_movie_service import AsyncMovieService
+
+
+def test_lookups_come_from_the_cache(db, catalog):
+    action, drama, _ = catalog["genres"]
+
+    assert reference_data.genre_ids_matching(db, "AM") == [drama.id]
+    assert [genre.name for genre in reference_data.genres_by_ids(db, [action.id, drama.id])] == ["Action", "Drama"]
+    assert reference_data.genres_by_ids(db, [action.id, 999]) is None
+
+
+def test_a_new_genre_is_seen_after_the_version_check(db, catalog, monkeypatch):
+    db.add(Genre(name="Western"))
+    db.commit()
+    assert reference_data.genre_ids_matching(db, "western") == []
+
+    monkeypatch.setattr(reference_data, "check_interval", 0)
+    assert len(reference_data.genre_ids_matching(db, "western")) == 1
+
+
+def test_concurrent_refreshes_do_not_block_the_event_loop(db, catalog, monkeypatch, run_on_loop):
+    # every request re-reads the versions, so two of them refresh at the same time
+    monkeypatch.setattr(reference_data, "check_interval", 0)
+    service = AsyncMovieService()
+    movie_id = catalog["movies"][0].id
+
+    async def two_requests():
+        async with AsyncSessionLocal() as first, AsyncSessionLocal() as second:
+            return await asyncio.gather(
+                service.get_movie_detail(first, movie_id),
+                service.get_movie_detail(second, movie_id),
+            )
+
+    first, second = run_on_loop(two_requests)
+    assert first["title"] == second["title"] == "Movie 000"
+
+
+def test_export_genre_filter_reads_the_reference_tables_under_run_sync(db, catalog, monkeypatch, run_on_loop):
+    # cold cache: the filter has to load the genres before it can match "drama"
+    monkeypatch.setattr(reference_data, "loaded", False)
+    service = AsyncMovieService()
+
+    async def export():
+        async with AsyncSessionLocal() as session:
+            return "".join([chunk async for chunk in service.export_movies(session, format="csv", genre="drama")])
+
+    lines = run_on_loop(export).splitlines()
+    drama = sum("Drama" in (genre.name for genre in movie.genres) for movie in catalog["movies"])
+    assert lines[0].startswith("id,") and len(lines) == drama + 1
@@ -0,0 +1,85 @@
+"""GET /api/v1/movies/search: what a query matches, paging, and ranking on Postgres.
+
+SQLite falls back to substring matching with a constant rank; set
+TEST_POSTGRES_URL to a migrated, seeded database to run the ranking tests
+(they only read).
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.exceptions.movie_exceptions import InvalidCursorError
+from app.services.movie_service import MovieService
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def described(db, catalog):
+    """Three catalog movies that mention "heist", each in a different column."""
+    in_title, in_cast, in_description = catalog["movies"][:3]
+    in_title.title = "The Heist"
+    in_cast.cast = "Heist Crew"
+    in_description.description = "A bank heist goes wrong."
+    db.commit()
+    return [in_title.id, in_cast.id, in_description.id]
+
+
+def test_search_matches_title_cast_and_description(db, described, service):
+    result = service.search_movies(db, "heist")
+
+    assert sorted(movie["id"] for movie in result["data"]) == described
+    assert result["total_items"] == 3
+    assert all("rank" in movie for movie in result["data"])
+
+
+def test_search_matches_the_director(db, catalog, service):
+    result = service.search_movies(db, "villeneuve", page_size=100)
+
+    assert result["total_items"] == len(result["data"]) == len(catalog["movies"]) // 2
+
+
+def test_search_cursor_pages_without_repeats(db, catalog, service):
+    first = service.search_movies(db, "nolan", page_size=25)
+    ids = [movie["id"] for movie in first["data"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = service.search_movies(db, "nolan", page_size=25, cursor=cursor)
+        ids += [movie["id"] for movie in page["data"]]
+        cursor = page["next_cursor"]
+
+    assert first["total_items"] == len(ids) == len(set(ids)) == len(catalog["movies"]) // 2
+
+
+def test_search_rejects_a_list_cursor(db, catalog, service):
+    with pytest.raises(InvalidCursorError):
+        service.search_movies(db, "nolan", cursor=service.get_movies(db, page_size=1)["next_cursor"])
+
+
+def test_search_endpoint(client, described):
+    response = client.get("/api/v1/movies/search", params={"q": "heist"})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["total_items"] == 3
+
+
+@pytest.fixture
+def postgres():
+    if not TEST_POSTGRES_URL:
+        pytest.skip("set TEST_POSTGRES_URL to run the search ranking tests")
+    engine = create_engine(TEST_POSTGRES_URL)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def test_results_come_best_match_first(postgres):
+    service = MovieService()
+    first = service.search_movies(postgres, "love", page_size=20)
+    second = service.search_movies(postgres, "love", page_size=20, cursor=first["next_cursor"])
+
+    ranks = [movie["rank"] for movie in first["data"] + second["data"]]
+    assert ranks == sorted(ranks, reverse=True) and ranks[0] > 0
+    assert not {movie["id"] for movie in first["data"]} & {movie["id"] for movie in second["data"]}
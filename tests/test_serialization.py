@@ -0,0 +1,39 @@
+"""The fast serialization path returns exactly the bodies the validated model path does."""
+import pytest
+
+from app.api.controller import movie_controller
+
+URLS = [
+    "/api/v1/movies/?page_size=20&sort=average_rating&order=desc",
+    "/api/v1/movies/?page_size=5&genre=drama&director=nolan",
+    "/api/v1/movies/search?q=villeneuve&page_size=5",
+    "/api/v1/movies/top?limit=5",
+    "/api/v1/movies/top?window=week&by=ratings_count",
+]
+
+
+@pytest.fixture
+def rated(db, catalog, service):
+    service.add_ratings_batch(db, [
+        {"movie_id": movie.id, "score": 1 + index % 10, "rated_at": None}
+        for index, movie in enumerate(catalog["movies"][:30])
+    ])
+    return catalog
+
+
+def body(client, monkeypatch, url: str, fast: bool):
+    monkeypatch.setattr(movie_controller, "FAST_SERIALIZATION", fast)
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.json(), response.headers.get("etag")
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_fast_and_model_bodies_match(client, rated, monkeypatch, url):
+    assert body(client, monkeypatch, url, fast=True) == body(client, monkeypatch, url, fast=False)
+
+
+def test_fast_and_model_detail_match(client, rated, monkeypatch):
+    url = f"/api/v1/movies/{rated['movies'][3].id}"
+
+    assert body(client, monkeypatch, url, fast=True) == body(client, monkeypatch, url, fast=False)
@@ -0,0 +1,64 @@
+"""Sorted listings: every sort key in both orders, paged by cursor."""
+import pytest
+
+from app.exceptions.movie_exceptions import InvalidCursorError
+
+SORTS = ["id", "title", "release_year", "average_rating", "ratings_count"]
+
+
+@pytest.fixture
+def rated(db, catalog, service):
+    """Ratings spread so that averages and counts both have ties and differences."""
+    service.add_ratings_batch(db, [
+        {"movie_id": movie.id, "score": 1 + index % 10, "rated_at": None}
+        for index, movie in enumerate(catalog["movies"][:60])
+        for _ in range(index % 4)
+    ])
+    return catalog
+
+
+def walk(service, db, **params):
+    page = service.get_movies(db, page_size=13, **params)
+    movies = list(page["data"])
+    while page["next_cursor"]:
+        page = service.get_movies(db, page_size=13, cursor=page["next_cursor"], **params)
+        movies += page["data"]
+    return movies
+
+
+def sort_value(sort, movie):
+    if sort == "average_rating":
+        return movie["average_rating"] or 0
+    return movie[sort]
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("sort", SORTS)
+def test_cursor_pages_follow_the_sort(db, rated, service, sort, order):
+    everything = service.get_movies(db, page_size=len(rated["movies"]))["data"]
+    expected = sorted(everything, key=lambda movie: (sort_value(sort, movie), movie["id"]), reverse=order == "desc")
+
+    movies = walk(service, db, sort=sort, order=order)
+
+    assert [movie["id"] for movie in movies] == [movie["id"] for movie in expected]
+
+
+def test_sort_combines_with_filters(db, rated, service):
+    movies = walk(service, db, sort="release_year", order="desc", director="ville")
+
+    assert {movie["director"] for movie in movies} == {"Denis Villeneuve"}
+    years = [movie["release_year"] for movie in movies]
+    assert years == sorted(years, reverse=True) and len(movies) == len(rated["movies"]) // 2
+
+
+def test_cursor_only_continues_its_own_sort(db, rated, service):
+    cursor = service.get_movies(db, page_size=5, sort="title")["next_cursor"]
+
+    with pytest.raises(InvalidCursorError):
+        service.get_movies(db, page_size=5, sort="release_year", cursor=cursor)
+    with pytest.raises(InvalidCursorError):
+        service.get_movies(db, page_size=5, sort="title", order="desc", cursor=cursor)
+
+
+def test_unknown_sort_is_rejected(client):
+    assert client.get("/api/v1/movies/", params={"sort": "director"}).status_code == 422
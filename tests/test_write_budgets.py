@@ -0,0 +1,94 @@
+"""Statement budgets of the write paths: no reads around the writes.
+
+Each mutation costs one statement per table it writes, plus the genre read
+when an update leaves the genres alone. Director and genre checks come from
+the reference cache and nothing is re-read after commit. These are the same
+budgets benchmarks/micro.py checks against a seeded Postgres database.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.cache.reference import reference_data
+from app.db.instrumentation import track_queries
+
+
+@pytest.fixture
+def writes(db, catalog, service):
+    """Everything a case needs, with every director already in the reference cache."""
+    director_ids = [director.id for director in catalog["directors"]]
+    reference_data.known_director_ids(db, director_ids)
+    genre_id = catalog["genres"][0].id
+    movie_ids = [movie.id for movie in catalog["movies"]]
+    scratch_id = service.create_movie(db, "Scratch", 2000, director_ids[0], [genre_id]).id
+    return {
+        "service": service,
+        "director_id": director_ids[0],
+        "genre_id": genre_id,
+        "movie_id": movie_ids[0],
+        "movie_ids": movie_ids[:10],
+        "scratch_id": scratch_id,
+    }
+
+
+def count_statements(db, call) -> int:
+    # identity-map hits would hide the queries a fresh request makes
+    db.expunge_all()
+    with track_queries() as stats:
+        call()
+    return stats.statements
+
+
+CASES = {
+    # INSERT movies, INSERT movie_genres, INSERT movie_rating_summaries
+    "create_movie": (3, lambda db, w: w["service"].create_movie(
+        db, "Budget", 2000, w["director_id"], [w["genre_id"]])),
+    # UPDATE movies ... RETURNING, SELECT the unchanged genre ids
+    "update_movie": (2, lambda db, w: w["service"].update_movie(db, w["scratch_id"], cast="Updated")),
+    # UPDATE movies ... RETURNING, DELETE + INSERT movie_genres
+    "update_movie(genres)": (3, lambda db, w: w["service"].update_movie(
+        db, w["scratch_id"], director_id=w["director_id"], genre_ids=[w["genre_id"]])),
+    # the detail after a PUT is the one the update wrote through to the cache
+    "update_movie + get_movie_detail": (2, lambda db, w: (
+        w["service"].update_movie(db, w["scratch_id"], release_year=2001),
+        w["service"].get_movie_detail(db, w["scratch_id"]))),
+    # DELETE movies; ratings, genre links and summary go by ON DELETE CASCADE
+    "delete_movie": (1, lambda db, w: w["service"].delete_movie(db, w["scratch_id"])),
+    # UPDATE movie_rating_summaries ... RETURNING (also the existence check),
+    # INSERT movie_ratings, upsert movie_rating_daily
+    "add_rating": (3, lambda db, w: w["service"].add_rating(db, w["movie_id"], 7)),
+    # one executemany per column set, DELETE + INSERT movie_genres, version bump of genre-only rows
+    "update_movies_batch(10)": (4, lambda db, w: w["service"].update_movies_batch(db, [
+        {"id": movie_id, "title": None, "release_year": 2001, "director_id": None, "cast": None,
+         "genres": [w["genre_id"]]}
+        for movie_id in w["movie_ids"]
+    ])),
+    # SELECT the known movie ids, then one statement per table written
+    "add_ratings_batch(100)": (5, lambda db, w: w["service"].add_ratings_batch(db, [
+        {"movie_id": movie_id, "score": 7, "rated_at": datetime.utcnow()}
+        for movie_id in w["movie_ids"] for _ in range(10)
+    ])),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_write_statement_budget(db, writes, case):
+    budget, call = CASES[case]
+
+    assert count_statements(db, lambda: call(db, writes)) <= budget
+
+
+def test_batch_create_statement_budget(db, writes):
+    items = [
+        {"title": f"Batch {index}", "release_year": 2000, "director_id": writes["director_id"],
+         "genres": [writes["genre_id"]], "cast": None}
+        for index in range(100)
+    ]
+
+    statements = count_statements(db, lambda: writes["service"].create_movies_batch(db, items))
+
+    # Postgres sends the 100 movies as one multi-row INSERT ... RETURNING. SQLite has no
+    # column SQLAlchemy can use to match returned ids back to their rows, so it inserts
+    # them one at a time; genre links and summaries are still one executemany each.
+    movie_inserts = len(items) if db.bind.dialect.name == "sqlite" else 1
+    assert statements <= movie_inserts + 2